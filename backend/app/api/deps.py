@@ -10,6 +10,8 @@ from app.domain.contracts import TTSAdapter
 from app.infrastructure.adapters.factory import build_adapters
 from app.infrastructure.audio_store import AudioStore
 from app.infrastructure.config.settings import Settings, settings
+from app.infrastructure.executors import ExecutorRegistry
+from app.infrastructure.transcoding import AudioTranscoder
 
 
 @lru_cache(maxsize=1)
@@ -23,9 +25,14 @@ def get_http_client() -> httpx.AsyncClient:
     return httpx.AsyncClient(timeout=cfg.request_timeout_seconds)
 
 
+@lru_cache(maxsize=1)
+def get_executors() -> ExecutorRegistry:
+    return ExecutorRegistry(settings=get_settings())
+
+
 @lru_cache(maxsize=1)
 def get_adapters() -> dict[str, TTSAdapter]:
-    return build_adapters(settings=get_settings(), http_client=get_http_client())
+    return build_adapters(settings=get_settings(), http_client=get_http_client(), executors=get_executors())
 
 
 @lru_cache(maxsize=1)
@@ -33,6 +40,11 @@ def get_audio_store() -> AudioStore:
     return AudioStore(settings=get_settings())
 
 
+@lru_cache(maxsize=1)
+def get_transcoder() -> AudioTranscoder:
+    return AudioTranscoder(settings=get_settings(), executors=get_executors())
+
+
 @lru_cache(maxsize=1)
 def get_catalog_service() -> CatalogService:
     return CatalogService(get_adapters())
@@ -40,4 +52,44 @@ def get_catalog_service() -> CatalogService:
 
 @lru_cache(maxsize=1)
 def get_synthesis_service() -> SynthesisService:
-    return SynthesisService(get_adapters(), settings=get_settings(), audio_store=get_audio_store())
+    return SynthesisService(
+        get_adapters(),
+        settings=get_settings(),
+        audio_store=get_audio_store(),
+        transcoder=get_transcoder(),
+        executors=get_executors(),
+    )
+
+
+async def close_dependencies() -> None:
+    # Only what was built is closed (calling an lru_cached getter would build it just to close it), and the
+    # caches are cleared so a later app start gets fresh instances.
+    if get_adapters.cache_info().currsize:
+        closed: set[int] = set()
+        for adapter in get_adapters().values():
+            for component in (adapter, *getattr(adapter, "components", ())):
+                for name in ("runtime", "worker_pool", "credential_manager", "streaming_pool"):
+                    resource = getattr(component, name, None)
+                    if resource is None or id(resource) in closed:
+                        continue
+                    closed.add(id(resource))
+                    if hasattr(resource, "close"):
+                        await resource.close()
+                    elif hasattr(resource, "shutdown"):
+                        resource.shutdown()
+    if get_transcoder.cache_info().currsize:
+        get_transcoder().shutdown()
+    if get_executors.cache_info().currsize:
+        get_executors().shutdown()
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+    for getter in (
+        get_synthesis_service,
+        get_catalog_service,
+        get_transcoder,
+        get_audio_store,
+        get_adapters,
+        get_executors,
+        get_http_client,
+    ):
+        getter.cache_clear()
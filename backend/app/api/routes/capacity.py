@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.api.deps import get_adapters
+from app.schemas.common import CapacityResponse
+
+router = APIRouter(tags=["capacity"])
+
+
+@router.get("/capacity", response_model=CapacityResponse)
+async def capacity() -> CapacityResponse:
+    # Polled by orchestrators to route each request to the worker expected to finish it first.
+    models: dict[str, dict[str, Any]] = {}
+    free_memory: list[int] = []
+    for adapter in get_adapters().values():
+        if not hasattr(adapter, "capacity"):
+            continue
+        models[adapter.model_id] = adapter.capacity()
+        runtime_free = adapter.runtime.free_memory_mb()
+        if runtime_free is not None:
+            free_memory.append(runtime_free)
+    return CapacityResponse(
+        models=models,
+        free_memory_mb=min(free_memory) if free_memory else None,
+        saturated=bool(models) and all(entry["saturated"] for entry in models.values()),
+    )
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.api.deps import get_adapters, get_executors, get_synthesis_service
+from app.schemas.common import MetricsResponse
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def metrics() -> MetricsResponse:
+    runtimes: dict[str, Any] = {}
+    for adapter in get_adapters().values():
+        # Hybrid adapters report their routing and, through their components, both runtimes.
+        for component in (adapter, *getattr(adapter, "components", ())):
+            runtime = (
+                getattr(component, "runtime", None)
+                or getattr(component, "worker_pool", None)
+                or getattr(component, "router", None)
+                or getattr(component, "credential_manager", None)
+            )
+            if runtime is not None and hasattr(runtime, "metrics") and component.provider not in runtimes:
+                runtimes[component.provider] = runtime.metrics()
+    return MetricsResponse(
+        runtimes=runtimes,
+        models=get_synthesis_service().metrics(),
+        executors=get_executors().metrics(),
+    )
@@ -1,35 +1,201 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
 from time import perf_counter
+from typing import AsyncIterator, Awaitable, TypeVar
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.api.deps import get_audio_store, get_synthesis_service
+from app.api.deps import get_adapters, get_audio_store, get_synthesis_service
+from app.domain.entities import AdapterAudio, SynthesisResult
+from app.domain.errors import AdapterError, AdapterTimeoutError, NotConfiguredError
+from app.infrastructure.framing import COMPRESSIONS, FRAME_MEDIA_TYPE, encode_frame, zstd_available
+from app.infrastructure.transcoding import format_from_accept, media_type_for
 from app.schemas.common import SummaryEnvelope
 from app.schemas.tts import BatchSynthesizeRequest, BatchSynthesizeResponse, SynthesizeRequest, SynthesizeResponse
 
 router = APIRouter(prefix="/tts", tags=["tts"])
 
+T = TypeVar("T")
+_DISCONNECT_POLL_SECONDS = 0.5
+
+
+async def _cancel_on_disconnect(http_request: Request, operation: Awaitable[T]) -> T:
+    # Cancelling the synthesis task trips its cancellation token, which stops local generation threads.
+    task = asyncio.ensure_future(operation)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=_DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+                raise HTTPException(status_code=499, detail="Client disconnected")
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _admit(model_ids: list[str]) -> None:
+    # Saturated local queues refuse new work up front (503 + Retry-After via the app's error handler)
+    # so an orchestrator can route it to another worker instead of waiting here.
+    adapters = get_adapters()
+    for model_id in dict.fromkeys(model_ids):
+        admit = getattr(adapters.get(model_id), "admit", None)
+        if admit is not None:
+            admit()
+
 
 @router.post("/synthesize", response_model=SynthesizeResponse)
-async def synthesize(request: SynthesizeRequest) -> SynthesizeResponse:
-    result = await get_synthesis_service().synthesize_one(
-        model_id=request.model_id,
-        text=request.text,
-        config_overrides=request.config_overrides,
-        prefer_streaming=request.prefer_streaming,
+async def synthesize(
+    request: SynthesizeRequest,
+    http_request: Request,
+    accept: str | None = Header(default=None),
+) -> SynthesizeResponse:
+    _admit([request.model_id])
+    result = await _cancel_on_disconnect(
+        http_request,
+        get_synthesis_service().synthesize_one(
+            model_id=request.model_id,
+            text=request.text,
+            config_overrides=request.config_overrides,
+            prefer_streaming=request.prefer_streaming,
+            output_format=request.output_format or format_from_accept(accept),
+            output_sample_rate=request.output_sample_rate,
+            priority=request.priority,
+        ),
     )
     return SynthesizeResponse(result=result)
 
 
+@router.post("/synthesize-stream", response_class=StreamingResponse)
+async def synthesize_stream(
+    request: SynthesizeRequest,
+    http_request: Request,
+    accept: str | None = Header(default=None),
+) -> StreamingResponse:
+    # Chunked audio as the adapter produces it (remote workers are proxied without buffering). Errors before
+    # the first byte map to HTTP statuses; a failure mid-stream can only end the response early.
+    if request.model_id not in get_adapters():
+        raise HTTPException(status_code=404, detail="Unknown model_id")
+    _admit([request.model_id])
+    try:
+        stream = await _cancel_on_disconnect(
+            http_request,
+            get_synthesis_service().synthesize_stream(
+                model_id=request.model_id,
+                text=request.text,
+                config_overrides=request.config_overrides,
+                prefer_streaming=request.prefer_streaming,
+                output_format=request.output_format or format_from_accept(accept),
+                priority=request.priority,
+            ),
+        )
+    except AdapterTimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+    except NotConfiguredError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    except AdapterError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+    return StreamingResponse(
+        stream.chunks,
+        media_type=media_type_for(stream.audio_format),
+        headers={"X-Streaming-Used": str(stream.streaming_used).lower()},
+    )
+
+
+@router.post("/synthesize-raw", response_class=Response)
+async def synthesize_raw(
+    request: SynthesizeRequest,
+    http_request: Request,
+    x_frame_compression: str | None = Header(default=None),
+) -> Response:
+    # Worker endpoint for the orchestrator: one binary frame (result metadata header + raw audio),
+    # nothing written to this worker's audio store.
+    _admit([request.model_id])
+    result, audio = await _cancel_on_disconnect(
+        http_request,
+        get_synthesis_service().synthesize_raw(
+            model_id=request.model_id,
+            text=request.text,
+            config_overrides=request.config_overrides,
+            prefer_streaming=request.prefer_streaming,
+            output_format=request.output_format,
+            output_sample_rate=request.output_sample_rate,
+            priority=request.priority,
+        ),
+    )
+    return Response(content=_result_frame(result, audio, x_frame_compression), media_type=FRAME_MEDIA_TYPE)
+
+
+@router.post("/synthesize-batch-raw", response_class=StreamingResponse)
+async def synthesize_batch_raw(
+    request: BatchSynthesizeRequest,
+    x_frame_compression: str | None = Header(default=None),
+) -> StreamingResponse:
+    # Worker endpoint for forwarded batches: all models are submitted to the scheduler together and each
+    # result is streamed back as its own frame as soon as it finishes.
+    _admit(request.model_ids)
+    service = get_synthesis_service()
+
+    async def frames() -> AsyncIterator[bytes]:
+        tasks = [
+            asyncio.ensure_future(
+                service.synthesize_raw(
+                    model_id=model_id,
+                    text=request.text,
+                    config_overrides=request.per_model_config.get(model_id, {}),
+                    prefer_streaming=request.prefer_streaming,
+                    output_format=request.output_format,
+                    output_sample_rate=request.output_sample_rate,
+                    priority=request.priority,
+                )
+            )
+            for model_id in request.model_ids
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result, audio = await next_done
+                yield _result_frame(result, audio, x_frame_compression)
+        finally:
+            # Streaming stops early when the orchestrator disconnects; abandon what is still running.
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(frames(), media_type=FRAME_MEDIA_TYPE)
+
+
+def _result_frame(result: SynthesisResult, audio: AdapterAudio | None, requested_compression: str | None) -> bytes:
+    compression = requested_compression if requested_compression in COMPRESSIONS else "none"
+    if compression == "zstd" and not zstd_available():
+        compression = "none"
+    header = result.model_dump(exclude={"audio_base64", "audio_url", "audio_url_format"})
+    return encode_frame(header, audio.audio_bytes if audio else b"", compression=compression)
+
+
 @router.post("/synthesize-batch", response_model=BatchSynthesizeResponse)
-async def synthesize_batch(request: BatchSynthesizeRequest) -> BatchSynthesizeResponse:
+async def synthesize_batch(
+    request: BatchSynthesizeRequest,
+    http_request: Request,
+    accept: str | None = Header(default=None),
+) -> BatchSynthesizeResponse:
+    # No up-front admission: a saturated model comes back as its own failed result, not a 503 for the batch.
     started = perf_counter()
-    results = await get_synthesis_service().synthesize_batch(
-        model_ids=request.model_ids,
-        text=request.text,
-        per_model_config=request.per_model_config,
-        prefer_streaming=request.prefer_streaming,
+    results = await _cancel_on_disconnect(
+        http_request,
+        get_synthesis_service().synthesize_batch(
+            model_ids=request.model_ids,
+            text=request.text,
+            per_model_config=request.per_model_config,
+            prefer_streaming=request.prefer_streaming,
+            output_format=request.output_format or format_from_accept(accept),
+            output_sample_rate=request.output_sample_rate,
+            priority=request.priority,
+        ),
     )
     duration_ms = int((perf_counter() - started) * 1000)
     success_count = sum(1 for item in results if item.success)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.domain.entities import SynthesisResult
+
+_RTF_WINDOW = 256
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass
+class _ModelStats:
+    requests: int = 0
+    failures: int = 0
+    latency_ms: int = 0
+    audio_ms: int = 0
+    audio_bytes: int = 0
+    recent_rtf: deque[float] = field(default_factory=lambda: deque(maxlen=_RTF_WINDOW))
+
+
+class SynthesisMetrics:
+    # Per-model totals in the unit capacity is planned with: seconds of audio per second of compute.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: defaultdict[str, _ModelStats] = defaultdict(_ModelStats)
+
+    def record(self, result: SynthesisResult) -> None:
+        with self._lock:
+            stats = self._models[result.model_id]
+            stats.requests += 1
+            if not result.success:
+                stats.failures += 1
+                return
+            stats.latency_ms += result.latency_ms
+            stats.audio_ms += result.audio_duration_ms or 0
+            stats.audio_bytes += result.audio_bytes or 0
+            if result.rtf is not None:
+                stats.recent_rtf.append(result.rtf)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {model_id: self._describe(stats) for model_id, stats in self._models.items()}
+
+    @staticmethod
+    def _describe(stats: _ModelStats) -> dict[str, Any]:
+        recent = list(stats.recent_rtf)
+        return {
+            "requests": stats.requests,
+            "failures": stats.failures,
+            "audio_seconds": round(stats.audio_ms / 1000, 3),
+            "audio_bytes": stats.audio_bytes,
+            "latency_seconds": round(stats.latency_ms / 1000, 3),
+            # Aggregate RTF weights long clips by their length, unlike a mean of per-request RTFs.
+            "rtf": round(stats.latency_ms / stats.audio_ms, 4) if stats.audio_ms else None,
+            "audio_seconds_per_second": round(stats.audio_ms / stats.latency_ms, 3) if stats.latency_ms else None,
+            "rtf_p50": _percentile(recent, 0.5),
+            "rtf_p95": _percentile(recent, 0.95),
+        }
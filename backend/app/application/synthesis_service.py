@@ -2,23 +2,97 @@ from __future__ import annotations
 
 import asyncio
 import base64
+from collections import Counter
 from time import perf_counter
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
+from app.application.synthesis_metrics import SynthesisMetrics
 from app.application.timeout import run_with_timeout
-from app.domain.contracts import TTSAdapter
-from app.domain.entities import SynthesisResult
-from app.domain.errors import AdapterError, DependencyMissingError, NotConfiguredError
+from app.domain.contracts import TTSAdapter, iter_chunks
+from app.domain.entities import AdapterAudio, AdapterAudioStream, SynthesisPriority, SynthesisResult
+from app.domain.errors import (
+    AdapterError,
+    AdapterTimeoutError,
+    AudioTranscodeError,
+    DependencyMissingError,
+    ModelUnavailableError,
+    NotConfiguredError,
+)
+from app.domain.request_context import current_request_context, request_context
+from app.infrastructure.audio_metadata import audio_duration_ms, streamed_duration_ms
 from app.infrastructure.audio_store import AudioStore
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+from app.infrastructure.logging import get_logger
+from app.infrastructure.transcoding import AudioTranscoder
+
+logger = get_logger(__name__)
+
+# Leading bytes of a stream kept for its container header (duration metrics).
+_STREAM_HEAD_BYTES = 64 * 1024
+
+
+class _MeteredChunks:
+    # Wraps a stream's chunks so the synthesis slot is held until the stream ends, however it ends, and the
+    # finished (or failed) stream is reported once with its size and the header bytes needed for its duration.
+    def __init__(self, chunks: AsyncIterator[bytes], on_done: Callable[[bytes, int, BaseException | None], None]):
+        self._chunks = chunks
+        self._on_done: Callable[[bytes, int, BaseException | None], None] | None = on_done
+        self._head = bytearray()
+        self._total = 0
+
+    def __aiter__(self) -> _MeteredChunks:
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._finish(None)
+            raise
+        except BaseException as exc:
+            self._finish(exc)
+            raise
+        if len(self._head) < _STREAM_HEAD_BYTES:
+            self._head += chunk[: _STREAM_HEAD_BYTES - len(self._head)]
+        self._total += len(chunk)
+        return chunk
+
+    async def aclose(self) -> None:
+        self._finish(asyncio.CancelledError())
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def __del__(self) -> None:
+        # A stream dropped before it was ever read still gives its slot back.
+        self._finish(asyncio.CancelledError())
+
+    def _finish(self, error: BaseException | None) -> None:
+        on_done, self._on_done = self._on_done, None
+        if on_done is not None:
+            on_done(bytes(self._head), self._total, error)
 
 
 class SynthesisService:
-    def __init__(self, adapters: dict[str, TTSAdapter], settings: Settings, audio_store: AudioStore):
+    def __init__(
+        self,
+        adapters: dict[str, TTSAdapter],
+        settings: Settings,
+        audio_store: AudioStore,
+        transcoder: AudioTranscoder | None = None,
+        executors: ExecutorRegistry | None = None,
+    ):
         self._adapters = adapters
         self._settings = settings
         self._audio_store = audio_store
+        self._executors = executors or ExecutorRegistry(settings)
+        self._transcoder = transcoder or AudioTranscoder(settings, self._executors)
         self._sem = asyncio.Semaphore(settings.max_concurrent_synth)
+        self._metrics = SynthesisMetrics()
+
+    def metrics(self) -> dict[str, Any]:
+        return self._metrics.snapshot()
 
     async def synthesize_one(
         self,
@@ -26,11 +100,192 @@ class SynthesisService:
         text: str,
         config_overrides: dict[str, Any],
         prefer_streaming: bool,
+        output_format: str | None = None,
+        output_sample_rate: int | None = None,
+        priority: SynthesisPriority = "interactive",
     ) -> SynthesisResult:
+        result, _ = await self._synthesize(
+            model_id,
+            text,
+            config_overrides,
+            prefer_streaming,
+            output_format,
+            output_sample_rate,
+            priority,
+            persist=True,
+        )
+        return result
+
+    async def synthesize_raw(
+        self,
+        model_id: str,
+        text: str,
+        config_overrides: dict[str, Any],
+        prefer_streaming: bool,
+        output_format: str | None = None,
+        output_sample_rate: int | None = None,
+        priority: SynthesisPriority = "interactive",
+    ) -> tuple[SynthesisResult, AdapterAudio | None]:
+        # Worker-side path for the binary transport: the audio goes back as bytes, is not base64-encoded
+        # or stored, and is only transcoded when the caller asks for a format explicitly.
+        return await self._synthesize(
+            model_id,
+            text,
+            config_overrides,
+            prefer_streaming,
+            output_format,
+            output_sample_rate,
+            priority,
+            persist=False,
+        )
+
+    async def synthesize_stream(
+        self,
+        model_id: str,
+        text: str,
+        config_overrides: dict[str, Any],
+        prefer_streaming: bool,
+        output_format: str | None = None,
+        priority: SynthesisPriority = "interactive",
+    ) -> AdapterAudioStream:
+        # Returns once the adapter has the stream open (the timeout covers only that part); chunks are
+        # pulled by the caller, so a slow client slows the upstream read instead of buffering the clip.
+        adapter = self._adapters.get(model_id)
+        if not adapter:
+            raise ModelUnavailableError("Unknown model_id")
+        status = adapter.check_configuration()
+        if not status.configured:
+            raise NotConfiguredError("; ".join(status.warnings) or "Model is not configured")
+
+        timeout_seconds = self._settings.model_timeout_seconds
+        if getattr(adapter, "category", "") == "self_hosted":
+            timeout_seconds = max(timeout_seconds, self._settings.local_model_timeout_seconds)
+
+        # The slot is held for the whole stream, not just while it opens, like any other synthesis.
+        await self._sem.acquire()
+        started = perf_counter()
+        try:
+            stream = await self._open_stream(
+                adapter, text, config_overrides, prefer_streaming, output_format, priority, timeout_seconds
+            )
+        except BaseException as exc:
+            self._sem.release()
+            if isinstance(exc, AdapterError):
+                self._metrics.record(self._failed_result(model_id, int((perf_counter() - started) * 1000), str(exc)))
+            raise
+
+        def on_done(head: bytes, total_bytes: int, error: BaseException | None) -> None:
+            self._sem.release()
+            latency = int((perf_counter() - started) * 1000)
+            if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+                # The client went away; like an abandoned synthesis, it is not counted.
+                return
+            if error is not None:
+                self._metrics.record(self._failed_result(model_id, latency, str(error)))
+                return
+            duration_ms = streamed_duration_ms(head, total_bytes, stream.audio_format)
+            self._metrics.record(
+                SynthesisResult(
+                    model_id=model_id,
+                    success=True,
+                    audio_format=stream.audio_format,
+                    audio_duration_ms=duration_ms,
+                    audio_bytes=total_bytes,
+                    rtf=round(latency / duration_ms, 4) if duration_ms else None,
+                    latency_ms=latency,
+                    streaming_used=stream.streaming_used,
+                )
+            )
+
+        return AdapterAudioStream(
+            audio_format=stream.audio_format,
+            chunks=_MeteredChunks(stream.chunks, on_done),
+            streaming_used=stream.streaming_used,
+        )
+
+    async def _open_stream(
+        self,
+        adapter: TTSAdapter,
+        text: str,
+        config_overrides: dict[str, Any],
+        prefer_streaming: bool,
+        output_format: str | None,
+        priority: SynthesisPriority,
+        timeout_seconds: float,
+    ) -> AdapterAudioStream:
+        with request_context(priority) as context:
+            try:
+                stream = await run_with_timeout(
+                    adapter.synthesize_stream(text=text, config=config_overrides, prefer_streaming=prefer_streaming),
+                    timeout_seconds=timeout_seconds,
+                )
+            except AdapterTimeoutError:
+                context.cancel_token.cancel("timeout")
+                raise
+            except asyncio.CancelledError:
+                context.cancel_token.cancel("disconnected")
+                raise
+
+        if output_format and output_format != stream.audio_format:
+            # Transcoding needs the whole clip, so a format change gives up incremental delivery.
+            audio = AdapterAudio(
+                audio_bytes=b"".join([chunk async for chunk in stream.chunks]),
+                audio_format=stream.audio_format,
+                streaming_used=stream.streaming_used,
+            )
+            delivered = await self._transcoder.transcode(audio, target_format=output_format)
+            return AdapterAudioStream(
+                audio_format=delivered.audio_format,
+                chunks=iter_chunks(delivered.audio_bytes),
+                streaming_used=False,
+            )
+        return stream
+
+    async def _synthesize(
+        self,
+        model_id: str,
+        text: str,
+        config_overrides: dict[str, Any],
+        prefer_streaming: bool,
+        output_format: str | None,
+        output_sample_rate: int | None,
+        priority: SynthesisPriority,
+        persist: bool,
+        audio_source: Callable[[], Awaitable[AdapterAudio]] | None = None,
+    ) -> tuple[SynthesisResult, AdapterAudio | None]:
         adapter = self._adapters.get(model_id)
         if not adapter:
-            return self._failed_result(model_id, 0, "Unknown model_id")
+            return self._failed_result(model_id, 0, "Unknown model_id"), None
+
+        with request_context(priority) as context:
+            result, audio = await self._synthesize_with_adapter(
+                adapter,
+                model_id,
+                text,
+                config_overrides,
+                prefer_streaming,
+                output_format,
+                output_sample_rate,
+                persist,
+                audio_source,
+            )
+        result.queue_position = context.queue_position
+        result.queue_wait_ms = context.queue_wait_ms
+        self._metrics.record(result)
+        return result, audio
 
+    async def _synthesize_with_adapter(
+        self,
+        adapter: TTSAdapter,
+        model_id: str,
+        text: str,
+        config_overrides: dict[str, Any],
+        prefer_streaming: bool,
+        output_format: str | None,
+        output_sample_rate: int | None,
+        persist: bool,
+        audio_source: Callable[[], Awaitable[AdapterAudio]] | None,
+    ) -> tuple[SynthesisResult, AdapterAudio | None]:
         async with self._sem:
             started = perf_counter()
             try:
@@ -42,27 +297,52 @@ class SynthesisService:
                 if getattr(adapter, "category", "") == "self_hosted":
                     timeout_seconds = max(timeout_seconds, self._settings.local_model_timeout_seconds)
 
-                audio = await run_with_timeout(
-                    adapter.synthesize(text=text, config=config_overrides, prefer_streaming=prefer_streaming),
-                    timeout_seconds=timeout_seconds,
-                )
+                cancel_token = current_request_context().cancel_token
+                if audio_source is not None:
+                    operation = audio_source()
+                else:
+                    operation = adapter.synthesize(
+                        text=text, config=config_overrides, prefer_streaming=prefer_streaming
+                    )
+                try:
+                    audio = await run_with_timeout(operation, timeout_seconds=timeout_seconds)
+                except AdapterTimeoutError:
+                    # The awaiting coroutine is gone, but local inference threads keep running until told to stop.
+                    cancel_token.cancel("timeout")
+                    raise
+                except asyncio.CancelledError:
+                    cancel_token.cancel("disconnected")
+                    raise
                 latency = int((perf_counter() - started) * 1000)
-                audio_id = self._audio_store.save(audio.audio_bytes, audio.audio_format)
-                return SynthesisResult(
+                delivered = await self._deliver(audio, output_format, output_sample_rate, persist)
+                audio_base64 = audio_url = audio_url_format = None
+                if persist:
+                    audio_id, audio_url_format = await self._store_audio(delivered)
+                    audio_base64 = base64.b64encode(delivered.audio_bytes).decode("utf-8")
+                    audio_url = self._audio_store.to_url(audio_id)
+                duration_ms = audio_duration_ms(delivered.audio_bytes, delivered.audio_format)
+                result = SynthesisResult(
                     model_id=model_id,
                     success=True,
-                    audio_base64=base64.b64encode(audio.audio_bytes).decode("utf-8"),
-                    audio_url=self._audio_store.to_url(audio_id),
+                    audio_base64=audio_base64,
+                    audio_url=audio_url,
+                    audio_format=delivered.audio_format,
+                    audio_url_format=audio_url_format,
+                    audio_duration_ms=duration_ms,
+                    audio_bytes=len(delivered.audio_bytes),
+                    rtf=round(latency / duration_ms, 4) if duration_ms else None,
                     latency_ms=latency,
                     streaming_used=audio.streaming_used,
                     error=None,
                 )
+                return result, delivered
             except (NotConfiguredError, DependencyMissingError, AdapterError) as exc:
                 latency = int((perf_counter() - started) * 1000)
-                return self._failed_result(model_id=model_id, latency_ms=latency, error=str(exc))
+                return self._failed_result(model_id=model_id, latency_ms=latency, error=str(exc)), None
             except Exception as exc:  # noqa: BLE001
                 latency = int((perf_counter() - started) * 1000)
-                return self._failed_result(model_id=model_id, latency_ms=latency, error=f"Unhandled adapter error: {exc}")
+                error = f"Unhandled adapter error: {exc}"
+                return self._failed_result(model_id=model_id, latency_ms=latency, error=error), None
 
     async def synthesize_batch(
         self,
@@ -70,19 +350,82 @@ class SynthesisService:
         text: str,
         per_model_config: dict[str, dict[str, Any]],
         prefer_streaming: bool,
+        output_format: str | None = None,
+        output_sample_rate: int | None = None,
+        priority: SynthesisPriority = "interactive",
     ) -> list[SynthesisResult]:
+        with request_context(priority):
+            forwarded = self._forward_grouped(model_ids, text, per_model_config, prefer_streaming)
         tasks = [
             asyncio.create_task(
-                self.synthesize_one(
-                    model_id=model_id,
-                    text=text,
-                    config_overrides=per_model_config.get(model_id, {}),
-                    prefer_streaming=prefer_streaming,
+                self._synthesize(
+                    model_id,
+                    text,
+                    per_model_config.get(model_id, {}),
+                    prefer_streaming,
+                    output_format,
+                    output_sample_rate,
+                    priority,
+                    persist=True,
+                    audio_source=forwarded.get(model_id),
                 )
             )
             for model_id in model_ids
         ]
-        return await asyncio.gather(*tasks, return_exceptions=False)
+        outcomes = await asyncio.gather(*tasks, return_exceptions=False)
+        return [result for result, _ in outcomes]
+
+    def _forward_grouped(
+        self,
+        model_ids: list[str],
+        text: str,
+        per_model_config: dict[str, dict[str, Any]],
+        prefer_streaming: bool,
+    ) -> dict[str, Callable[[], Awaitable[AdapterAudio]]]:
+        # Adapters that share a batch_group (remote self-hosted models behind one worker pool) are sent
+        # to the worker as a single batch call; each model's pipeline then awaits its own share.
+        counts = Counter(model_ids)
+        groups: dict[int, list[Any]] = {}
+        for model_id in model_ids:
+            adapter = self._adapters.get(model_id)
+            group = getattr(adapter, "batch_group", None)
+            if group is None or counts[model_id] > 1 or not adapter.check_configuration().configured:
+                continue
+            groups.setdefault(id(group), []).append(adapter)
+
+        forwarded: dict[str, Callable[[], Awaitable[AdapterAudio]]] = {}
+        for adapters in groups.values():
+            if len(adapters) < 2:
+                continue
+            model_configs = {adapter.model_id: per_model_config.get(adapter.model_id, {}) for adapter in adapters}
+            forwarded.update(adapters[0].synthesize_batch(model_configs, text, prefer_streaming))
+        return forwarded
+
+    async def _deliver(
+        self, audio: AdapterAudio, output_format: str | None, output_sample_rate: int | None, persist: bool
+    ) -> AdapterAudio:
+        default_format = (self._settings.audio_output_format or None) if persist else None
+        try:
+            return await self._transcoder.transcode(
+                audio, target_format=output_format or default_format, sample_rate=output_sample_rate
+            )
+        except (DependencyMissingError, AudioTranscodeError) as exc:
+            if output_format or output_sample_rate or not default_format:
+                raise
+            # Only the server default asked for the conversion; the synthesized clip is still worth returning.
+            logger.warning("audio_output_transcode_failed", target_format=default_format, error=str(exc))
+            return audio
+
+    async def _store_audio(self, audio: AdapterAudio) -> tuple[str, str]:
+        stored = audio
+        if store_format := self._settings.audio_store_format:
+            try:
+                stored = await self._transcoder.transcode(audio, target_format=store_format)
+            except (DependencyMissingError, AudioTranscodeError) as exc:
+                # The canonical copy is a storage optimisation; keep the delivered audio instead of failing.
+                logger.warning("audio_store_transcode_failed", target_format=store_format, error=str(exc))
+        audio_id = await self._executors.file_io.run(self._audio_store.save, stored.audio_bytes, stored.audio_format)
+        return audio_id, stored.audio_format
 
     @staticmethod
     def _failed_result(model_id: str, latency_ms: int, error: str) -> SynthesisResult:
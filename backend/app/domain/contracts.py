@@ -1,9 +1,23 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
-from app.domain.entities import AdapterAudio, ConfigField, ConfigStatus, ModelCapabilities, ModelCategory
+from app.domain.entities import (
+    AdapterAudio,
+    AdapterAudioStream,
+    ConfigField,
+    ConfigStatus,
+    ModelCapabilities,
+    ModelCategory,
+)
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+async def iter_chunks(data: bytes, size: int = STREAM_CHUNK_BYTES) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
 
 
 class TTSAdapter(ABC):
@@ -27,3 +41,17 @@ class TTSAdapter(ABC):
         prefer_streaming: bool,
     ) -> AdapterAudio:
         raise NotImplementedError
+
+    async def synthesize_stream(
+        self,
+        text: str,
+        config: dict[str, Any],
+        prefer_streaming: bool,
+    ) -> AdapterAudioStream:
+        # Adapters that cannot produce audio incrementally stream the finished clip.
+        audio = await self.synthesize(text=text, config=config, prefer_streaming=prefer_streaming)
+        return AdapterAudioStream(
+            audio_format=audio.audio_format,
+            chunks=iter_chunks(audio.audio_bytes),
+            streaming_used=audio.streaming_used,
+        )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Literal
 
 from pydantic import BaseModel, Field
 
 
 ModelCategory = Literal["cloud", "self_hosted"]
+AudioFormat = Literal["wav", "mp3", "ogg", "flac"]
+SynthesisPriority = Literal["interactive", "batch", "prefetch"]
 
 
 class ConfigFieldOption(BaseModel):
@@ -41,10 +44,17 @@ class ConfigStatus(BaseModel):
 
 class AdapterAudio(BaseModel):
     audio_bytes: bytes
-    audio_format: Literal["wav", "mp3", "ogg", "flac"] = "wav"
+    audio_format: AudioFormat = "wav"
     streaming_used: bool = False
 
 
+@dataclass
+class AdapterAudioStream:
+    audio_format: AudioFormat
+    chunks: AsyncIterator[bytes]
+    streaming_used: bool = True
+
+
 class ModelCatalogItem(BaseModel):
     model_id: str
     display_name: str
@@ -62,6 +72,16 @@ class SynthesisResult(BaseModel):
     success: bool
     audio_base64: str | None = None
     audio_url: str | None = None
+    audio_format: AudioFormat | None = None
+    # Format of the copy behind audio_url, which AUDIO_STORE_FORMAT may make differ from audio_format.
+    audio_url_format: AudioFormat | None = None
+    audio_duration_ms: int | None = None
+    audio_bytes: int | None = None
+    # Real-time factor: latency / audio duration (< 1 means faster than real time).
+    rtf: float | None = None
+    # Local inference scheduling: position when queued (0 = ran immediately) and time spent waiting.
+    queue_position: int | None = None
+    queue_wait_ms: int | None = None
     latency_ms: int
     streaming_used: bool
     error: str | None = None
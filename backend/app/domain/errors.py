@@ -23,3 +23,27 @@ class DependencyMissingError(AdapterError):
 
 class AdapterTimeoutError(AdapterError):
     """Raised when adapter execution exceeds configured timeout."""
+
+
+class AudioTranscodeError(AdapterError):
+    """Raised when synthesized audio cannot be converted to the requested format."""
+
+
+class GenerationCancelledError(AdapterError):
+    """Raised when in-flight synthesis is abandoned because the caller timed out or went away."""
+
+
+class RemoteWorkerUnavailableError(ModelUnavailableError):
+    """Raised when a remote worker cannot be reached or refuses a request before starting it."""
+
+    def __init__(self, message: str, retry_after_seconds: float | None = None):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CapacityExceededError(ModelUnavailableError):
+    """Raised when a worker's queue for a model is full; callers should retry after the given delay."""
+
+    def __init__(self, message: str, retry_after_seconds: int = 1):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from app.domain.entities import SynthesisPriority
+
+
+class CancellationToken:
+    # Thread-safe flag checked by blocking inference code; `probe` lets another source (e.g. a
+    # shared-memory value set by a parent process) cancel it too.
+    def __init__(self, probe: Callable[[], bool] | None = None):
+        self._event = threading.Event()
+        self._probe = probe
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self._probe is not None and self._probe():
+            self.cancel("cancelled")
+            return True
+        return False
+
+    def cancel(self, reason: str) -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+
+# Per-synthesis state shared between the service and the adapter/runtime that serves it.
+@dataclass
+class RequestContext:
+    priority: SynthesisPriority = "interactive"
+    queue_position: int | None = None
+    estimated_wait_ms: int | None = None
+    queue_wait_ms: int | None = None
+    cancel_token: CancellationToken = field(default_factory=CancellationToken)
+
+
+_current: ContextVar[RequestContext | None] = ContextVar("synthesis_request_context", default=None)
+
+
+def current_request_context() -> RequestContext:
+    # Calls outside a service request (benchmarks, worker processes) get a detached default.
+    return _current.get() or RequestContext()
+
+
+@contextmanager
+def request_context(
+    priority: SynthesisPriority = "interactive",
+    cancel_token: CancellationToken | None = None,
+) -> Iterator[RequestContext]:
+    context = RequestContext(priority=priority, cancel_token=cancel_token or CancellationToken())
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
@@ -7,14 +7,16 @@ import httpx
 from app.domain.contracts import TTSAdapter
 from app.domain.entities import ConfigStatus
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
 
 
 class BaseAdapter(TTSAdapter):
     required_settings_fields: list[str] = []
 
-    def __init__(self, settings: Settings, http_client: httpx.AsyncClient):
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient, executors: ExecutorRegistry | None = None):
         self.settings = settings
         self.http_client = http_client
+        self.executors = executors or ExecutorRegistry(settings)
 
     def check_configuration(self) -> ConfigStatus:
         warnings: list[str] = []
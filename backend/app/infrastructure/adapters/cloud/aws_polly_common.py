@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import html
 from typing import Any
 
@@ -88,7 +87,7 @@ class AWSPollyAdapterBase(BaseAdapter):
         pitch = self._coerce_int(config, "pitch", 0)
         text_payload, text_type = self._build_text_payload(text=text, speaking_rate=speaking_rate, pitch=pitch)
 
-        audio_bytes = await asyncio.to_thread(
+        audio_bytes = await self.executors.cloud_sdk.run(
             self._synthesize_sync,
             text_payload,
             text_type,
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from app.domain.entities import AdapterAudio, ConfigField, ConfigFieldOption, ModelCapabilities
@@ -100,7 +99,7 @@ class AzureAdapterBase(BaseAdapter):
                 raise ModelUnavailableError(str(details))
             return bytes(result.audio_data)
 
-        audio_bytes = await asyncio.to_thread(_sync_synthesize)
+        audio_bytes = await self.executors.cloud_sdk.run(_sync_synthesize)
         if not audio_bytes:
             raise ModelUnavailableError("Azure SDK produced empty audio")
         return AdapterAudio(audio_bytes=audio_bytes, audio_format="mp3", streaming_used=True)
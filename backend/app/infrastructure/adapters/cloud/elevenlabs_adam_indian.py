@@ -61,8 +61,8 @@ class ElevenLabsAdamIndianAdapter(BaseAdapter):
         ),
     ]
 
-    def __init__(self, settings, http_client):
-        super().__init__(settings, http_client)
+    def __init__(self, settings, http_client, executors=None):
+        super().__init__(settings, http_client, executors)
         self._account_blocked_reason: str | None = None
 
     def check_configuration(self) -> ConfigStatus:
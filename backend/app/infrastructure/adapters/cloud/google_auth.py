@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Any
+
+from app.domain.errors import DependencyMissingError, ProviderAuthError
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+# Delay before retrying a failed background refresh while the cached token is still usable.
+_RETRY_SECONDS = 10.0
+
+
+class GoogleCredentialManager:
+    # Shared by the Google adapters: the service-account key is read once and its access token cached.
+    # A background task refreshes the token GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS before it expires, on the
+    # cloud SDK executor, so requests only wait for a token on the very first call (or after a failure).
+    # Concurrent callers that need a refresh share a single one.
+    def __init__(self, settings: Settings, executors: ExecutorRegistry):
+        self._credentials_path = settings.google_application_credentials
+        self._refresh_margin = max(0.0, float(settings.google_token_refresh_margin_seconds))
+        self._executors = executors
+        self._credentials: Any = None
+        self._refresh_task: asyncio.Task | None = None
+        self._background_task: asyncio.Task | None = None
+        self.refreshes = 0
+
+    async def token(self) -> str:
+        if self._credentials is not None and self._credentials.token and self._expires_in() > 0:
+            self._ensure_background_refresh()
+            return self._credentials.token
+        await self.refresh()
+        return self._credentials.token
+
+    async def credentials(self) -> Any:
+        # For SDK clients that attach the token themselves; ours stays fresh through the background refresh.
+        await self.token()
+        return self._credentials
+
+    async def refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+        # Shielded so one caller's cancellation does not abort the refresh the others are waiting on.
+        await asyncio.shield(self._refresh_task)
+
+    def invalidate(self) -> None:
+        # After a 401 the cached token is not trusted again; the next call fetches a new one.
+        if self._credentials is not None:
+            self._credentials.token = None
+
+    async def _refresh(self) -> None:
+        try:
+            from google.auth.transport.requests import Request
+        except ImportError as exc:
+            raise DependencyMissingError("google-auth dependency missing") from exc
+
+        credentials = self._credentials or await self._executors.cloud_sdk.run(self._load)
+        await self._executors.cloud_sdk.run(credentials.refresh, Request())
+        self._credentials = credentials
+        self.refreshes += 1
+        self._ensure_background_refresh()
+
+    def _load(self) -> Any:
+        try:
+            from google.oauth2 import service_account
+        except ImportError as exc:
+            raise DependencyMissingError("google-auth dependency missing") from exc
+
+        if not self._credentials_path:
+            raise ProviderAuthError("GOOGLE_APPLICATION_CREDENTIALS is not set")
+        return service_account.Credentials.from_service_account_file(self._credentials_path, scopes=_SCOPES)
+
+    def _expires_in(self) -> float:
+        expiry = getattr(self._credentials, "expiry", None)
+        if expiry is None:
+            return math.inf
+        # google-auth keeps expiry as a naive UTC datetime.
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds()
+
+    def _ensure_background_refresh(self) -> None:
+        if self._background_task is not None and not self._background_task.done():
+            return
+        if math.isinf(self._expires_in()):
+            return
+        self._background_task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = self._expires_in() - self._refresh_margin
+            if delay <= 0:
+                # Token lifetime shorter than the margin: refresh halfway through it instead.
+                delay = max(1.0, self._expires_in() / 2)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("google_token_refresh_failed", error=str(exc))
+                if self._expires_in() <= 0:
+                    # Nothing usable left to serve; the next request refreshes (and reports) on its own.
+                    return
+                await asyncio.sleep(_RETRY_SECONDS)
+
+    async def close(self) -> None:
+        for task in (self._background_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._background_task = None
+        self._refresh_task = None
+
+    def metrics(self) -> dict[str, Any]:
+        expires_in = self._expires_in() if self._credentials is not None and self._credentials.token else None
+        return {
+            "refreshes": self.refreshes,
+            "token_expires_in_seconds": None if expires_in is None or math.isinf(expires_in) else round(expires_in, 1),
+        }
@@ -3,9 +3,15 @@ from __future__ import annotations
 import base64
 from typing import Any
 
+import httpx
+
 from app.domain.entities import AdapterAudio, ConfigField, ConfigFieldOption, ModelCapabilities
 from app.domain.errors import DependencyMissingError, ModelUnavailableError, ProviderAuthError
 from app.infrastructure.adapters.base import BaseAdapter
+from app.infrastructure.adapters.cloud.google_auth import GoogleCredentialManager
+from app.infrastructure.adapters.cloud.google_streaming import GoogleStreamingClientPool
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
 
 
 def build_google_config_schema(default_language_code: str, default_voice_name: str) -> list[ConfigField]:
@@ -47,6 +53,20 @@ class GoogleCloudAdapterBase(BaseAdapter):
     language_code: str
     voice_name: str
 
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: httpx.AsyncClient,
+        executors: ExecutorRegistry | None = None,
+        credential_manager: GoogleCredentialManager | None = None,
+        streaming_pool: GoogleStreamingClientPool | None = None,
+    ):
+        super().__init__(settings, http_client, executors)
+        self.credential_manager = credential_manager or GoogleCredentialManager(settings, self.executors)
+        self.streaming_pool = streaming_pool or GoogleStreamingClientPool(
+            settings, self.executors, self.credential_manager
+        )
+
     async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
         language_code = str(config.get("language_code") or self.language_code)
         requested_voice_name = str(config.get("voice_name") or self.voice_name)
@@ -85,8 +105,7 @@ class GoogleCloudAdapterBase(BaseAdapter):
         request_1 = tts_beta.StreamingSynthesizeRequest(streaming_config=stream_config)
         request_2 = tts_beta.StreamingSynthesizeRequest(input=tts_beta.StreamingSynthesisInput(text=text))
 
-        def _sync_stream_call() -> bytes:
-            client = tts_beta.TextToSpeechClient()
+        def _sync_stream_call(client) -> bytes:
             responses = client.streaming_synthesize(iter([request_1, request_2]))
             chunks: list[bytes] = []
             for response in responses:
@@ -97,9 +116,7 @@ class GoogleCloudAdapterBase(BaseAdapter):
                     chunks.append(response.audio_chunk.audio_content)
             return b"".join(chunks)
 
-        import asyncio
-
-        chunked = await asyncio.to_thread(_sync_stream_call)
+        chunked = await self.streaming_pool.run(_sync_stream_call)
         if not chunked:
             raise ModelUnavailableError("Google streaming synth produced no audio")
         ext = "mp3" if encoding == "MP3" else "wav"
@@ -112,23 +129,7 @@ class GoogleCloudAdapterBase(BaseAdapter):
         voice_name: str,
         language_code: str,
     ) -> AdapterAudio:
-        try:
-            from google.auth.transport.requests import Request
-            from google.oauth2 import service_account
-        except ImportError as exc:
-            raise DependencyMissingError("google-auth dependency missing") from exc
-
-        credentials_path = self.settings.google_application_credentials
-        if not credentials_path:
-            raise ProviderAuthError("GOOGLE_APPLICATION_CREDENTIALS is not set")
-
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path,
-            scopes=["https://www.googleapis.com/auth/cloud-platform"],
-        )
-        credentials.refresh(Request())
-
-        token = credentials.token
+        token = await self.credential_manager.token()
         response = await self._request_rest_synthesize(
             token=token,
             text=text,
@@ -161,6 +162,8 @@ class GoogleCloudAdapterBase(BaseAdapter):
                     language_code=language_code,
                 )
 
+        if response.status_code == 401:
+            self.credential_manager.invalidate()
         if response.status_code in {401, 403}:
             raise ProviderAuthError("Google TTS authentication failed. Verify service account permissions")
         if response.status_code >= 400:
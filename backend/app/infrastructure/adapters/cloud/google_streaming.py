@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import Any, Callable, TypeVar
+
+from app.domain.errors import DependencyMissingError
+from app.infrastructure.adapters.cloud.google_auth import GoogleCredentialManager
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class GoogleStreamingClientPool:
+    # Long-lived TextToSpeech gRPC clients shared by the Google adapters, so streaming requests reuse an
+    # open channel instead of paying for channel setup, TLS and credential discovery each time. Clients
+    # are created lazily and used round-robin. Keepalive pings hold idle channels open.
+    # GOOGLE_STREAMING_MAX_STREAMS bounds concurrent streams across the pool. A client whose channel fails
+    # is closed and replaced on next use.
+    def __init__(self, settings: Settings, executors: ExecutorRegistry, credential_manager: GoogleCredentialManager):
+        self._executors = executors
+        self._credential_manager = credential_manager
+        self._use_key_file = bool(settings.google_application_credentials)
+        self._keepalive_ms = max(1, settings.google_streaming_keepalive_seconds) * 1000
+        self._clients: list[Any | None] = [None] * max(1, settings.google_streaming_channels)
+        self._streams = asyncio.Semaphore(max(1, settings.google_streaming_max_streams))
+        self._create_lock = asyncio.Lock()
+        self._next = 0
+        self.created = 0
+        self.discarded = 0
+
+    async def run(self, call: Callable[[Any], T]) -> T:
+        # `call` receives the client and runs on the cloud SDK executor (gRPC streaming is blocking).
+        async with self._streams:
+            index, client = await self._acquire()
+            try:
+                return await self._executors.cloud_sdk.run(call, client)
+            except Exception as exc:
+                if _is_channel_failure(exc):
+                    await self._discard(index, client, exc)
+                raise
+
+    async def _acquire(self) -> tuple[int, Any]:
+        index = self._next
+        self._next = (self._next + 1) % len(self._clients)
+        client = self._clients[index]
+        if client is not None:
+            return index, client
+        async with self._create_lock:
+            if self._clients[index] is None:
+                credentials = await self._credential_manager.credentials() if self._use_key_file else None
+                self._clients[index] = await self._executors.cloud_sdk.run(self._create_client, credentials)
+                self.created += 1
+            return index, self._clients[index]
+
+    def _create_client(self, credentials: Any) -> Any:
+        try:
+            from google.cloud import texttospeech_v1beta1 as tts_beta
+        except ImportError as exc:
+            raise DependencyMissingError("google-cloud-texttospeech dependency missing") from exc
+
+        transport_class = tts_beta.TextToSpeechClient.get_transport_class("grpc")
+        channel = transport_class.create_channel(
+            credentials=credentials,
+            options=[
+                ("grpc.keepalive_time_ms", self._keepalive_ms),
+                ("grpc.keepalive_timeout_ms", 10_000),
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.max_pings_without_data", 0),
+            ],
+        )
+        return tts_beta.TextToSpeechClient(transport=transport_class(channel=channel))
+
+    async def _discard(self, index: int, client: Any, error: Exception) -> None:
+        if self._clients[index] is not client:
+            return
+        self._clients[index] = None
+        self.discarded += 1
+        logger.warning("google_streaming_channel_discarded", index=index, error=str(error))
+        with suppress(Exception):
+            await self._executors.cloud_sdk.run(client.transport.close)
+
+    async def close(self) -> None:
+        clients = [client for client in self._clients if client is not None]
+        self._clients = [None] * len(self._clients)
+        for client in clients:
+            with suppress(Exception):
+                await self._executors.cloud_sdk.run(client.transport.close)
+
+
+def _is_channel_failure(exc: Exception) -> bool:
+    # Failures that point at the channel rather than the request.
+    if isinstance(exc, ValueError) and "closed channel" in str(exc).lower():
+        return True
+    try:
+        from google.api_core import exceptions as api_exceptions
+    except ImportError:
+        return False
+    return isinstance(exc, (api_exceptions.ServiceUnavailable, api_exceptions.InternalServerError))
@@ -8,37 +8,52 @@ from app.infrastructure.adapters.cloud.aws_ta_in_ramya import AWSTaINRamyaAdapte
 from app.infrastructure.adapters.cloud.azure_en_neerja import AzureEnINNeerjaAdapter
 from app.infrastructure.adapters.cloud.azure_ta_sweta import AzureTaINSwetaAdapter
 from app.infrastructure.adapters.cloud.elevenlabs_adam_indian import ElevenLabsAdamIndianAdapter
+from app.infrastructure.adapters.cloud.google_auth import GoogleCredentialManager
 from app.infrastructure.adapters.cloud.google_chirp3_hd import GoogleEnINChirp3HDAdapter
+from app.infrastructure.adapters.cloud.google_streaming import GoogleStreamingClientPool
 from app.infrastructure.adapters.cloud.google_ta_neural2_d import GoogleTaINNeural2DAdapter
 from app.infrastructure.adapters.cloud.sarvam_bulbul_v2 import SarvamBulbulV2Adapter
 from app.infrastructure.adapters.cloud.sarvam_bulbul_v3_beta import SarvamBulbulV3BetaAdapter
+from app.infrastructure.adapters.hybrid.common import HybridRouter, HybridSelfHostedAdapter
 from app.infrastructure.adapters.remote.indic_parler import RemoteIndicParlerAdapter
 from app.infrastructure.adapters.remote.veena_all_v1 import RemoteVeenaAllV1Adapter
+from app.infrastructure.adapters.remote.worker_pool import RemoteWorkerPool
 from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
 from app.infrastructure.adapters.self_hosted.indic_parler import IndicParlerAdapter
 from app.infrastructure.adapters.self_hosted.veena_all_v1 import VeenaAllV1Adapter
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
 
 
-def _build_cloud_adapters(settings: Settings, http_client: httpx.AsyncClient) -> list[TTSAdapter]:
+def _build_cloud_adapters(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    executors: ExecutorRegistry,
+) -> list[TTSAdapter]:
+    google_credentials = GoogleCredentialManager(settings, executors)
+    google_streaming = GoogleStreamingClientPool(settings, executors, google_credentials)
     return [
-        SarvamBulbulV3BetaAdapter(settings, http_client),
-        SarvamBulbulV2Adapter(settings, http_client),
-        GoogleEnINChirp3HDAdapter(settings, http_client),
-        GoogleTaINNeural2DAdapter(settings, http_client),
-        AzureTaINSwetaAdapter(settings, http_client),
-        AzureEnINNeerjaAdapter(settings, http_client),
-        AWSEnINSeemaAdapter(settings, http_client),
-        AWSTaINRamyaAdapter(settings, http_client),
-        ElevenLabsAdamIndianAdapter(settings, http_client),
+        SarvamBulbulV3BetaAdapter(settings, http_client, executors),
+        SarvamBulbulV2Adapter(settings, http_client, executors),
+        GoogleEnINChirp3HDAdapter(settings, http_client, executors, google_credentials, google_streaming),
+        GoogleTaINNeural2DAdapter(settings, http_client, executors, google_credentials, google_streaming),
+        AzureTaINSwetaAdapter(settings, http_client, executors),
+        AzureEnINNeerjaAdapter(settings, http_client, executors),
+        AWSEnINSeemaAdapter(settings, http_client, executors),
+        AWSTaINRamyaAdapter(settings, http_client, executors),
+        ElevenLabsAdamIndianAdapter(settings, http_client, executors),
     ]
 
 
-def _build_local_self_hosted_adapters(settings: Settings, http_client: httpx.AsyncClient) -> list[TTSAdapter]:
-    runtime = HFLocalRuntime(settings)
+def _build_local_self_hosted_adapters(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    executors: ExecutorRegistry,
+) -> list[TTSAdapter]:
+    runtime = HFLocalRuntime(settings, executors)
     adapters: list[TTSAdapter] = [
-        IndicParlerAdapter(settings, http_client, runtime),
-        VeenaAllV1Adapter(settings, http_client, runtime),
+        IndicParlerAdapter(settings, http_client, runtime, executors),
+        VeenaAllV1Adapter(settings, http_client, runtime, executors),
     ]
     for adapter in adapters:
         if adapter.model_id == "maya-research/veena-all-v1":
@@ -46,26 +61,55 @@ def _build_local_self_hosted_adapters(settings: Settings, http_client: httpx.Asy
     return adapters
 
 
-def _build_remote_self_hosted_adapters(settings: Settings, http_client: httpx.AsyncClient) -> list[TTSAdapter]:
+def _build_remote_self_hosted_adapters(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    executors: ExecutorRegistry,
+) -> list[TTSAdapter]:
+    worker_pool = RemoteWorkerPool(settings, http_client)
     return [
-        RemoteIndicParlerAdapter(settings, http_client),
-        RemoteVeenaAllV1Adapter(settings, http_client),
+        RemoteIndicParlerAdapter(settings, http_client, executors, worker_pool),
+        RemoteVeenaAllV1Adapter(settings, http_client, executors, worker_pool),
     ]
 
 
-def build_adapters(settings: Settings, http_client: httpx.AsyncClient) -> dict[str, TTSAdapter]:
+def _build_hybrid_self_hosted_adapters(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    executors: ExecutorRegistry,
+) -> list[TTSAdapter]:
+    local = _build_local_self_hosted_adapters(settings=settings, http_client=http_client, executors=executors)
+    remote_adapters = _build_remote_self_hosted_adapters(
+        settings=settings, http_client=http_client, executors=executors
+    )
+    remote = {adapter.model_id: adapter for adapter in remote_adapters}
+    router = HybridRouter(settings, next(iter(remote.values())).worker_pool)
+    return [HybridSelfHostedAdapter(adapter, remote[adapter.model_id], router) for adapter in local]
+
+
+def build_adapters(
+    settings: Settings,
+    http_client: httpx.AsyncClient,
+    executors: ExecutorRegistry | None = None,
+) -> dict[str, TTSAdapter]:
     role = (settings.backend_role or "all_local").strip().lower()
+    executors = executors or ExecutorRegistry(settings)
 
     if role == "self_hosted_worker":
-        adapters = _build_local_self_hosted_adapters(settings=settings, http_client=http_client)
+        adapters = _build_local_self_hosted_adapters(settings=settings, http_client=http_client, executors=executors)
     elif role == "orchestrator":
         adapters = [
-            *_build_cloud_adapters(settings=settings, http_client=http_client),
-            *_build_remote_self_hosted_adapters(settings=settings, http_client=http_client),
+            *_build_cloud_adapters(settings=settings, http_client=http_client, executors=executors),
+            *_build_remote_self_hosted_adapters(settings=settings, http_client=http_client, executors=executors),
+        ]
+    elif role == "hybrid":
+        adapters = [
+            *_build_cloud_adapters(settings=settings, http_client=http_client, executors=executors),
+            *_build_hybrid_self_hosted_adapters(settings=settings, http_client=http_client, executors=executors),
         ]
     else:
         adapters = [
-            *_build_cloud_adapters(settings=settings, http_client=http_client),
-            *_build_local_self_hosted_adapters(settings=settings, http_client=http_client),
+            *_build_cloud_adapters(settings=settings, http_client=http_client, executors=executors),
+            *_build_local_self_hosted_adapters(settings=settings, http_client=http_client, executors=executors),
         ]
     return {adapter.model_id: adapter for adapter in adapters}
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from time import monotonic
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, AdapterAudioStream, ConfigStatus
+from app.domain.errors import CapacityExceededError, RemoteWorkerUnavailableError
+from app.infrastructure.adapters.remote.common import RemoteSelfHostedAdapterBase
+from app.infrastructure.adapters.remote.worker_pool import RemoteWorkerPool, estimate_completion_ms
+from app.infrastructure.adapters.self_hosted.common import SelfHostedAdapterBase
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+LOCAL = "local"
+REMOTE = "remote"
+
+
+class HybridRouter:
+    # Keeps a request on the local runtime while fewer than HYBRID_LOCAL_QUEUE_THRESHOLD are queued for its
+    # model there; past that it goes to whichever side is expected to finish it first, using the same
+    # estimate the worker pool ranks workers with (queue drain + service time + cold-load penalty).
+    def __init__(self, settings: Settings, worker_pool: RemoteWorkerPool):
+        self.worker_pool = worker_pool
+        self._threshold = max(0, settings.hybrid_local_queue_threshold)
+        self._cold_load_ms = settings.remote_worker_cold_load_seconds * 1000
+        self._routes: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def choose(self, model_id: str, local_capacity: dict[str, Any]) -> tuple[str, str]:
+        if not len(self.worker_pool):
+            return LOCAL, "no_remote"
+        if local_capacity.get("saturated"):
+            return REMOTE, "local_saturated"
+        if local_capacity.get("queued", 0) < self._threshold:
+            return LOCAL, "below_threshold"
+        now = monotonic()
+        worker = self.worker_pool.pick(model_ids=[model_id])
+        if worker is None or not worker.available(now):
+            return LOCAL, "no_remote"
+        remote_ms = self.worker_pool.expected_completion_ms(worker, [model_id], now)
+        local_ms = estimate_completion_ms(local_capacity, 0, self._cold_load_ms)
+        if remote_ms < local_ms:
+            return REMOTE, "shorter_remote_wait"
+        return LOCAL, "shorter_local_wait"
+
+    def record(self, model_id: str, route: str) -> None:
+        self._routes[model_id][route] += 1
+
+    def metrics(self) -> dict[str, Any]:
+        return {"routes": {model_id: dict(routes) for model_id, routes in self._routes.items()}}
+
+
+class HybridSelfHostedAdapter(TTSAdapter):
+    # One self-hosted model served by both the local runtime and the remote worker pool. A request that
+    # one side refuses before starting it (local queue full, no worker reachable) runs on the other.
+    provider = "hybrid"
+    category = "self_hosted"
+
+    def __init__(self, local: SelfHostedAdapterBase, remote: RemoteSelfHostedAdapterBase, router: HybridRouter):
+        self.local = local
+        self.remote = remote
+        self.router = router
+        self.model_id = local.model_id
+        self.display_name = local.display_name
+        self.capabilities = local.capabilities
+        self.config_schema = local.config_schema
+        self.runtime_alias = local.runtime_alias
+        self.components = (local, remote)
+
+    def check_configuration(self) -> ConfigStatus:
+        status = self.local.check_configuration()
+        remote_status = self.remote.check_configuration()
+        warnings = [*status.warnings, *(f"Remote overflow disabled: {warning}" for warning in remote_status.warnings)]
+        return ConfigStatus(configured=status.configured, warnings=warnings)
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        return await self._run(lambda adapter: adapter.synthesize(text, config, prefer_streaming))
+
+    async def synthesize_stream(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudioStream:
+        return await self._run(lambda adapter: adapter.synthesize_stream(text, config, prefer_streaming))
+
+    async def _run(self, call: Callable[[TTSAdapter], Awaitable[T]]) -> T:
+        route, reason = self.router.choose(self.model_id, self.local.capacity())
+        self.router.record(self.model_id, f"{route}:{reason}")
+        primary, fallback = (self.local, self.remote) if route == LOCAL else (self.remote, self.local)
+        try:
+            return await call(primary)
+        except (CapacityExceededError, RemoteWorkerUnavailableError) as exc:
+            if fallback is self.remote and not len(self.router.worker_pool):
+                raise
+            fallback_route = LOCAL if fallback is self.local else REMOTE
+            logger.info(
+                "hybrid_fallback", model_id=self.model_id, route=route, fallback=fallback_route, error=str(exc)
+            )
+            self.router.record(self.model_id, f"{fallback_route}:fallback")
+            return await call(fallback)
@@ -1,66 +1,374 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-from typing import Any
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
 
-from app.domain.entities import AdapterAudio
-from app.domain.errors import ModelUnavailableError
+import httpx
+
+from app.domain.entities import AdapterAudio, AdapterAudioStream, ConfigStatus
+from app.domain.errors import AdapterError, ModelUnavailableError, RemoteWorkerUnavailableError
+from app.domain.request_context import current_request_context
 from app.infrastructure.adapters.base import BaseAdapter
+from app.infrastructure.adapters.remote.worker_pool import RemoteWorker, RemoteWorkerPool
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+from app.infrastructure.framing import FRAME_MEDIA_TYPE, FrameError, read_frames, zstd_available
+from app.infrastructure.logging import get_logger
+from app.infrastructure.transcoding import format_from_accept
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+RemoteResult = tuple[dict[str, Any], bytes]
+# Chunks read ahead from the worker while the client is slower; beyond this the worker read pauses.
+_STREAM_BUFFER_CHUNKS = 4
 
 
 class RemoteSelfHostedAdapterBase(BaseAdapter):
     provider = "lightning-ai"
     category = "self_hosted"
-    required_settings_fields = ["remote_self_hosted_url"]
+
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: httpx.AsyncClient,
+        executors: ExecutorRegistry | None = None,
+        worker_pool: RemoteWorkerPool | None = None,
+    ):
+        super().__init__(settings, http_client, executors)
+        self.worker_pool = worker_pool or RemoteWorkerPool(settings, http_client)
+
+    def check_configuration(self) -> ConfigStatus:
+        if not len(self.worker_pool):
+            return ConfigStatus(
+                configured=False, warnings=["Missing env: REMOTE_SELF_HOSTED_URL or REMOTE_SELF_HOSTED_URLS"]
+            )
+        return ConfigStatus(configured=True, warnings=[])
+
+    @property
+    def batch_group(self) -> RemoteWorkerPool:
+        # Remote models behind the same worker pool can be forwarded together as one batch call.
+        return self.worker_pool
 
     async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
-        base_url = (self.settings.remote_self_hosted_url or "").rstrip("/")
-        url = f"{base_url}/tts/synthesize"
+        context = current_request_context()
+        payload = {
+            "model_id": self.model_id,
+            "text": text,
+            "config_overrides": config,
+            "prefer_streaming": prefer_streaming,
+            "priority": context.priority,
+        }
+        result, audio_bytes = await self._with_worker(partial(self._post_single, payload=payload), [self.model_id])
+        return self._to_audio(result, audio_bytes)
 
+    async def synthesize_stream(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudioStream:
         payload = {
             "model_id": self.model_id,
             "text": text,
             "config_overrides": config,
             "prefer_streaming": prefer_streaming,
+            "priority": current_request_context().priority,
         }
+        loop = asyncio.get_running_loop()
+        opened: asyncio.Future[tuple[str, bool]] = loop.create_future()
+        queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(maxsize=_STREAM_BUFFER_CHUNKS)
+        pump = loop.create_task(self._pump_stream(payload, opened, queue))
+        try:
+            audio_format, streaming_used = await opened
+        except BaseException:
+            pump.cancel()
+            raise
+        return AdapterAudioStream(
+            audio_format=audio_format,
+            chunks=self._drain_stream(queue, pump),
+            streaming_used=streaming_used,
+        )
+
+    async def _pump_stream(
+        self,
+        payload: dict[str, Any],
+        opened: asyncio.Future[tuple[str, bool]],
+        queue: asyncio.Queue[bytes | Exception | None],
+    ) -> None:
+        # Runs inside the worker lease for the whole stream; the bounded queue carries backpressure from
+        # the client to the worker socket, and cancelling this task closes the worker connection.
+        try:
+            call = partial(self._stream_audio, payload=payload, opened=opened, queue=queue)
+            await self._with_worker(call, [str(payload["model_id"])])
+            await queue.put(None)
+        except Exception as exc:  # noqa: BLE001
+            if not opened.done():
+                opened.set_exception(exc)
+            else:
+                await queue.put(exc)
+
+    @staticmethod
+    async def _drain_stream(
+        queue: asyncio.Queue[bytes | Exception | None], pump: asyncio.Task
+    ) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            pump.cancel()
+
+    async def _stream_audio(
+        self,
+        worker: RemoteWorker,
+        payload: dict[str, Any],
+        opened: asyncio.Future[tuple[str, bool]],
+        queue: asyncio.Queue[bytes | Exception | None],
+    ) -> None:
+        timeout = self.settings.remote_self_hosted_timeout_seconds
+        try:
+            async with self.http_client.stream(
+                "POST", f"{worker.url}/tts/synthesize-stream", json=payload, timeout=timeout
+            ) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode("utf-8", errors="replace").strip()
+                    if response.status_code == 404 and body == '{"detail":"Not Found"}':
+                        # Worker predates the streaming endpoint: deliver its buffered result as one chunk.
+                        result, audio_bytes = await self._post_single(worker, payload)
+                        audio = self._to_audio(result, audio_bytes)
+                        opened.set_result((audio.audio_format, False))
+                        await queue.put(audio.audio_bytes)
+                        return
+                    self._raise_for_status(response, body)
+                audio_format = format_from_accept(response.headers.get("content-type")) or "wav"
+                opened.set_result((audio_format, response.headers.get("x-streaming-used") == "true"))
+                async for chunk in response.aiter_bytes():
+                    if chunk:
+                        await queue.put(chunk)
+        except ModelUnavailableError:
+            raise
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as exc:
+            raise RemoteWorkerUnavailableError(f"Remote self-hosted backend unavailable: {exc}") from exc
+        except Exception as exc:  # noqa: BLE001
+            raise ModelUnavailableError(f"Remote self-hosted stream failed: {exc}") from exc
+
+    def synthesize_batch(
+        self,
+        model_configs: dict[str, dict[str, Any]],
+        text: str,
+        prefer_streaming: bool,
+    ) -> dict[str, Callable[[], Awaitable[AdapterAudio]]]:
+        # Starts one worker batch call for all models and returns a per-model awaitable factory; results
+        # are demultiplexed by model_id as the worker streams them back.
+        loop = asyncio.get_running_loop()
+        futures: dict[str, asyncio.Future[RemoteResult]] = {
+            model_id: loop.create_future() for model_id in model_configs
+        }
+        payload = {
+            "model_ids": list(model_configs),
+            "text": text,
+            "per_model_config": model_configs,
+            "prefer_streaming": prefer_streaming,
+            "priority": current_request_context().priority,
+        }
+        task = loop.create_task(self._run_batch(payload, futures))
+
+        def release(future: asyncio.Future[RemoteResult]) -> None:
+            if not future.cancelled():
+                future.exception()
+            # Every caller gave up (timeouts, disconnect): stop the worker call too.
+            if all(item.done() for item in futures.values()) and not task.done():
+                task.cancel()
+
+        for future in futures.values():
+            future.add_done_callback(release)
+        return {model_id: partial(self._await_member, future) for model_id, future in futures.items()}
+
+    async def _await_member(self, future: asyncio.Future[RemoteResult]) -> AdapterAudio:
+        result, audio_bytes = await future
+        return self._to_audio(result, audio_bytes)
+
+    async def _run_batch(self, payload: dict[str, Any], futures: dict[str, asyncio.Future[RemoteResult]]) -> None:
+        def deliver(result: dict[str, Any], audio_bytes: bytes) -> None:
+            future = futures.get(str(result.get("model_id")))
+            if future is not None and not future.done():
+                future.set_result((result, audio_bytes))
+
+        try:
+            await self._with_worker(partial(self._post_batch, payload=payload, deliver=deliver), list(futures))
+            error: AdapterError = ModelUnavailableError("Remote self-hosted batch returned no result for this model")
+        except AdapterError as exc:
+            error = exc
+        except Exception as exc:  # noqa: BLE001
+            error = ModelUnavailableError(f"Remote self-hosted batch failed: {exc}")
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _to_audio(result: dict[str, Any], audio_bytes: bytes) -> AdapterAudio:
+        if not result.get("success"):
+            message = str(result.get("error") or "Remote self-hosted synthesis failed")
+            raise ModelUnavailableError(message)
+        if not audio_bytes:
+            raise ModelUnavailableError("Remote self-hosted backend did not return audio")
+
+        # The worker's scheduler did the queueing; surface its numbers on this side's result.
+        context = current_request_context()
+        context.queue_position = result.get("queue_position")
+        context.queue_wait_ms = result.get("queue_wait_ms")
+        return AdapterAudio(
+            audio_bytes=audio_bytes,
+            audio_format=result.get("audio_format") or "wav",
+            streaming_used=bool(result.get("streaming_used", False)),
+        )
+
+    async def _with_worker(self, call: Callable[[RemoteWorker], Awaitable[T]], model_ids: list[str]) -> T:
+        # Failures before the worker starts on the request (connection refused, 502, 503 with Retry-After)
+        # are retried on another worker; anything after that is returned as-is so work is never run twice.
+        tried: set[str] = set()
+        last_error: RemoteWorkerUnavailableError | None = None
+        for _ in range(1 + self.worker_pool.retries):
+            worker = self.worker_pool.pick(exclude=tried, model_ids=model_ids)
+            if worker is None:
+                break
+            tried.add(worker.url)
+            try:
+                async with self.worker_pool.lease(worker, len(model_ids)):
+                    outcome = await call(worker)
+            except RemoteWorkerUnavailableError as exc:
+                if exc.retry_after_seconds is not None:
+                    # Saturated, not broken: skip it until Retry-After without counting a failure.
+                    self.worker_pool.report_saturated(worker, exc.retry_after_seconds)
+                else:
+                    self.worker_pool.report_failure(worker, str(exc))
+                last_error = exc
+                continue
+            except ModelUnavailableError as exc:
+                # The worker may have started the request (5xx, read timeout): counted towards ejection,
+                # but not retried.
+                self.worker_pool.report_failure(worker, str(exc))
+                raise
+            self.worker_pool.report_success(worker)
+            return outcome
+        raise last_error or ModelUnavailableError("No remote self-hosted worker configured")
+
+    def _use_binary(self, worker: RemoteWorker) -> bool:
+        return self.settings.remote_self_hosted_transport == "binary" and worker.binary_supported
+
+    async def _post_single(self, worker: RemoteWorker, payload: dict[str, Any]) -> RemoteResult:
+        frames: list[RemoteResult] = []
+        if self._use_binary(worker):
+            if await self._stream_frames(worker, "/tts/synthesize-raw", payload, lambda *frame: frames.append(frame)):
+                if not frames:
+                    raise ModelUnavailableError("Remote self-hosted backend returned an empty response")
+                return frames[0]
+
+        data = await self._post_json(worker, "/tts/synthesize", payload)
+        result = data.get("result")
+        if not isinstance(result, dict):
+            raise ModelUnavailableError("Remote self-hosted backend returned malformed payload")
+        return self._decode_json_result(result)
+
+    async def _post_batch(
+        self,
+        worker: RemoteWorker,
+        payload: dict[str, Any],
+        deliver: Callable[[dict[str, Any], bytes], None],
+    ) -> None:
+        if self._use_binary(worker):
+            if await self._stream_frames(worker, "/tts/synthesize-batch-raw", payload, deliver):
+                return
+
+        data = await self._post_json(worker, "/tts/synthesize-batch", payload)
+        results = data.get("results")
+        if not isinstance(results, list):
+            raise ModelUnavailableError("Remote self-hosted backend returned malformed payload")
+        for result in results:
+            if isinstance(result, dict):
+                deliver(*self._decode_json_result(result))
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, body: str) -> None:
+        message = f"Remote self-hosted backend error {response.status_code}: {body[:500]}"
+        if response.status_code == 503 and "retry-after" in response.headers:
+            try:
+                retry_after = float(response.headers["retry-after"])
+            except ValueError:
+                retry_after = 1.0
+            raise RemoteWorkerUnavailableError(message, retry_after_seconds=retry_after)
+        if response.status_code == 502:
+            raise RemoteWorkerUnavailableError(message)
+        # A 504 (or a bare 503) may come after the worker started generating, so it is not retried.
+        raise ModelUnavailableError(message)
+
+    async def _stream_frames(
+        self,
+        worker: RemoteWorker,
+        path: str,
+        payload: dict[str, Any],
+        deliver: Callable[[dict[str, Any], bytes], None],
+    ) -> bool:
+        # Returns False when the worker predates the binary endpoints (404), so the caller can use JSON.
+        headers = {"Accept": FRAME_MEDIA_TYPE}
+        if self.settings.remote_self_hosted_compression == "zstd" and zstd_available():
+            headers["X-Frame-Compression"] = "zstd"
         timeout = self.settings.remote_self_hosted_timeout_seconds
+        try:
+            async with self.http_client.stream(
+                "POST", f"{worker.url}{path}", json=payload, headers=headers, timeout=timeout
+            ) as response:
+                if response.status_code == 404:
+                    logger.warning("remote_binary_transport_unsupported", url=worker.url)
+                    worker.binary_supported = False
+                    return False
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode("utf-8", errors="replace").strip()
+                    self._raise_for_status(response, body)
+                async for frame in read_frames(response.aiter_bytes()):
+                    deliver(frame.header, frame.payload)
+        except ModelUnavailableError:
+            raise
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as exc:
+            raise RemoteWorkerUnavailableError(f"Remote self-hosted backend unavailable: {exc}") from exc
+        except FrameError as exc:
+            raise ModelUnavailableError(f"Remote self-hosted backend returned a malformed frame: {exc}") from exc
+        except Exception as exc:  # noqa: BLE001
+            raise ModelUnavailableError(f"Remote self-hosted backend unavailable: {exc}") from exc
+        return True
 
+    async def _post_json(self, worker: RemoteWorker, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        timeout = self.settings.remote_self_hosted_timeout_seconds
         try:
-            response = await self.http_client.post(url, json=payload, timeout=timeout)
+            response = await self.http_client.post(f"{worker.url}{path}", json=payload, timeout=timeout)
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as exc:
+            raise RemoteWorkerUnavailableError(f"Remote self-hosted backend unavailable: {exc}") from exc
         except Exception as exc:  # noqa: BLE001
             raise ModelUnavailableError(f"Remote self-hosted backend unavailable: {exc}") from exc
 
         if response.status_code >= 400:
-            body = response.text.strip()
-            raise ModelUnavailableError(
-                f"Remote self-hosted backend error {response.status_code}: {body[:500]}"
-            )
+            self._raise_for_status(response, response.text.strip())
 
         try:
             data = response.json()
         except ValueError as exc:
             raise ModelUnavailableError("Remote self-hosted backend returned invalid JSON") from exc
-
-        result = data.get("result")
-        if not isinstance(result, dict):
+        if not isinstance(data, dict):
             raise ModelUnavailableError("Remote self-hosted backend returned malformed payload")
+        return data
 
+    @staticmethod
+    def _decode_json_result(result: dict[str, Any]) -> RemoteResult:
         if not result.get("success"):
-            message = str(result.get("error") or "Remote self-hosted synthesis failed")
-            raise ModelUnavailableError(message)
+            return result, b""
 
         audio_base64 = result.get("audio_base64")
         if not isinstance(audio_base64, str) or not audio_base64:
             raise ModelUnavailableError("Remote self-hosted backend did not return audio_base64")
 
         try:
-            audio_bytes = base64.b64decode(audio_base64)
+            return result, base64.b64decode(audio_base64)
         except Exception as exc:  # noqa: BLE001
             raise ModelUnavailableError("Remote self-hosted audio payload is not valid base64") from exc
-
-        return AdapterAudio(
-            audio_bytes=audio_bytes,
-            audio_format="wav",
-            streaming_used=bool(result.get("streaming_used", False)),
-        )
-
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, AsyncIterator
+
+import httpx
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Assumed per-request service time when a worker has not advertised one for a model.
+_DEFAULT_SERVICE_MS = 5000.0
+
+
+def estimate_completion_ms(capacity: dict[str, Any], outstanding: int, cold_load_ms: float) -> float:
+    # Expected time to finish one more request for a model, from its capacity entry (see
+    # HFLocalRuntime.capacity): drain the queue, serve the request, and load the model first if cold.
+    service_ms = capacity.get("mean_service_ms") or _DEFAULT_SERVICE_MS
+    # Requests sent since the report are not in it yet; the larger of the two counts is closer.
+    pending = max(capacity.get("active", 0) + capacity.get("queued", 0), outstanding)
+    total = pending * service_ms / max(1, capacity.get("slots") or 1) + service_ms
+    if not capacity.get("warm"):
+        total += cold_load_ms
+    if capacity.get("saturated"):
+        total += (capacity.get("retry_after_seconds") or 1) * 1000
+    return total
+
+
+@dataclass
+class RemoteWorker:
+    url: str
+    outstanding: int = 0
+    healthy: bool = True
+    ejected_until: float = 0.0
+    consecutive_failures: int = 0
+    requests: int = 0
+    failures: int = 0
+    # Cleared when the worker answers 404 on /tts/synthesize-raw (an older deployment).
+    binary_supported: bool = True
+    # Last GET /capacity document; workers without the endpoint are probed on /health only.
+    capacity: dict[str, Any] | None = None
+    capacity_at: float = 0.0
+    capacity_supported: bool = True
+    saturated_until: float = 0.0
+
+    def available(self, now: float) -> bool:
+        return self.healthy and self.ejected_until <= now and self.saturated_until <= now
+
+
+class RemoteWorkerPool:
+    # Routes each request to the worker with the lowest expected completion time for its model(s), from
+    # the capacity documents workers advertise (queue depth, service time, warm models); workers without
+    # one are ranked by outstanding requests. Workers leave rotation when their probe fails (active),
+    # after consecutive request failures (passive, for a cool-down) or while they answer 503 Retry-After.
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient):
+        self._http_client = http_client
+        self._health_interval = settings.remote_worker_health_interval_seconds
+        self._capacity_ttl = max(5.0, 3 * self._health_interval)
+        self._cold_load_ms = settings.remote_worker_cold_load_seconds * 1000
+        self._max_failures = max(1, settings.remote_worker_max_failures)
+        self._eject_seconds = settings.remote_worker_eject_seconds
+        self.retries = max(0, settings.remote_worker_retries)
+        self.workers = [RemoteWorker(url=url.rstrip("/")) for url in settings.remote_worker_url_list()]
+        self._health_task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self.workers)
+
+    def pick(self, exclude: set[str] | None = None, model_ids: list[str] | None = None) -> RemoteWorker | None:
+        self._ensure_health_checks()
+        candidates = [worker for worker in self.workers if worker.url not in (exclude or set())]
+        if not candidates:
+            return None
+        now = monotonic()
+        available = [worker for worker in candidates if worker.available(now)]
+        if not available:
+            # Everything is out of rotation: fail open on the worker expected back soonest rather than
+            # refusing the request outright.
+            return min(
+                candidates,
+                key=lambda worker: (worker.healthy is False, max(worker.ejected_until, worker.saturated_until)),
+            )
+        return min(
+            available,
+            key=lambda worker: (
+                self.expected_completion_ms(worker, model_ids or [], now),
+                worker.outstanding,
+                worker.requests,
+            ),
+        )
+
+    def expected_completion_ms(self, worker: RemoteWorker, model_ids: list[str], now: float) -> float:
+        report = worker.capacity if now - worker.capacity_at <= self._capacity_ttl else None
+        if report is None or not model_ids:
+            return (worker.outstanding + 1) * _DEFAULT_SERVICE_MS
+        total = 0.0
+        for model_id in model_ids:
+            entry = (report.get("models") or {}).get(model_id)
+            if entry is None:
+                return math.inf
+            total += estimate_completion_ms(entry, worker.outstanding, self._cold_load_ms)
+        return total
+
+    @asynccontextmanager
+    async def lease(self, worker: RemoteWorker, weight: int = 1) -> AsyncIterator[RemoteWorker]:
+        # A forwarded batch counts once per model it carries.
+        worker.outstanding += weight
+        worker.requests += 1
+        try:
+            yield worker
+        finally:
+            worker.outstanding -= weight
+
+    def report_success(self, worker: RemoteWorker) -> None:
+        worker.consecutive_failures = 0
+
+    def report_saturated(self, worker: RemoteWorker, retry_after_seconds: float) -> None:
+        worker.saturated_until = monotonic() + retry_after_seconds
+        logger.info("remote_worker_saturated", url=worker.url, retry_after_seconds=retry_after_seconds)
+
+    def report_failure(self, worker: RemoteWorker, error: str) -> None:
+        worker.failures += 1
+        worker.consecutive_failures += 1
+        if worker.consecutive_failures >= self._max_failures:
+            worker.ejected_until = monotonic() + self._eject_seconds
+            logger.warning(
+                "remote_worker_ejected",
+                url=worker.url,
+                failures=worker.consecutive_failures,
+                eject_seconds=self._eject_seconds,
+                error=error,
+            )
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*(self._check_worker(worker) for worker in self.workers))
+
+    async def _check_worker(self, worker: RemoteWorker) -> None:
+        timeout = self._health_timeout()
+        try:
+            if worker.capacity_supported:
+                response = await self._http_client.get(f"{worker.url}/capacity", timeout=timeout)
+                if response.status_code == 404:
+                    worker.capacity_supported = False
+                elif response.status_code == 200:
+                    worker.capacity = response.json()
+                    worker.capacity_at = monotonic()
+            if not worker.capacity_supported:
+                response = await self._http_client.get(f"{worker.url}/health", timeout=timeout)
+            healthy = response.status_code == 200
+        except (httpx.HTTPError, ValueError):
+            healthy = False
+        if healthy and not worker.healthy:
+            logger.info("remote_worker_recovered", url=worker.url)
+        elif not healthy and worker.healthy:
+            logger.warning("remote_worker_unhealthy", url=worker.url)
+        worker.healthy = healthy
+        if healthy and worker.ejected_until:
+            # A passing health check readmits a passively ejected worker before its cool-down ends.
+            worker.ejected_until = 0.0
+            worker.consecutive_failures = 0
+
+    def _health_timeout(self) -> float:
+        return max(1.0, min(5.0, self._health_interval / 2))
+
+    def _ensure_health_checks(self) -> None:
+        if self._health_interval <= 0 or not self.workers:
+            return
+        if self._health_task is not None and not self._health_task.done():
+            return
+        try:
+            self._health_task = asyncio.get_running_loop().create_task(self._health_loop())
+        except RuntimeError:
+            return
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            try:
+                await self.check_health()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("remote_worker_health_check_failed", error=str(exc))
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+
+    def metrics(self) -> dict[str, Any]:
+        now = monotonic()
+        return {
+            "workers": [
+                {
+                    "url": worker.url,
+                    "available": worker.available(now),
+                    "healthy": worker.healthy,
+                    "ejected_for_seconds": round(max(0.0, worker.ejected_until - now), 1),
+                    "outstanding": worker.outstanding,
+                    "requests": worker.requests,
+                    "failures": worker.failures,
+                    "transport": "binary" if worker.binary_supported else "json",
+                    "saturated_for_seconds": round(max(0.0, worker.saturated_until - now), 1),
+                    "capacity_age_seconds": round(now - worker.capacity_at, 1) if worker.capacity else None,
+                    "warm_models": sorted(
+                        model_id
+                        for model_id, entry in ((worker.capacity or {}).get("models") or {}).items()
+                        if entry.get("warm")
+                    ),
+                }
+                for worker in self.workers
+            ]
+        }
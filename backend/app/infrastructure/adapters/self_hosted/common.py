@@ -11,10 +11,16 @@ class SelfHostedAdapterBase(BaseAdapter):
     provider = "huggingface-local"
     category = "self_hosted"
 
-    def __init__(self, settings, http_client, runtime: HFLocalRuntime):
-        super().__init__(settings, http_client)
+    def __init__(self, settings, http_client, runtime: HFLocalRuntime, executors=None):
+        super().__init__(settings, http_client, executors)
         self.runtime = runtime
 
+    def capacity(self) -> dict[str, Any]:
+        return self.runtime.capacity(self.model_id)
+
+    def admit(self) -> None:
+        self.runtime.admit(self.model_id)
+
     async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
         _ = prefer_streaming
         audio = await self.runtime.synthesize(self.model_id, text, config)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def description_cache_namespace(
+    model_repo: str, revision: str | None, dtype: Any, inference_mode: str, text_encoder_backend: str
+) -> str:
+    # Everything that changes the encoder outputs: disk entries from another weight set are never reused.
+    return "\0".join((model_repo, revision or "", str(dtype), inference_mode, text_encoder_backend))
+
+
+@dataclass
+class DescriptionConditioning:
+    input_ids: Any
+    attention_mask: Any
+    encoder_outputs: Any | None = None
+
+
+class DescriptionConditioningCache:
+    # LRU of tokenized Parler descriptions and their text-encoder outputs, keyed by the exact
+    # description string. Entries can optionally be mirrored to disk so popular voices survive restarts.
+    def __init__(self, max_entries: int, persist_dir: str | None = None, namespace: str = ""):
+        self._max_entries = max(0, max_entries)
+        self._persist_dir = Path(persist_dir) if persist_dir else None
+        self._namespace = namespace
+        self._entries: OrderedDict[str, DescriptionConditioning] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def get(self, description: str, device: Any = None) -> DescriptionConditioning | None:
+        with self._lock:
+            entry = self._entries.get(description)
+            if entry is not None:
+                self._entries.move_to_end(description)
+                self.hits += 1
+                return entry
+        entry = self._load_from_disk(description, device)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(description, entry)
+        return entry
+
+    def put(self, description: str, entry: DescriptionConditioning) -> None:
+        with self._lock:
+            self._insert(description, entry)
+        self._save_to_disk(description, entry)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+    def _insert(self, description: str, entry: DescriptionConditioning) -> None:
+        self._entries[description] = entry
+        self._entries.move_to_end(description)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, description: str) -> Path | None:
+        if self._persist_dir is None:
+            return None
+        digest = hashlib.sha256(f"{self._namespace}\0{description}".encode("utf-8")).hexdigest()
+        return self._persist_dir / f"{digest}.pt"
+
+    def _load_from_disk(self, description: str, device: Any) -> DescriptionConditioning | None:
+        path = self._disk_path(description)
+        if path is None or not path.exists():
+            return None
+        try:
+            import torch
+            from transformers.modeling_outputs import BaseModelOutput
+
+            payload = torch.load(path, map_location=device or "cpu", weights_only=True)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("description_cache_load_failed", path=str(path), error=str(exc))
+            return None
+        hidden = payload.get("last_hidden_state")
+        return DescriptionConditioning(
+            input_ids=payload["input_ids"],
+            attention_mask=payload["attention_mask"],
+            encoder_outputs=BaseModelOutput(last_hidden_state=hidden) if hidden is not None else None,
+        )
+
+    def _save_to_disk(self, description: str, entry: DescriptionConditioning) -> None:
+        path = self._disk_path(description)
+        if path is None:
+            return
+        try:
+            import torch
+
+            payload = {
+                "input_ids": entry.input_ids.detach().cpu(),
+                "attention_mask": entry.attention_mask.detach().cpu(),
+            }
+            if entry.encoder_outputs is not None:
+                payload["last_hidden_state"] = entry.encoder_outputs[0].detach().cpu()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            torch.save(payload, tmp_path)
+            tmp_path.replace(path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("description_cache_save_failed", path=str(path), error=str(exc))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MEGA_CACHE_FILE = "compile_artifacts.bin"
+_threads_lock = threading.Lock()
+_threads_applied = False
+
+
+@dataclass(frozen=True)
+class ExecutionProfile:
+    intra_op_threads: int
+    inter_op_threads: int
+    parallel_generations: int
+    compile_decoder: bool
+    static_cache: bool
+    compile_cache_dir: Path
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ExecutionProfile:
+        parallel = max(1, settings.local_model_parallelism)
+        # Split the cores between generations that may run at the same time instead of letting
+        # every generation spawn a full-width OpenMP pool and oversubscribe the machine. With worker
+        # processes each one runs a single generation at a time, so the split is per worker.
+        sharers = settings.local_inference_workers if settings.local_inference_workers > 0 else parallel
+        intra = settings.local_intra_op_threads or max(1, (os.cpu_count() or 1) // sharers)
+        return cls(
+            intra_op_threads=intra,
+            inter_op_threads=max(1, settings.local_inter_op_threads),
+            parallel_generations=parallel,
+            compile_decoder=settings.local_torch_compile,
+            static_cache=settings.local_static_kv_cache or settings.local_torch_compile,
+            compile_cache_dir=Path(settings.local_compile_cache_dir),
+        )
+
+    def apply_thread_budget(self, torch_module) -> None:
+        global _threads_applied
+        with _threads_lock:
+            if _threads_applied:
+                return
+            torch_module.set_num_threads(self.intra_op_threads)
+            try:
+                torch_module.set_num_interop_threads(self.inter_op_threads)
+            except RuntimeError:
+                # Inter-op pool size is fixed once any parallel work has run in this process.
+                logger.warning("torch_interop_threads_already_set", requested=self.inter_op_threads)
+            _threads_applied = True
+
+    def prepare_compile_cache(self, torch_module) -> None:
+        cache_dir = self.compile_cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Through torch's config modules, not TORCHINDUCTOR_* env vars: inductor reads those at import, which
+        # has already happened here. Persistence across restarts comes from the mega-cache file below.
+        try:
+            from torch._functorch import config as functorch_config
+            from torch._inductor import config as inductor_config
+        except ImportError:
+            pass
+        else:
+            inductor_config.fx_graph_cache = True
+            if hasattr(inductor_config, "cache_dir"):
+                inductor_config.cache_dir = str(cache_dir / "inductor")
+            if hasattr(functorch_config, "enable_autograd_cache"):
+                functorch_config.enable_autograd_cache = True
+
+        artifacts = cache_dir / _MEGA_CACHE_FILE
+        loader = getattr(getattr(torch_module, "compiler", None), "load_cache_artifacts", None)
+        if loader is not None and artifacts.exists():
+            try:
+                loader(artifacts.read_bytes())
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("torch_compile_cache_load_failed", error=str(exc))
+
+    def save_compile_cache(self, torch_module) -> None:
+        saver = getattr(getattr(torch_module, "compiler", None), "save_cache_artifacts", None)
+        if saver is None:
+            return
+        try:
+            saved = saver()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("torch_compile_cache_save_failed", error=str(exc))
+            return
+        if saved:
+            payload, _info = saved
+            (self.compile_cache_dir / _MEGA_CACHE_FILE).write_bytes(payload)
+
+    def apply_to_model(self, model: Any, torch_module) -> bool:
+        # Returns True when the model was compiled and the compile cache should be saved after warm-up.
+        generation_config = getattr(model, "generation_config", None)
+        if self.static_cache and generation_config is not None:
+            generation_config.cache_implementation = "static"
+        if not self.compile_decoder:
+            return False
+        self.prepare_compile_cache(torch_module)
+        model.forward = torch_module.compile(model.forward, dynamic=False)
+        return True
+
+    def bucket_max_new_tokens(self, max_new_tokens: int) -> int:
+        # Static caches are sized by max_length; bucketing keeps compiled shapes reusable across requests.
+        if not self.static_cache:
+            return max_new_tokens
+        bucket = 256
+        return ((max_new_tokens + bucket - 1) // bucket) * bucket
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "intra_op_threads": self.intra_op_threads,
+            "inter_op_threads": self.inter_op_threads,
+            "parallel_generations": self.parallel_generations,
+            "compile_decoder": self.compile_decoder,
+            "static_cache": self.static_cache,
+        }
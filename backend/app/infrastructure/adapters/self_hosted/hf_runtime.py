@@ -1,22 +1,129 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import gc
 import io
+import math
+import threading
 import wave
 from collections import defaultdict
-from typing import Any
-
-from app.domain.errors import DependencyMissingError, ModelUnavailableError
+from contextlib import asynccontextmanager, nullcontext
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable
+
+from app.domain.errors import (
+    CapacityExceededError,
+    DependencyMissingError,
+    GenerationCancelledError,
+    ModelUnavailableError,
+)
+from app.domain.request_context import RequestContext, current_request_context
+from app.infrastructure.adapters.self_hosted.conditioning_cache import (
+    DescriptionConditioning,
+    DescriptionConditioningCache,
+    description_cache_namespace,
+)
+from app.infrastructure.adapters.self_hosted.execution_profile import ExecutionProfile
+from app.infrastructure.adapters.self_hosted.model_loading import ModelLoader
+from app.infrastructure.adapters.self_hosted.onnx_backend import OnnxBackend, normalize_backend
+from app.infrastructure.adapters.self_hosted.pipeline_profile import (
+    PIPELINE_TASKS,
+    PipelineCapabilityProfile,
+    profile_dir,
+)
+from app.infrastructure.adapters.self_hosted.prefix_cache import PrefixKVCache
+from app.infrastructure.adapters.self_hosted.precision import (
+    apply_inference_mode,
+    autocast_dtype_for_mode,
+    load_dtype_for_mode,
+    resolve_cpu_inference_mode,
+)
+from app.infrastructure.adapters.self_hosted.process_pool import LocalInferenceProcessPool
+from app.infrastructure.adapters.self_hosted.residency import (
+    ModelResidencyManager,
+    available_memory_bytes,
+    estimate_runtime_bytes,
+)
+from app.infrastructure.adapters.self_hosted.scheduler import InferenceScheduler, SlotGrant
+from app.infrastructure.adapters.self_hosted.stage_timing import FirstStepTimer, StageTimings
+from app.infrastructure.adapters.self_hosted.snac_decode import decode_snac_windowed
+from app.infrastructure.adapters.self_hosted.stopping import (
+    CancellationStoppingCriteria,
+    RepeatingFrameStoppingCriteria,
+)
+from app.infrastructure.adapters.self_hosted.token_budget import TokenBudgetCalibrator, spoken_chars
+from app.infrastructure.adapters.self_hosted.veena_vocab import (
+    AUDIO_CODE_BASE_OFFSET,
+    AUDIO_CODE_END,
+    AUDIO_CODEBOOK_SIZE,
+    AUDIO_CODES_PER_FRAME,
+    END_OF_AI,
+    END_OF_HUMAN,
+    END_OF_SPEECH,
+    START_OF_AI,
+    START_OF_HUMAN,
+    START_OF_SPEECH,
+    AudioTokenLogitsProcessor,
+    restrict_lm_head_to_audio_vocab,
+)
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SNAC_REPO = "hubertsiuzdak/snac_24khz"
+# Scheduling cost before a model/speaker is calibrated: Veena's 1.3 frames/char heuristic and
+# Parler's ~86 codec frames/s at roughly 14 spoken characters/s.
+_DEFAULT_TOKENS_PER_CHAR = {"veena": 1.3 * AUDIO_CODES_PER_FRAME, "parler": 6.0}
+_PROCESS_POOL_QUEUE = "process_pool"
+# Overlap decoded on each side of a SNAC window and cropped away; covers the decoder's receptive field.
+_SNAC_CONTEXT_FRAMES = 4
 
 
 class HFLocalRuntime:
     _VEENA_SPEAKERS = {"kavya", "agastya", "maitri", "vinaya"}
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, executors: ExecutorRegistry | None = None):
         self._settings = settings
-        self._pipelines: dict[str, Any] = {}
+        self._executors = executors or ExecutorRegistry(settings)
+        self._residency = ModelResidencyManager(
+            budget_bytes=settings.local_model_memory_budget_mb * 2**20,
+            idle_seconds=settings.local_model_idle_seconds,
+            pinned={
+                self.resolve_model_repo(model_id.strip())
+                for model_id in settings.local_pinned_models.split(",")
+                if model_id.strip()
+            },
+        )
         self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._idle_sweep: asyncio.Task | None = None
+        self._profile = ExecutionProfile.from_settings(settings)
+        self._model_loader = ModelLoader(settings)
+        self._onnx = OnnxBackend(settings, self._profile.intra_op_threads, self._profile.parallel_generations)
+        self._stats_lock = threading.Lock()
+        self._generation_stats: defaultdict[str, dict[str, float]] = defaultdict(
+            lambda: {"generations": 0, "tokens": 0, "seconds": 0.0}
+        )
+        self._stages = StageTimings()
+        self._cancellations: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._token_budgets = TokenBudgetCalibrator(
+            alpha=settings.local_token_budget_alpha,
+            headroom=settings.local_token_budget_headroom,
+            min_fraction=0.5,
+            min_samples=settings.local_token_budget_min_samples,
+            persist_path=settings.local_token_budget_path,
+        )
+        self._process_pool: LocalInferenceProcessPool | None = None
+        if settings.local_inference_workers > 0:
+            self._process_pool = LocalInferenceProcessPool(settings)
+        # In-process: one queue per model with `parallel_generations` slots. With worker processes the
+        # parent schedules a single queue across all workers, each running one job at a time.
+        self._scheduler = InferenceScheduler(
+            slots=settings.local_inference_workers or self._profile.parallel_generations,
+            aging_seconds=settings.local_scheduler_aging_seconds,
+        )
 
     def resolve_model_repo(self, requested_id: str) -> str:
         aliases = {
@@ -25,20 +132,229 @@ class HFLocalRuntime:
         return aliases.get(requested_id, requested_id)
 
     async def synthesize(self, requested_id: str, text: str, config: dict[str, Any]) -> bytes:
+        self.admit(requested_id)
+        context = current_request_context()
+        if self._process_pool is not None:
+            async with self._scheduler.slot(_PROCESS_POOL_QUEUE, context.priority, spoken_chars(text)) as grant:
+                self._record_grant(context, grant)
+                return await self._process_pool.submit(requested_id, text, config)
         model_repo = self.resolve_model_repo(requested_id)
+        async with self._use_pipeline(model_repo) as pipeline:
+            cost = self._expected_tokens(pipeline, text, config)
+            async with self._scheduler.slot(model_repo, context.priority, cost) as grant:
+                self._record_grant(context, grant)
+                executor = self._executors.local_model(model_repo)
+                audio = await executor.run(self._run_pipeline, pipeline, text, config)
+                if isinstance(pipeline, dict) and pipeline.pop("compile_cache_pending", False):
+                    await self._executors.file_io.run(self._save_compile_cache)
+                return audio
+
+    def capacity(self, requested_id: str) -> dict[str, Any]:
+        # One model's entry in the worker capacity document (GET /capacity): whether it is warm, queue
+        # depth and the expected wait for a new request, and whether new requests are being refused.
+        model_repo = self.resolve_model_repo(requested_id)
+        if self._process_pool is not None:
+            state = self._scheduler.queue_state(_PROCESS_POOL_QUEUE)
+            warm = requested_id in self._process_pool.warm_models()
+        else:
+            state = self._scheduler.queue_state(model_repo)
+            warm = model_repo in self._residency.loaded_models()
+        max_depth = self._settings.local_max_queue_depth
+        saturated = max_depth > 0 and state["queued"] >= max_depth
+        wait_ms = state["estimated_wait_ms"] or state["mean_service_ms"] or 1000
+        return {
+            **state,
+            "model_repo": model_repo,
+            "warm": warm,
+            "saturated": saturated,
+            "retry_after_seconds": min(60, max(1, math.ceil(wait_ms / 1000))) if saturated else None,
+        }
+
+    def free_memory_mb(self) -> int | None:
+        available = available_memory_bytes()
+        budget = self._settings.local_model_memory_budget_mb * 2**20
+        if budget:
+            headroom = budget - self._residency.resident_bytes()
+            available = headroom if available is None else min(available, headroom)
+        return None if available is None else max(0, available // 2**20)
+
+    def admit(self, requested_id: str) -> None:
+        capacity = self.capacity(requested_id)
+        if capacity["saturated"]:
+            raise CapacityExceededError(
+                f"{requested_id} queue is full ({capacity['queued']} waiting)",
+                retry_after_seconds=capacity["retry_after_seconds"],
+            )
+
+    @staticmethod
+    def _record_grant(context: RequestContext, grant: SlotGrant) -> None:
+        context.queue_position = grant.queue_position
+        context.estimated_wait_ms = grant.estimated_wait_ms
+        context.queue_wait_ms = grant.queue_wait_ms
+
+    def _expected_tokens(self, runtime: Any, text: str, config: dict[str, Any]) -> float:
+        if not isinstance(runtime, dict):
+            return float(spoken_chars(text))
+        expected = self._token_budgets.expected_tokens(self._budget_key(runtime, config), text)
+        if expected is None:
+            expected = spoken_chars(text) * _DEFAULT_TOKENS_PER_CHAR.get(str(runtime.get("kind")), 1.0)
+        return expected
+
+    def _budget_key(self, runtime: dict[str, Any], config: dict[str, Any]) -> str:
+        if runtime.get("kind") == "veena":
+            return TokenBudgetCalibrator.key(self._model_key(runtime), self._veena_speaker(config))
+        return TokenBudgetCalibrator.key(self._model_key(runtime))
+
+    @classmethod
+    def _veena_speaker(cls, config: dict[str, Any]) -> str:
+        speaker = str(config.get("speaker") or "kavya").strip().lower()
+        return speaker if speaker in cls._VEENA_SPEAKERS else "kavya"
+
+    def metrics(self) -> dict[str, Any]:
+        metrics: dict[str, Any] = {
+            "loaded_models": sorted(self._residency.loaded_models()),
+            "residency": self._residency.metrics(),
+            "execution_profile": self._profile.describe(),
+            "prefix_caches": {
+                model_repo: runtime["prefix_cache"].metrics()
+                for model_repo, runtime in self._residency.resident_runtimes().items()
+                if isinstance(runtime, dict) and runtime.get("prefix_cache") is not None
+            },
+            "description_caches": {
+                model_repo: runtime["description_cache"].metrics()
+                for model_repo, runtime in self._residency.resident_runtimes().items()
+                if isinstance(runtime, dict) and runtime.get("description_cache") is not None
+            },
+            "generation": self._generation_metrics(),
+            "stages": self._stages.metrics(),
+            "token_budgets": self._token_budgets.metrics(),
+            "scheduler": self._scheduler.metrics(),
+            "cancellations": self._cancellation_metrics(),
+            "inference_modes": {
+                model_repo: runtime["inference_mode"]
+                for model_repo, runtime in self._residency.resident_runtimes().items()
+                if isinstance(runtime, dict) and "inference_mode" in runtime
+            },
+            "load_seconds": {
+                model_repo: runtime["load_seconds"]
+                for model_repo, runtime in self._residency.resident_runtimes().items()
+                if isinstance(runtime, dict) and "load_seconds" in runtime
+            },
+            "execution_backends": {
+                model_repo: runtime["backends"]
+                for model_repo, runtime in self._residency.resident_runtimes().items()
+                if isinstance(runtime, dict) and "backends" in runtime
+            },
+        }
+        if self._process_pool is not None:
+            metrics["process_pool"] = self._process_pool.metrics()
+        return metrics
+
+    def _generation_metrics(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                model_key: {
+                    **stats,
+                    "seconds": round(stats["seconds"], 3),
+                    "tokens_per_second": round(stats["tokens"] / stats["seconds"], 2) if stats["seconds"] else None,
+                }
+                for model_key, stats in self._generation_stats.items()
+            }
+
+    @staticmethod
+    def _model_key(runtime: dict[str, Any]) -> str:
+        return str(runtime.get("model_repo") or runtime.get("kind") or "pipeline")
+
+    def _record_generation(self, runtime: dict[str, Any], tokens: int, seconds: float) -> None:
+        model_key = self._model_key(runtime)
+        with self._stats_lock:
+            stats = self._generation_stats[model_key]
+            stats["generations"] += 1
+            stats["tokens"] += tokens
+            stats["seconds"] += seconds
+
+    def _record_cancellation(self, runtime: Any, stage: str) -> GenerationCancelledError:
+        model_key = self._model_key(runtime) if isinstance(runtime, dict) else "pipeline"
+        reason = current_request_context().cancel_token.reason or "cancelled"
+        with self._stats_lock:
+            self._cancellations[model_key][stage] += 1
+        logger.info("local_generation_cancelled", model=model_key, stage=stage, reason=reason)
+        return GenerationCancelledError(f"Local generation cancelled during {stage} ({reason})")
+
+    def _cancellation_metrics(self) -> dict[str, dict[str, int]]:
+        with self._stats_lock:
+            return {model_key: dict(stages) for model_key, stages in self._cancellations.items()}
+
+    def shutdown(self) -> None:
+        if self._idle_sweep is not None:
+            self._idle_sweep.cancel()
+            self._idle_sweep = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+
+    def _save_compile_cache(self) -> None:
+        try:
+            import torch
+        except ImportError:
+            return
+        self._profile.save_compile_cache(torch)
+
+    @asynccontextmanager
+    async def _use_pipeline(self, model_repo: str) -> AsyncIterator[Any]:
+        # Holding the residency reference keeps the model from being evicted mid-inference.
         pipeline = await self._get_or_load_pipeline(model_repo)
-        return await asyncio.to_thread(self._run_pipeline, pipeline, text, config)
+        try:
+            yield pipeline
+        finally:
+            self._residency.release(model_repo)
+            self.evict_idle()
 
     async def _get_or_load_pipeline(self, model_repo: str):
-        if model_repo in self._pipelines:
-            return self._pipelines[model_repo]
+        pipeline = self._residency.acquire(model_repo)
+        if pipeline is not None:
+            return pipeline
 
         async with self._locks[model_repo]:
-            if model_repo in self._pipelines:
-                return self._pipelines[model_repo]
-            loaded = await asyncio.to_thread(self._load_pipeline_sync, model_repo)
-            self._pipelines[model_repo] = loaded
-            return loaded
+            pipeline = self._residency.acquire(model_repo)
+            if pipeline is not None:
+                return pipeline
+            self._release_evicted(self._residency.reserve(model_repo))
+            loaded = await self._executors.local_model(model_repo).run(self._load_pipeline_sync, model_repo)
+            size_bytes = estimate_runtime_bytes(loaded)
+            logger.info("local_model_loaded", model_repo=model_repo, size_mb=round(size_bytes / 2**20, 1))
+            self._release_evicted(self._residency.admit(model_repo, loaded, size_bytes))
+            self._ensure_idle_sweep()
+            return self._residency.acquire(model_repo)
+
+    def _ensure_idle_sweep(self) -> None:
+        # Requests finishing also sweep, but once traffic stops only this timer unloads idle models.
+        idle_seconds = self._settings.local_model_idle_seconds
+        if idle_seconds <= 0 or (self._idle_sweep is not None and not self._idle_sweep.done()):
+            return
+        self._idle_sweep = asyncio.get_running_loop().create_task(self._sweep_idle(idle_seconds / 2))
+
+    async def _sweep_idle(self, interval: float) -> None:
+        # Ends once nothing is resident; the next load starts it again.
+        while self._residency.loaded_models():
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    def evict_idle(self) -> None:
+        self._release_evicted(self._residency.evict_idle())
+
+    @staticmethod
+    def _release_evicted(evicted: list[str]) -> None:
+        if not evicted:
+            return
+        logger.info("local_models_evicted", model_repos=evicted)
+        gc.collect()
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
 
     def _load_pipeline_sync(self, model_repo: str):
         try:
@@ -49,6 +365,7 @@ class HFLocalRuntime:
                 "Self-hosted inference dependencies missing. Install transformers, torch, and numpy."
             ) from exc
 
+        self._profile.apply_thread_budget(torch)
         device_pref = (self._settings.local_device or "cpu").lower()
         device = -1
         if device_pref.startswith("cuda") and torch.cuda.is_available():
@@ -68,94 +385,81 @@ class HFLocalRuntime:
                     "parler-tts is required for indic-parler-tts. Install with `pip install parler-tts`."
                 ) from exc
 
-        kwargs: dict[str, Any] = {"model": model_repo, "device": device, "trust_remote_code": True}
+        kwargs: dict[str, Any] = {
+            "model": self._model_loader.resolve(model_repo),
+            "device": device,
+            "trust_remote_code": True,
+        }
         if self._settings.hf_token:
             kwargs["token"] = self._settings.hf_token
+        if revision := self._model_loader.revision(model_repo):
+            kwargs["revision"] = revision
 
+        directory = profile_dir(self._settings)
+        known = PipelineCapabilityProfile.load(directory, model_repo)
+        tasks = PIPELINE_TASKS if known is None else (known.task, *(t for t in PIPELINE_TASKS if t != known.task))
         errors: list[str] = []
-        for task in ("text-to-speech", "text-to-audio"):
+        for task in tasks:
             try:
-                return {"kind": "pipeline", "runner": pipeline(task=task, **kwargs)}
+                runner = pipeline(task=task, **kwargs)
             except Exception as exc:  # noqa: BLE001
                 errors.append(f"{task}: {exc}")
+                continue
+            profile = known if known is not None and known.task == task else None
+            if profile is None:
+                try:
+                    profile = PipelineCapabilityProfile.introspect(model_repo, runner, task)
+                except Exception as exc:  # noqa: BLE001
+                    raise ModelUnavailableError(
+                        f"Failed to profile the '{task}' pipeline of local model '{model_repo}': {exc}"
+                    ) from exc
+                profile.save(directory)
+            return {"kind": "pipeline", "runner": runner, "profile": profile}
 
         raise ModelUnavailableError(
             f"Failed to load local model '{model_repo}'. Model might require a custom runtime or gated access: {' | '.join(errors)}"
         )
 
     def _run_pipeline(self, model_pipeline: Any, text: str, config: dict[str, Any]) -> bytes:
+        # Abandoned while the worker thread was starting (or before a pool worker picked the job up).
+        if current_request_context().cancel_token.cancelled:
+            raise self._record_cancellation(model_pipeline, "start")
         if isinstance(model_pipeline, dict) and model_pipeline.get("kind") == "parler":
             return self._run_parler(model_pipeline, text, config)
         if isinstance(model_pipeline, dict) and model_pipeline.get("kind") == "veena":
             return self._run_veena(model_pipeline, text, config)
 
-        runner = model_pipeline.get("runner") if isinstance(model_pipeline, dict) else model_pipeline
-        kwargs: dict[str, Any] = {}
-        if description := config.get("description"):
-            kwargs["description"] = description
-        if prompt := config.get("prompt"):
-            kwargs["prompt"] = prompt
-
-        try:
-            result = runner(text, **kwargs)
-        except TypeError as exc:
-            # Some TTS pipelines accept only plain text with no style kwargs.
-            if kwargs and "unexpected keyword argument" in str(exc):
-                result = self._run_with_length_retry(runner=runner, text=text, kwargs={}, config=config)
-            else:
-                raise ModelUnavailableError(f"Local model inference failed: {exc}") from exc
-        except Exception as exc:  # noqa: BLE001
-            if self._is_max_length_error(exc):
-                result = self._run_with_length_retry(runner=runner, text=text, kwargs=kwargs, config=config)
-            else:
-                raise ModelUnavailableError(f"Local model inference failed: {exc}") from exc
-
-        return self._extract_audio_bytes(result)
+        profile = model_pipeline.get("profile") if isinstance(model_pipeline, dict) else None
+        if profile is None:
+            raise ModelUnavailableError("Local pipeline was loaded without a capability profile")
+        return self._run_profiled_pipeline(model_pipeline["runner"], profile, text, config)
 
-    def _run_with_length_retry(
+    def _run_profiled_pipeline(
         self,
         runner: Any,
+        profile: PipelineCapabilityProfile,
         text: str,
-        kwargs: dict[str, Any],
         config: dict[str, Any],
-    ) -> Any:
+    ) -> bytes:
+        max_new_tokens = self._bounded_max_new_tokens(config=config, text=text)
+        max_length = self._infer_max_length_from_error(config=config, text=text)
+        kwargs = profile.call_kwargs(config, max_new_tokens=max_new_tokens, max_length=max_length)
         try:
-            return runner(text, **kwargs)
+            result = runner(text, **kwargs)
         except Exception as exc:  # noqa: BLE001
-            if not self._is_max_length_error(exc):
+            # The model's default length was too short for this input after all: one explicit-budget retry.
+            retry_kwargs = (
+                profile.call_kwargs(config, max_new_tokens=max_new_tokens, max_length=max_length, force_length=True)
+                if self._is_max_length_error(exc)
+                else kwargs
+            )
+            if retry_kwargs == kwargs:
                 raise ModelUnavailableError(f"Local model inference failed: {exc}") from exc
-
-        max_new_tokens = self._bounded_max_new_tokens(config=config, text=text)
-        max_length = self._infer_max_length_from_error(config=config, text=text)
-
-        attempts: list[dict[str, Any]] = [
-            {**kwargs, "max_new_tokens": max_new_tokens},
-            {**kwargs, "generate_kwargs": {"max_new_tokens": max_new_tokens}},
-            {"max_new_tokens": max_new_tokens},
-            {"generate_kwargs": {"max_new_tokens": max_new_tokens}},
-            {**kwargs, "max_length": max_length},
-            {"max_length": max_length},
-        ]
-
-        last_error: Exception | None = None
-        for attempt_kwargs in attempts:
             try:
-                return runner(text, **attempt_kwargs)
-            except TypeError as exc:
-                # Some pipeline wrappers reject specific generation kwargs.
-                if "unexpected keyword argument" in str(exc):
-                    last_error = exc
-                    continue
-                last_error = exc
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if self._is_max_length_error(exc):
-                    continue
-                break
-
-        if last_error is None:
-            raise ModelUnavailableError("Local model inference failed due to generation length settings.")
-        raise ModelUnavailableError(f"Local model inference failed: {last_error}") from last_error
+                result = runner(text, **retry_kwargs)
+            except Exception as retry_exc:  # noqa: BLE001
+                raise ModelUnavailableError(f"Local model inference failed: {retry_exc}") from retry_exc
+        return self._extract_audio_bytes(result)
 
     @staticmethod
     def _is_max_length_error(exc: Exception) -> bool:
@@ -193,36 +497,151 @@ class HFLocalRuntime:
                 "parler-tts runtime is missing. Install `parler-tts` and compatible transformers."
             ) from exc
 
-        torch_dtype = getattr(torch_module, self._settings.local_dtype, torch_module.float32)
         device = "cuda:0" if device_pref.startswith("cuda") and torch_module.cuda.is_available() else "cpu"
-
-        kwargs: dict[str, Any] = {"torch_dtype": torch_dtype}
-        if self._settings.hf_token:
-            kwargs["token"] = self._settings.hf_token
-
-        model = ParlerTTSForConditionalGeneration.from_pretrained(model_repo, **kwargs)
-        model = model.to(device)
-        prompt_tokenizer = AutoTokenizer.from_pretrained(
-            model_repo,
-            token=self._settings.hf_token if self._settings.hf_token else None,
+        inference_mode = "fp32"
+        torch_dtype = getattr(torch_module, self._settings.local_dtype, torch_module.float32)
+        if device == "cpu":
+            inference_mode = resolve_cpu_inference_mode(
+                self._settings.local_inference_mode_parler, torch_module, model_label=model_repo
+            )
+            if inference_mode != "fp32":
+                torch_dtype = load_dtype_for_mode(inference_mode, torch_module)
+
+        loader = self._model_loader
+        started = perf_counter()
+        source = loader.resolve(model_repo)
+        # The description tokenizer comes from the text-encoder config, which is cheap to read up front.
+        model_config = ParlerTTSForConditionalGeneration.config_class.from_pretrained(
+            source, **loader.pretrained_kwargs(model_repo)
         )
-        text_encoder = getattr(model.config, "text_encoder", None)
+        # Taken before from_pretrained, which writes the load dtype back into the config it is handed.
+        config_json = model_config.to_json_string()
+        text_encoder = getattr(model_config, "text_encoder", None)
         description_tokenizer_id = getattr(text_encoder, "_name_or_path", None) or model_repo
-        description_tokenizer = AutoTokenizer.from_pretrained(
-            description_tokenizer_id,
-            token=self._settings.hf_token if self._settings.hf_token else None,
+        description_source = loader.resolve(description_tokenizer_id)
+        resolve_seconds = round(perf_counter() - started, 3)
+        processed_path = (
+            loader.processed_model_path(model_repo, f"parler:{inference_mode}:{torch_dtype}:{torch_module.__version__}")
+            if device == "cpu"
+            else None
+        )
+
+        def load_model():
+            processed = loader.load_processed(
+                processed_path,
+                config_json,
+                lambda: self._processed_skeleton(
+                    lambda: ParlerTTSForConditionalGeneration(model_config).to(torch_dtype),
+                    source,
+                    model_repo,
+                    inference_mode,
+                    torch_module,
+                ),
+                torch_module,
+            )
+            if processed is not None:
+                return processed, True
+            model = ParlerTTSForConditionalGeneration.from_pretrained(
+                source,
+                config=model_config,
+                torch_dtype=torch_dtype,
+                **loader.pretrained_kwargs(model_repo, weights=True),
+            )
+            return model, False
+
+        components, load_seconds = loader.load_components(
+            {
+                "model": load_model,
+                "prompt_tokenizer": lambda: AutoTokenizer.from_pretrained(
+                    source, **loader.pretrained_kwargs(model_repo)
+                ),
+                "description_tokenizer": lambda: AutoTokenizer.from_pretrained(
+                    description_source, **loader.pretrained_kwargs(description_tokenizer_id)
+                ),
+            }
         )
+        model, reused_processed = components["model"]
+
+        started = perf_counter()
+        onnx_text_encoder = None
+        if device == "cpu" and normalize_backend(self._settings.local_backend_parler) == "onnx":
+            onnx_text_encoder = self._onnx.prepare_text_encoder(
+                model, f"{model_repo}:{loader.revision(model_repo) or ''}", torch_module
+            )
+        autocast_dtype = None
+        if reused_processed:
+            autocast_dtype = autocast_dtype_for_mode(inference_mode, torch_module)
+        else:
+            model = model.to(device)
+            if device == "cpu":
+                model, autocast_dtype = apply_inference_mode(model.eval(), inference_mode, torch_module)
+                loader.save_processed(processed_path, config_json, model, torch_module)
+        model = model.eval()
+        if onnx_text_encoder is not None:
+            # Attached after the processed-model save, which must describe the plain torch module.
+            self._onnx.attach_text_encoder(model, onnx_text_encoder, torch_module)
+        compiled = self._profile.apply_to_model(model, torch_module)
+        load_seconds.update(resolve=resolve_seconds, postprocess=round(perf_counter() - started, 3))
         return {
             "kind": "parler",
+            "model_repo": model_repo,
             "model": model,
-            "prompt_tokenizer": prompt_tokenizer,
-            "description_tokenizer": description_tokenizer,
+            "prompt_tokenizer": components["prompt_tokenizer"],
+            "description_tokenizer": components["description_tokenizer"],
+            "description_cache": DescriptionConditioningCache(
+                max_entries=self._settings.parler_description_cache_size,
+                persist_dir=self._settings.parler_description_cache_dir,
+                namespace=description_cache_namespace(
+                    model_repo,
+                    # The snapshot commit transformers resolved, so unpinned repos are keyed by content too.
+                    getattr(model_config, "_commit_hash", None) or loader.revision(model_repo),
+                    torch_dtype,
+                    inference_mode,
+                    "onnx" if onnx_text_encoder is not None else "torch",
+                ),
+            ),
             "device": device,
+            "inference_mode": inference_mode,
+            "autocast_dtype": autocast_dtype,
+            "static_cache": self._profile.static_cache,
+            "compile_cache_pending": compiled,
+            "load_seconds": load_seconds,
+            "processed_model_reused": reused_processed,
+            "backends": {"text_encoder": "onnx" if onnx_text_encoder is not None else "torch"},
         }
 
+    def _processed_skeleton(
+        self, build: Callable[[], Any], source: str, model_repo: str, inference_mode: str, torch_module
+    ) -> Any:
+        # The module structure a processed state dict is loaded into: built from config without weight
+        # init (every tensor is replaced by the saved one) and given the same inference-mode transform.
+        try:
+            from transformers.modeling_utils import no_init_weights
+        except ImportError:
+            no_init_weights = nullcontext
+        with no_init_weights():
+            model = build()
+        if inference_mode == "int8":
+            # Uninitialized memory can hold NaNs, which dynamic quantization cannot observe.
+            with torch_module.no_grad():
+                for module in model.modules():
+                    if isinstance(module, torch_module.nn.Linear):
+                        module.weight.zero_()
+        model, _ = apply_inference_mode(model.eval(), inference_mode, torch_module)
+        try:
+            from transformers import GenerationConfig
+
+            # from_pretrained would have read the repo's generation defaults; from_config does not.
+            model.generation_config = GenerationConfig.from_pretrained(
+                source, **self._model_loader.pretrained_kwargs(model_repo)
+            )
+        except Exception:  # noqa: BLE001
+            pass
+        return model
+
     def _load_veena_runtime(self, model_repo: str, device_pref: str, torch_module):
         try:
-            from transformers import AutoModelForCausalLM, AutoTokenizer
+            from transformers import AutoConfig, AutoModelForCausalLM, AutoTokenizer
         except ImportError as exc:
             raise DependencyMissingError("transformers is required for Veena runtime") from exc
         try:
@@ -230,39 +649,127 @@ class HFLocalRuntime:
         except ImportError as exc:
             raise DependencyMissingError("snac is required for Veena runtime. Install with `pip install snac`.") from exc
 
-        token_kwargs: dict[str, Any] = {}
-        if self._settings.hf_token:
-            token_kwargs["token"] = self._settings.hf_token
-
         use_cuda = device_pref.startswith("cuda") and torch_module.cuda.is_available()
-        model_kwargs: dict[str, Any] = {
-            "trust_remote_code": True,
-            "torch_dtype": torch_module.float16 if use_cuda else torch_module.float32,
-        }
-
+        inference_mode = "fp32"
+        if not use_cuda:
+            inference_mode = resolve_cpu_inference_mode(
+                self._settings.local_inference_mode_veena, torch_module, model_label=model_repo
+            )
+        torch_dtype = torch_module.float16 if use_cuda else load_dtype_for_mode(inference_mode, torch_module)
+
+        loader = self._model_loader
+        started = perf_counter()
+        source = loader.resolve(model_repo)
+        snac_source = loader.resolve(_SNAC_REPO)
         try:
-            model = AutoModelForCausalLM.from_pretrained(model_repo, **token_kwargs, **model_kwargs)
-            if use_cuda:
-                model = model.to("cuda:0")
-            model = model.eval()
+            model_config = AutoConfig.from_pretrained(
+                source, trust_remote_code=True, **loader.pretrained_kwargs(model_repo)
+            )
         except Exception as exc:  # noqa: BLE001
-            raise ModelUnavailableError(f"Failed to load Veena model '{model_repo}': {exc}") from exc
+            raise ModelUnavailableError(f"Failed to load Veena config '{model_repo}': {exc}") from exc
+        config_json = model_config.to_json_string()
+        resolve_seconds = round(perf_counter() - started, 3)
+        processed_path = (
+            None
+            if use_cuda
+            else loader.processed_model_path(model_repo, f"veena:{inference_mode}:{torch_module.__version__}")
+        )
 
-        try:
-            tokenizer = AutoTokenizer.from_pretrained(model_repo, trust_remote_code=True, **token_kwargs)
-        except Exception as exc:  # noqa: BLE001
-            raise ModelUnavailableError(f"Failed to load Veena tokenizer '{model_repo}': {exc}") from exc
+        def load_model():
+            processed = loader.load_processed(
+                processed_path,
+                config_json,
+                lambda: self._processed_skeleton(
+                    lambda: AutoModelForCausalLM.from_config(
+                        model_config, trust_remote_code=True, torch_dtype=torch_dtype
+                    ),
+                    source,
+                    model_repo,
+                    inference_mode,
+                    torch_module,
+                ),
+                torch_module,
+            )
+            if processed is not None:
+                return processed, True
+            try:
+                model = AutoModelForCausalLM.from_pretrained(
+                    source,
+                    trust_remote_code=True,
+                    torch_dtype=torch_dtype,
+                    **loader.pretrained_kwargs(model_repo, weights=True),
+                )
+            except Exception as exc:  # noqa: BLE001
+                raise ModelUnavailableError(f"Failed to load Veena model '{model_repo}': {exc}") from exc
+            return model, False
+
+        def load_tokenizer():
+            try:
+                return AutoTokenizer.from_pretrained(
+                    source, trust_remote_code=True, **loader.pretrained_kwargs(model_repo)
+                )
+            except Exception as exc:  # noqa: BLE001
+                raise ModelUnavailableError(f"Failed to load Veena tokenizer '{model_repo}': {exc}") from exc
 
+        def load_snac():
+            try:
+                snac_model = SNAC.from_pretrained(snac_source).eval()
+                return snac_model.cuda() if use_cuda else snac_model
+            except Exception as exc:  # noqa: BLE001
+                raise ModelUnavailableError(f"Failed to load SNAC decoder for Veena: {exc}") from exc
+
+        components, load_seconds = loader.load_components(
+            {"model": load_model, "tokenizer": load_tokenizer, "snac_model": load_snac}
+        )
+        model, reused_processed = components["model"]
+
+        started = perf_counter()
+        autocast_dtype = None
         try:
-            snac_model = SNAC.from_pretrained("hubertsiuzdak/snac_24khz")
             if use_cuda:
-                snac_model = snac_model.eval().cuda()
-            else:
-                snac_model = snac_model.eval()
+                model = model.to("cuda:0")
+            model = model.eval()
+            if reused_processed:
+                autocast_dtype = autocast_dtype_for_mode(inference_mode, torch_module)
+            elif not use_cuda:
+                model, autocast_dtype = apply_inference_mode(model, inference_mode, torch_module)
+                # Saved before the LM-head swap: the restricted head is rebuilt on every load.
+                loader.save_processed(processed_path, config_json, model, torch_module)
+            audio_vocab_only = self._settings.veena_audio_vocab_only
+            restricted_head = audio_vocab_only and restrict_lm_head_to_audio_vocab(model, torch_module)
+            compiled = self._profile.apply_to_model(model, torch_module)
         except Exception as exc:  # noqa: BLE001
-            raise ModelUnavailableError(f"Failed to load SNAC decoder for Veena: {exc}") from exc
+            raise ModelUnavailableError(f"Failed to load Veena model '{model_repo}': {exc}") from exc
+        snac_model = components["snac_model"]
+        snac_backend = "torch"
+        if not use_cuda and normalize_backend(self._settings.local_backend_snac) == "onnx":
+            onnx_snac = self._onnx.snac_decoder(
+                snac_model, f"{_SNAC_REPO}:{loader.revision(_SNAC_REPO) or ''}", torch_module
+            )
+            if onnx_snac is not None:
+                snac_model, snac_backend = onnx_snac, "onnx"
+        load_seconds.update(resolve=resolve_seconds, postprocess=round(perf_counter() - started, 3))
 
-        return {"kind": "veena", "model": model, "tokenizer": tokenizer, "snac_model": snac_model}
+        return {
+            "kind": "veena",
+            "model_repo": model_repo,
+            "model": model,
+            "tokenizer": components["tokenizer"],
+            "snac_model": snac_model,
+            "audio_vocab_only": audio_vocab_only,
+            "restricted_lm_head": restricted_head,
+            # generate() rejects an explicit past_key_values together with a static cache implementation.
+            "prefix_cache": None
+            if self._profile.static_cache
+            else PrefixKVCache(budget_bytes=self._settings.veena_prefix_cache_mb * 2**20),
+            "inference_mode": inference_mode,
+            "autocast_dtype": autocast_dtype,
+            "static_cache": self._profile.static_cache,
+            "compile_cache_pending": compiled,
+            "load_seconds": load_seconds,
+            "processed_model_reused": reused_processed,
+            "backends": {"snac": snac_backend},
+        }
 
     def _run_parler(self, runtime: dict[str, Any], text: str, config: dict[str, Any]) -> bytes:
         try:
@@ -286,34 +793,114 @@ class HFLocalRuntime:
         description = f"{base_description.rstrip('. ')}. {style_hint}" if style_hint else base_description
         prompt_text = str(text)
 
-        description_inputs = description_tokenizer(description, return_tensors="pt")
-        prompt_inputs = prompt_tokenizer(prompt_text, return_tensors="pt")
-        input_ids = description_inputs.input_ids.to(device)
-        attention_mask = description_inputs.attention_mask.to(device)
-        prompt_input_ids = prompt_inputs.input_ids.to(device)
-        prompt_attention_mask = prompt_inputs.attention_mask.to(device)
+        model_key = self._model_key(runtime)
+        # On a description-cache miss this stage also includes the text-encoder pass.
+        with self._stages.measure(model_key, "tokenize"):
+            conditioning = self._description_conditioning(runtime, description_tokenizer, description, torch)
+            prompt_inputs = prompt_tokenizer(prompt_text, return_tensors="pt")
+            prompt_input_ids = prompt_inputs.input_ids.to(device)
+            prompt_attention_mask = prompt_inputs.attention_mask.to(device)
         max_new_tokens = self._bounded_max_new_tokens(config=config, text=prompt_text)
+        budget_key = self._budget_key(runtime, config)
+        budget = None if "max_new_tokens" in config else self._token_budgets.estimate(budget_key, prompt_text)
+        # Decoder steps also cover the codebook delay pattern, so budgets are in frames plus this offset.
+        num_codebooks = int(getattr(getattr(model.config, "decoder", None), "num_codebooks", 0) or 0)
+        if budget is not None:
+            max_new_tokens = max(64, min(2048, budget.max_new_tokens + num_codebooks))
+        if runtime.get("static_cache"):
+            max_new_tokens = self._profile.bucket_max_new_tokens(max_new_tokens)
         temperature = self._coerce_optional_float(config.get("temperature"), 1.0)
-        generation_kwargs: dict[str, Any] = {"max_new_tokens": max_new_tokens}
+        step_timer = FirstStepTimer()
+        cancel_token = current_request_context().cancel_token
+        generation_kwargs: dict[str, Any] = {
+            "max_new_tokens": max_new_tokens,
+            "logits_processor": self._logits_processor_list([step_timer]),
+            "stopping_criteria": self._stopping_criteria_list([CancellationStoppingCriteria(cancel_token)]),
+        }
+        if conditioning.encoder_outputs is not None:
+            # Cached description encoding: generate skips the text-encoder pass entirely.
+            generation_kwargs["encoder_outputs"] = conditioning.encoder_outputs
         if temperature != 1.0:
             generation_kwargs["do_sample"] = True
             generation_kwargs["temperature"] = max(0.1, min(2.0, temperature))
 
+        generation_started = perf_counter()
         try:
-            with torch.no_grad():
+            with torch.no_grad(), self._autocast(runtime, torch):
                 generation = model.generate(
-                    input_ids=input_ids,
-                    attention_mask=attention_mask,
+                    input_ids=conditioning.input_ids,
+                    attention_mask=conditioning.attention_mask,
                     prompt_input_ids=prompt_input_ids,
                     prompt_attention_mask=prompt_attention_mask,
                     **generation_kwargs,
                 )
         except Exception as exc:  # noqa: BLE001
             raise ModelUnavailableError(f"Parler generation failed: {exc}") from exc
+        if cancel_token.cancelled:
+            raise self._record_cancellation(runtime, "generate")
+
+        generation_finished = perf_counter()
+        generation_seconds = generation_finished - generation_started
+        # Parler decodes the codec inside generate(), so "decode" includes the DAC pass.
+        self._stages.record_generate(model_key, generation_started, step_timer.first_step_at, generation_finished)
 
-        audio_arr = generation.cpu().numpy().squeeze()
+        audio_arr = generation.cpu().float().numpy().squeeze()
         sample_rate = int(getattr(model.config, "sampling_rate", 24000))
-        return self._array_to_wav_bytes(audio_arr, sample_rate)
+        # Parler returns decoded audio, so decoder steps are recovered from the codec frame rate.
+        frame_rate = getattr(getattr(model.config, "audio_encoder", None), "frame_rate", None)
+        generated_frames = int(audio_arr.shape[-1] * frame_rate / sample_rate) if frame_rate else 0
+        self._record_generation(runtime, generated_frames, generation_seconds)
+        if generated_frames:
+            # Within one frame of the step cap means generate() was cut off rather than reaching EOS.
+            capped = generated_frames + num_codebooks >= max_new_tokens - 1
+            self._token_budgets.observe(budget_key, prompt_text, generated_frames, "max_tokens" if capped else "eos")
+        with self._stages.measure(model_key, "wav_encode"):
+            return self._array_to_wav_bytes(audio_arr, sample_rate)
+
+    def _description_conditioning(
+        self,
+        runtime: dict[str, Any],
+        description_tokenizer: Any,
+        description: str,
+        torch_module,
+    ) -> DescriptionConditioning:
+        device = runtime["device"]
+        cache: DescriptionConditioningCache | None = runtime.get("description_cache")
+        if cache is not None and cache.enabled:
+            cached = cache.get(description, device)
+            if cached is not None:
+                return cached
+
+        description_inputs = description_tokenizer(description, return_tensors="pt")
+        conditioning = DescriptionConditioning(
+            input_ids=description_inputs.input_ids.to(device),
+            attention_mask=description_inputs.attention_mask.to(device),
+        )
+        if cache is None or not cache.enabled:
+            return conditioning
+        conditioning.encoder_outputs = self._encode_description(runtime, conditioning, torch_module)
+        cache.put(description, conditioning)
+        return conditioning
+
+    def _encode_description(self, runtime: dict[str, Any], conditioning: DescriptionConditioning, torch_module):
+        # Reuse Parler's own generate-time encoder preparation so cached outputs match what
+        # generate would have computed (including any encoder-to-decoder projection).
+        model = runtime["model"]
+        prepare = getattr(model, "_prepare_text_encoder_kwargs_for_generation", None)
+        if prepare is None:
+            return None
+        try:
+            with torch_module.no_grad(), self._autocast(runtime, torch_module):
+                model_kwargs = prepare(
+                    conditioning.input_ids,
+                    {"attention_mask": conditioning.attention_mask},
+                    "input_ids",
+                    copy.deepcopy(model.generation_config),
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("parler_description_encode_failed", error=str(exc))
+            return None
+        return model_kwargs.get("encoder_outputs")
 
     def _run_veena(self, runtime: dict[str, Any], text: str, config: dict[str, Any]) -> bytes:
         try:
@@ -325,30 +912,49 @@ class HFLocalRuntime:
         tokenizer = runtime["tokenizer"]
         snac_model = runtime["snac_model"]
 
-        speaker = str(config.get("speaker") or "kavya").strip().lower()
-        if speaker not in self._VEENA_SPEAKERS:
-            speaker = "kavya"
-
-        # Model-card constants for Veena audio-token decoding.
-        start_of_speech = 128257
-        end_of_speech = 128258
-        start_of_human = 128259
-        end_of_human = 128260
-        start_of_ai = 128261
-        end_of_ai = 128262
-        audio_code_base_offset = 128266
-        llm_codebook_offsets = [audio_code_base_offset + i * 4096 for i in range(7)]
+        speaker = self._veena_speaker(config)
+
+        start_of_speech = START_OF_SPEECH
+        start_of_human = START_OF_HUMAN
+        end_of_human = END_OF_HUMAN
+        start_of_ai = START_OF_AI
+        audio_code_base_offset = AUDIO_CODE_BASE_OFFSET
+        llm_codebook_offsets = [audio_code_base_offset + i * AUDIO_CODEBOOK_SIZE for i in range(7)]
 
         style_prompt = str(config.get("prompt") or "").strip()
         veena_text = f"{style_prompt}. {text}" if style_prompt else text
-        prompt = f"<spk_{speaker}> {veena_text}"
-        prompt_tokens = tokenizer.encode(prompt, add_special_tokens=False)
-        input_tokens = [start_of_human, *prompt_tokens, end_of_human, start_of_ai, start_of_speech]
+        prefix_cache: PrefixKVCache | None = runtime.get("prefix_cache")
+        model_key = self._model_key(runtime)
+        with self._stages.measure(model_key, "tokenize"):
+            if prefix_cache is not None and prefix_cache.enabled:
+                # Same prompt string, split at the space before the transcript so the speaker/style
+                # prefix tokenizes identically across requests and its KV cache can be reused.
+                prefix_text = f"<spk_{speaker}> {style_prompt}." if style_prompt else f"<spk_{speaker}>"
+                prefix_tokens = [start_of_human, *tokenizer.encode(prefix_text, add_special_tokens=False)]
+                suffix_tokens = tokenizer.encode(f" {text}", add_special_tokens=False)
+                input_tokens = [*prefix_tokens, *suffix_tokens, end_of_human, start_of_ai, start_of_speech]
+            else:
+                prompt = f"<spk_{speaker}> {veena_text}"
+                prompt_tokens = tokenizer.encode(prompt, add_special_tokens=False)
+                prefix_tokens = []
+                input_tokens = [start_of_human, *prompt_tokens, end_of_human, start_of_ai, start_of_speech]
 
         max_new_tokens = self._bounded_max_new_tokens(config=config, text=veena_text)
-        if "max_new_tokens" not in config:
-            inferred = min(max(int(len(veena_text) * 1.3) * 7 + 21, 128), 700)
-            max_new_tokens = max(max_new_tokens, inferred)
+        budget_key = self._budget_key(runtime, config)
+        budget = (
+            None
+            if "max_new_tokens" in config
+            else self._token_budgets.estimate(budget_key, text, frame_tokens=AUDIO_CODES_PER_FRAME)
+        )
+        if budget is not None:
+            max_new_tokens = max(64, min(2048, budget.max_new_tokens))
+            min_new_tokens = min(budget.min_new_tokens, max_new_tokens)
+        else:
+            if "max_new_tokens" not in config:
+                inferred = min(max(int(len(veena_text) * 1.3) * 7 + 21, 128), 700)
+                max_new_tokens = max(max_new_tokens, inferred)
+            # Uncalibrated: a third of the budget, in whole frames, guards against an early end-of-speech.
+            min_new_tokens = min(512, max_new_tokens // 3) // AUDIO_CODES_PER_FRAME * AUDIO_CODES_PER_FRAME
 
         try:
             model_device = next(model.parameters()).device
@@ -357,13 +963,36 @@ class HFLocalRuntime:
 
         temperature = self._coerce_optional_float(config.get("temperature"), 0.4)
         top_p = self._coerce_optional_float(config.get("top_p"), 0.9)
-        min_new_tokens = max(128, min(512, max_new_tokens // 3))
+        if runtime.get("static_cache"):
+            max_new_tokens = self._profile.bucket_max_new_tokens(max_new_tokens)
 
         input_ids = torch.tensor([input_tokens], device=model_device)
+        generation_kwargs: dict[str, Any] = {}
+        generation_started = perf_counter()
+        if prefix_cache is not None and prefix_cache.accepts(prefix_tokens):
+            past_key_values = self._veena_prefix_past(runtime, prefix_cache, prefix_tokens, model_device, torch)
+            if past_key_values is not None:
+                generation_kwargs["past_key_values"] = past_key_values
+        step_timer = FirstStepTimer()
+        logits_processors: list[Any] = [step_timer]
+        eos_token_ids = [END_OF_SPEECH, END_OF_AI]
+        if runtime.get("audio_vocab_only"):
+            # Speech starts right after the prompt: only SNAC codes and end-of-speech are valid.
+            logits_processors.append(AudioTokenLogitsProcessor(head_restricted=bool(runtime.get("restricted_lm_head"))))
+            eos_token_ids = [END_OF_SPEECH]
+        generation_kwargs["eos_token_id"] = eos_token_ids
+        generation_kwargs["logits_processor"] = self._logits_processor_list(logits_processors)
+        cancel_token = current_request_context().cancel_token
+        stopping_criteria: list[Any] = [CancellationStoppingCriteria(cancel_token)]
+        repetition = RepeatingFrameStoppingCriteria(len(input_tokens), self._settings.veena_repeat_frame_limit)
+        if self._settings.veena_repeat_frame_limit > 0:
+            stopping_criteria.append(repetition)
+        generation_kwargs["stopping_criteria"] = self._stopping_criteria_list(stopping_criteria)
         try:
-            with torch.no_grad():
+            with torch.no_grad(), self._autocast(runtime, torch):
                 output = model.generate(
                     input_ids,
+                    **generation_kwargs,
                     min_new_tokens=min_new_tokens,
                     max_new_tokens=max_new_tokens,
                     do_sample=True,
@@ -374,13 +1003,26 @@ class HFLocalRuntime:
                 )
         except Exception as exc:  # noqa: BLE001
             raise ModelUnavailableError(f"Veena generation failed: {exc}") from exc
+        if cancel_token.cancelled:
+            raise self._record_cancellation(runtime, "generate")
 
+        generation_finished = perf_counter()
+        self._stages.record_generate(model_key, generation_started, step_timer.first_step_at, generation_finished)
         generated_ids = output[0][len(input_tokens) :].tolist()
+        self._record_generation(runtime, len(generated_ids), generation_finished - generation_started)
+        if repetition.triggered:
+            stop_reason = "repetition"
+            generated_ids = generated_ids[: len(generated_ids) - repetition.repeated_tokens]
+        elif generated_ids and generated_ids[-1] in eos_token_ids:
+            stop_reason = "eos"
+        else:
+            stop_reason = "max_tokens"
         snac_tokens = [
             token_id
             for token_id in generated_ids
-            if audio_code_base_offset <= token_id < (audio_code_base_offset + 7 * 4096)
+            if audio_code_base_offset <= token_id < AUDIO_CODE_END
         ]
+        self._token_budgets.observe(budget_key, text, len(snac_tokens), stop_reason)
         if not snac_tokens:
             raise ModelUnavailableError("Veena generated no audio tokens")
 
@@ -413,13 +1055,73 @@ class HFLocalRuntime:
             hierarchical_codes.append(tensor)
 
         try:
-            with torch.no_grad():
-                audio_hat = snac_model.decode(hierarchical_codes)
+            with torch.no_grad(), self._stages.measure(model_key, "snac_decode"):
+                audio_hat = decode_snac_windowed(
+                    snac_model,
+                    hierarchical_codes,
+                    window_frames=self._settings.veena_snac_window_frames,
+                    context_frames=_SNAC_CONTEXT_FRAMES,
+                    is_cancelled=lambda: cancel_token.cancelled,
+                    torch_module=torch,
+                )
+        except GenerationCancelledError:
+            raise self._record_cancellation(runtime, "snac_decode") from None
         except Exception as exc:  # noqa: BLE001
             raise ModelUnavailableError(f"SNAC decode failed for Veena: {exc}") from exc
 
         audio_arr = audio_hat.squeeze().clamp(-1, 1).cpu().numpy()
-        return self._array_to_wav_bytes(audio_arr, 24000)
+        with self._stages.measure(model_key, "wav_encode"):
+            return self._array_to_wav_bytes(audio_arr, 24000)
+
+    def _veena_prefix_past(
+        self,
+        runtime: dict[str, Any],
+        prefix_cache: PrefixKVCache,
+        prefix_tokens: list[int],
+        model_device,
+        torch_module,
+    ):
+        cached = prefix_cache.lookup(prefix_tokens)
+        if cached is not None:
+            return cached
+        try:
+            from transformers import DynamicCache
+
+            with torch_module.no_grad(), self._autocast(runtime, torch_module):
+                prefill = runtime["model"](
+                    input_ids=torch_module.tensor([prefix_tokens], device=model_device),
+                    past_key_values=DynamicCache(),
+                    use_cache=True,
+                )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("veena_prefix_prefill_failed", error=str(exc))
+            return None
+        prefix_cache.store(prefix_tokens, prefill.past_key_values)
+        # generate extends the cache in place, so the stored original stays untouched.
+        return copy.deepcopy(prefill.past_key_values)
+
+    @staticmethod
+    def _logits_processor_list(processors: list[Any]) -> Any:
+        try:
+            from transformers import LogitsProcessorList
+        except ImportError:
+            return processors
+        return LogitsProcessorList(processors)
+
+    @staticmethod
+    def _stopping_criteria_list(criteria: list[Any]) -> Any:
+        try:
+            from transformers import StoppingCriteriaList
+        except ImportError:
+            return criteria
+        return StoppingCriteriaList(criteria)
+
+    @staticmethod
+    def _autocast(runtime: dict[str, Any], torch_module):
+        autocast_dtype = runtime.get("autocast_dtype")
+        if autocast_dtype is None:
+            return nullcontext()
+        return torch_module.autocast(device_type="cpu", dtype=autocast_dtype)
 
     @staticmethod
     def _coerce_optional_float(value: Any, default: float) -> float:
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+from app.domain.errors import ModelUnavailableError
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_model_revisions(raw: str) -> dict[str, str]:
+    # "org/model=<commit>,org/other=<tag>" -> {"org/model": "<commit>", ...}
+    revisions: dict[str, str] = {}
+    for item in raw.split(","):
+        repo_id, sep, revision = item.strip().partition("=")
+        if sep and repo_id.strip() and revision.strip():
+            revisions[repo_id.strip()] = revision.strip()
+    return revisions
+
+
+class ModelLoader:
+    # Resolves self-hosted repos (optionally from a pinned, offline local snapshot), loads the
+    # independent components of a runtime concurrently and records how long each one took.
+    def __init__(self, settings: Settings):
+        self._settings = settings
+        self._offline = settings.local_offline
+        self._revisions = parse_model_revisions(settings.local_model_revisions)
+        self._concurrent = settings.local_concurrent_loading
+        self._processed_dir = Path(settings.local_processed_model_dir) if settings.local_processed_model_dir else None
+
+    def revision(self, repo_id: str) -> str | None:
+        return self._revisions.get(repo_id)
+
+    def resolve(self, repo_id: str) -> str:
+        # Offline mode hands from_pretrained a local directory, so no Hub metadata request is made.
+        if not self._offline or Path(repo_id).is_dir():
+            return repo_id
+        try:
+            from huggingface_hub import snapshot_download
+
+            return snapshot_download(
+                repo_id,
+                revision=self.revision(repo_id),
+                local_files_only=True,
+                token=self._settings.hf_token,
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise ModelUnavailableError(
+                f"'{repo_id}' is not available in the local snapshot cache (LOCAL_OFFLINE=true). "
+                f"Prefetch it with `huggingface-cli download {repo_id}`: {exc}"
+            ) from exc
+
+    def pretrained_kwargs(self, repo_id: str, weights: bool = False) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {}
+        if self._settings.hf_token:
+            kwargs["token"] = self._settings.hf_token
+        if self._offline:
+            # Per call rather than HF_HUB_OFFLINE, which is process-wide and read once at hub import.
+            kwargs["local_files_only"] = True
+        elif revision := self.revision(repo_id):
+            kwargs["revision"] = revision
+        if weights:
+            # Safetensors checkpoints are memory-mapped and materialized straight into the final dtype.
+            kwargs["low_cpu_mem_usage"] = True
+        return kwargs
+
+    def load_components(self, loaders: dict[str, Callable[[], Any]]) -> tuple[dict[str, Any], dict[str, float]]:
+        timings: dict[str, float] = {}
+
+        def timed(name: str, loader: Callable[[], Any]) -> Any:
+            started = perf_counter()
+            try:
+                return loader()
+            finally:
+                timings[name] = round(perf_counter() - started, 3)
+
+        if not self._concurrent or len(loaders) < 2:
+            return {name: timed(name, loader) for name, loader in loaders.items()}, timings
+
+        with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="model-load") as executor:
+            futures = {name: executor.submit(timed, name, loader) for name, loader in loaders.items()}
+            # Wait for every component before raising so no loader thread outlives the failed load.
+            errors = [future.exception() for future in futures.values()]
+        first_error = next((error for error in errors if error is not None), None)
+        if first_error is not None:
+            raise first_error
+        return {name: future.result() for name, future in futures.items()}, timings
+
+    def processed_model_path(self, repo_id: str, variant: str) -> Path | None:
+        if self._processed_dir is None:
+            return None
+        key = hashlib.sha256(f"{repo_id}\0{self.revision(repo_id) or ''}\0{variant}".encode("utf-8")).hexdigest()[:16]
+        return self._processed_dir / f"{re.sub(r'[^A-Za-z0-9_.-]+', '--', repo_id)}-{key}.pt"
+
+    def load_processed(
+        self, path: Path | None, config_json: str, build_skeleton: Callable[[], Any], torch_module
+    ) -> Any | None:
+        # Only a state dict is read back (weights_only: nothing in the cache directory is unpickled as code),
+        # into a model built from the repo's own config. The config saved alongside must match it.
+        if path is None or not path.exists():
+            return None
+        try:
+            if _config_path(path).read_text(encoding="utf-8") != config_json:
+                logger.info("processed_model_stale", path=str(path))
+                return None
+            # mmap keeps the reload near-instant: pages are faulted in as the first generation touches them.
+            state_dict = torch_module.load(path, mmap=True, weights_only=True, map_location="cpu")
+            model = build_skeleton()
+            model.load_state_dict(state_dict, assign=True)
+            return model
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("processed_model_load_failed", path=str(path), error=str(exc))
+            return None
+
+    def save_processed(self, path: Path | None, config_json: str, model: Any, torch_module) -> None:
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            torch_module.save(model.state_dict(), tmp_path)
+            config_tmp_path = path.with_suffix(".json.tmp")
+            config_tmp_path.write_text(config_json, encoding="utf-8")
+            tmp_path.replace(path)
+            config_tmp_path.replace(_config_path(path))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("processed_model_save_failed", path=str(path), error=str(exc))
+
+
+def _config_path(path: Path) -> Path:
+    return path.with_suffix(".json")
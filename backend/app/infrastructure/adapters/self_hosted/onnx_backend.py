@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import re
+from pathlib import Path
+from typing import Any
+
+from app.domain.errors import DependencyMissingError
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+EXECUTION_BACKENDS = ("torch", "onnx")
+_OPSET = 17
+
+
+def normalize_backend(raw: str | None) -> str:
+    value = (raw or "torch").strip().lower()
+    return value if value in EXECUTION_BACKENDS else "torch"
+
+
+class OnnxSnacDecoder:
+    # Drop-in for SNAC.decode(): same list-of-code-tensors input, same [1, 1, samples] tensor output.
+    def __init__(self, session: Any, torch_module):
+        self._session = session
+        self._torch = torch_module
+
+    def parameters(self):
+        return iter(())
+
+    def decode(self, hierarchical_codes: list[Any]) -> Any:
+        feeds = {
+            f"codes_{level}": codes.detach().cpu().numpy().astype("int64")
+            for level, codes in enumerate(hierarchical_codes)
+        }
+        (audio,) = self._session.run(["audio"], feeds)
+        return self._torch.from_numpy(audio)
+
+
+class OnnxBackend:
+    # Exports SNAC's decoder and Parler's text encoder to ONNX once (artifacts are cached on disk
+    # and keyed by source + torch version) and runs them in tuned CPU inference sessions.
+    def __init__(self, settings: Settings, intra_op_threads: int, parallel_generations: int):
+        self._cache_dir = Path(settings.local_onnx_cache_dir)
+        self._threads = settings.local_onnx_threads or intra_op_threads
+        self._parallel_generations = parallel_generations
+
+    def artifact_path(self, name: str, source: str, torch_module) -> Path:
+        key = hashlib.sha256(f"{source}\0{torch_module.__version__}\0{_OPSET}".encode("utf-8")).hexdigest()[:16]
+        return self._cache_dir / f"{re.sub(r'[^A-Za-z0-9_.-]+', '--', name)}-{key}.onnx"
+
+    def session(self, path: Path) -> Any:
+        ort = self._import_onnxruntime()
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self._threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self._parallel_generations > 1:
+            # Concurrent generations share the cores; spinning idle workers would steal them.
+            options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        return ort.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+
+    def snac_decoder(self, snac_model: Any, source: str, torch_module) -> OnnxSnacDecoder | None:
+        self._import_onnxruntime()
+        path = self.artifact_path("snac-decoder", source, torch_module)
+        if not path.exists():
+
+            class SnacDecode(torch_module.nn.Module):
+                def __init__(self, snac):
+                    super().__init__()
+                    self.snac = snac
+
+                def forward(self, codes_0, codes_1, codes_2):
+                    return self.snac.decode([codes_0, codes_1, codes_2])
+
+            # Level lengths follow SNAC's 1:2:4 stride layout for 4 frames.
+            sample = tuple(torch_module.zeros((1, 4 * 2**level), dtype=torch_module.long) for level in range(3))
+            exported = self._export(
+                SnacDecode(snac_model).eval(),
+                sample,
+                path,
+                input_names=["codes_0", "codes_1", "codes_2"],
+                output_names=["audio"],
+                dynamic_axes={
+                    "codes_0": {1: "frames"},
+                    "codes_1": {1: "frames_x2"},
+                    "codes_2": {1: "frames_x4"},
+                    "audio": {2: "samples"},
+                },
+                torch_module=torch_module,
+            )
+            if not exported:
+                return None
+        return OnnxSnacDecoder(self.session(path), torch_module)
+
+    def prepare_text_encoder(self, model: Any, source: str, torch_module) -> Path | None:
+        # Must run before quantization: dynamically quantized Linear layers do not export.
+        self._import_onnxruntime()
+        path = self.artifact_path("parler-text-encoder", source, torch_module)
+        if path.exists():
+            return path
+
+        class TextEncoder(torch_module.nn.Module):
+            def __init__(self, encoder):
+                super().__init__()
+                self.encoder = encoder
+
+            def forward(self, input_ids, attention_mask):
+                return self.encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+        encoder = copy.deepcopy(model.text_encoder).float().eval()
+        sample_ids = torch_module.ones((1, 8), dtype=torch_module.long)
+        exported = self._export(
+            TextEncoder(encoder),
+            (sample_ids, torch_module.ones_like(sample_ids)),
+            path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            torch_module=torch_module,
+        )
+        return path if exported else None
+
+    def attach_text_encoder(self, model: Any, path: Path, torch_module) -> None:
+        from transformers.modeling_outputs import BaseModelOutput
+
+        session = self.session(path)
+        text_encoder = model.text_encoder
+        output_dtype = next(text_encoder.parameters()).dtype
+
+        # Only the encoder computation moves to ONNX; Parler's own generate-time preparation
+        # (projection, masking) still runs on the returned hidden states.
+        def forward(input_ids=None, attention_mask=None, **kwargs):
+            _ = kwargs
+            if attention_mask is None:
+                attention_mask = torch_module.ones_like(input_ids)
+            (hidden,) = session.run(
+                ["last_hidden_state"],
+                {
+                    "input_ids": input_ids.detach().cpu().numpy().astype("int64"),
+                    "attention_mask": attention_mask.detach().cpu().numpy().astype("int64"),
+                },
+            )
+            hidden_states = torch_module.from_numpy(hidden).to(device=input_ids.device, dtype=output_dtype)
+            return BaseModelOutput(last_hidden_state=hidden_states)
+
+        text_encoder.forward = forward
+
+    def _export(
+        self,
+        module: Any,
+        sample_inputs: tuple[Any, ...],
+        path: Path,
+        input_names: list[str],
+        output_names: list[str],
+        dynamic_axes: dict[str, dict[int, str]],
+        torch_module,
+    ) -> bool:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp.onnx")
+        try:
+            with torch_module.no_grad():
+                torch_module.onnx.export(
+                    module,
+                    sample_inputs,
+                    str(tmp_path),
+                    input_names=input_names,
+                    output_names=output_names,
+                    dynamic_axes=dynamic_axes,
+                    opset_version=_OPSET,
+                    do_constant_folding=True,
+                )
+            tmp_path.replace(path)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("onnx_export_failed", artifact=path.name, error=str(exc))
+            tmp_path.unlink(missing_ok=True)
+            return False
+        logger.info("onnx_exported", artifact=str(path))
+        return True
+
+    @staticmethod
+    def _import_onnxruntime():
+        try:
+            import onnxruntime
+        except ImportError as exc:
+            raise DependencyMissingError(
+                "onnxruntime is required for the ONNX execution backend. Install with `pip install onnxruntime`."
+            ) from exc
+        return onnxruntime
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import inspect
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+PIPELINE_TASKS = ("text-to-speech", "text-to-audio")
+_STYLE_KWARGS = ("description", "prompt")
+_PROFILE_VERSION = 2
+
+
+def profile_dir(settings: Settings) -> Path:
+    base = settings.hf_cache_dir or settings.hf_home or os.environ.get("HF_HOME") or "~/.cache/huggingface"
+    return Path(base).expanduser() / "tanglish_tts_profiles"
+
+
+def _transformers_version() -> str:
+    try:
+        import transformers
+    except ImportError:
+        return ""
+    return str(getattr(transformers, "__version__", ""))
+
+
+@dataclass
+class PipelineCapabilityProfile:
+    # What a generic HF pipeline accepts, discovered once at load so inference never probes by exception.
+    model_repo: str
+    task: str
+    style_kwargs: list[str]
+    length_kwarg: str | None
+    max_length: int | None = None
+    max_positions: int | None = None
+    transformers_version: str = ""
+    version: int = _PROFILE_VERSION
+
+    @classmethod
+    def introspect(cls, model_repo: str, runner: Any, task: str) -> PipelineCapabilityProfile:
+        accepted, open_ended = cls._accepted_kwargs(runner)
+
+        def accepts(name: str) -> bool:
+            return open_ended or name in accepted
+
+        model = getattr(runner, "model", None)
+        can_generate = getattr(model, "can_generate", None)
+        if callable(can_generate) and not can_generate():
+            # Forward-only models (VITS / MMS-TTS): the pipeline still accepts generate_kwargs but raises if
+            # any are passed, and their output length is not token-bounded.
+            length_kwarg: str | None = None
+        elif accepts("max_new_tokens"):
+            length_kwarg = "max_new_tokens"
+        elif accepts("generate_kwargs"):
+            length_kwarg = "generate_kwargs"
+        elif accepts("max_length"):
+            length_kwarg = "max_length"
+        else:
+            length_kwarg = None
+
+        generation_config = getattr(model, "generation_config", None)
+        model_config = getattr(model, "config", None)
+        return cls(
+            model_repo=model_repo,
+            task=getattr(runner, "task", None) or task,
+            style_kwargs=[name for name in _STYLE_KWARGS if accepts(name)],
+            length_kwarg=length_kwarg,
+            max_length=cls._positive_int(getattr(generation_config, "max_length", None)),
+            max_positions=cls._positive_int(getattr(model_config, "max_position_embeddings", None)),
+            transformers_version=_transformers_version(),
+        )
+
+    @staticmethod
+    def _accepted_kwargs(runner: Any) -> tuple[set[str], bool]:
+        # Pipeline.__call__ routes every kwarg through _sanitize_parameters, so its signature is the contract.
+        target = getattr(runner, "_sanitize_parameters", None) or runner
+        try:
+            parameters = inspect.signature(target).parameters.values()
+        except (TypeError, ValueError):
+            return set(), True
+        accepted = {
+            parameter.name
+            for parameter in parameters
+            if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+        }
+        open_ended = any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters)
+        return accepted, open_ended
+
+    @staticmethod
+    def _positive_int(value: Any) -> int | None:
+        try:
+            parsed = int(value)
+        except (TypeError, ValueError):
+            return None
+        return parsed if parsed > 0 else None
+
+    def call_kwargs(
+        self, config: dict[str, Any], max_new_tokens: int, max_length: int, force_length: bool = False
+    ) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {name: config[name] for name in self.style_kwargs if config.get(name)}
+        if not (force_length or self._needs_length(config, max_length)):
+            return kwargs
+        if self.max_positions:
+            max_new_tokens = min(max_new_tokens, self.max_positions)
+            max_length = min(max_length, self.max_positions)
+        if self.length_kwarg == "max_new_tokens":
+            kwargs["max_new_tokens"] = max_new_tokens
+        elif self.length_kwarg == "generate_kwargs":
+            kwargs["generate_kwargs"] = {"max_new_tokens": max_new_tokens}
+        elif self.length_kwarg == "max_length":
+            kwargs["max_length"] = max_length
+        return kwargs
+
+    def _needs_length(self, config: dict[str, Any], max_length: int) -> bool:
+        # The model keeps its own default length unless the request sets one or that default is known to
+        # be too short for the input (transformers' fallback max_length of 20 is, for any real sentence).
+        if config.get("max_new_tokens") or config.get("max_length"):
+            return True
+        return self.max_length is not None and self.max_length < max_length
+
+    @classmethod
+    def load(cls, directory: Path, model_repo: str) -> PipelineCapabilityProfile | None:
+        path = cls._path(directory, model_repo)
+        if not path.exists():
+            return None
+        try:
+            profile = cls(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("pipeline_profile_load_failed", path=str(path), error=str(exc))
+            return None
+        if profile.version != _PROFILE_VERSION or profile.transformers_version != _transformers_version():
+            return None
+        return profile
+
+    def save(self, directory: Path) -> None:
+        path = self._path(directory, self.model_repo)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as exc:
+            logger.warning("pipeline_profile_save_failed", path=str(path), error=str(exc))
+
+    @staticmethod
+    def _path(directory: Path, model_repo: str) -> Path:
+        return directory / f"{re.sub(r'[^A-Za-z0-9_.-]+', '--', model_repo)}.json"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+INFERENCE_MODES = ("fp32", "bf16", "int8")
+
+
+def normalize_inference_mode(raw: str | None) -> str:
+    mode = (raw or "fp32").strip().lower()
+    aliases = {"float32": "fp32", "bfloat16": "bf16", "qint8": "int8", "dynamic_int8": "int8"}
+    mode = aliases.get(mode, mode)
+    return mode if mode in INFERENCE_MODES else "fp32"
+
+
+def cpu_supports_bf16(torch_module) -> bool:
+    # bf16 only pays off with native AVX512-BF16 / AMX kernels; elsewhere it is emulated and slower.
+    cpu = getattr(torch_module, "cpu", None)
+    for probe in ("_is_avx512_bf16_supported", "_is_amx_tile_supported"):
+        check = getattr(cpu, probe, None)
+        if check is None:
+            continue
+        try:
+            if check():
+                return True
+        except Exception:  # noqa: BLE001
+            continue
+    return False
+
+
+def resolve_cpu_inference_mode(raw: str | None, torch_module, model_label: str) -> str:
+    mode = normalize_inference_mode(raw)
+    if mode == "bf16" and not cpu_supports_bf16(torch_module):
+        logger.warning("bf16_unsupported_on_cpu", model=model_label, fallback="fp32")
+        return "fp32"
+    return mode
+
+
+def load_dtype_for_mode(mode: str, torch_module):
+    return torch_module.bfloat16 if mode == "bf16" else torch_module.float32
+
+
+def apply_inference_mode(model: Any, mode: str, torch_module) -> tuple[Any, Any]:
+    # Returns the (possibly quantized) model and the autocast dtype generation should run under.
+    if mode == "int8":
+        model = torch_module.ao.quantization.quantize_dynamic(
+            model,
+            {torch_module.nn.Linear},
+            dtype=torch_module.qint8,
+        )
+        return model, None
+    return model, autocast_dtype_for_mode(mode, torch_module)
+
+
+def autocast_dtype_for_mode(mode: str, torch_module) -> Any:
+    return torch_module.bfloat16 if mode == "bf16" else None
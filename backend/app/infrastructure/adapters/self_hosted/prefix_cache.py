@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+def _cache_tensors(past_key_values: Any) -> list[Any]:
+    key_cache = getattr(past_key_values, "key_cache", None)
+    value_cache = getattr(past_key_values, "value_cache", None)
+    if key_cache is not None and value_cache is not None:
+        return [*key_cache, *value_cache]
+    tensors: list[Any] = []
+    if isinstance(past_key_values, (tuple, list)):
+        for layer in past_key_values:
+            tensors.extend(layer if isinstance(layer, (tuple, list)) else [layer])
+    return tensors
+
+
+def past_key_values_bytes(past_key_values: Any) -> int:
+    total = 0
+    for tensor in _cache_tensors(past_key_values):
+        try:
+            total += tensor.numel() * tensor.element_size()
+        except AttributeError:
+            continue
+    return total
+
+
+@dataclass
+class _PrefixEntry:
+    past_key_values: Any
+    size_bytes: int
+
+
+class PrefixKVCache:
+    # Stores prefilled past_key_values for common prompt prefixes (speaker tag + style prompt),
+    # keyed by the exact prefix token ids. Lookups hand out deep copies because generate
+    # extends the cache in place.
+    def __init__(self, budget_bytes: int, min_prefix_tokens: int = 4):
+        self._budget_bytes = max(0, budget_bytes)
+        self._min_prefix_tokens = min_prefix_tokens
+        self._entries: OrderedDict[tuple[int, ...], _PrefixEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._budget_bytes > 0
+
+    def accepts(self, prefix_ids: list[int]) -> bool:
+        return self.enabled and len(prefix_ids) >= self._min_prefix_tokens
+
+    def lookup(self, prefix_ids: list[int]) -> Any | None:
+        key = tuple(prefix_ids)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            cached = entry.past_key_values
+        return copy.deepcopy(cached)
+
+    def store(self, prefix_ids: list[int], past_key_values: Any) -> None:
+        size_bytes = past_key_values_bytes(past_key_values)
+        if size_bytes > self._budget_bytes:
+            return
+        key = tuple(prefix_ids)
+        with self._lock:
+            self._entries[key] = _PrefixEntry(past_key_values=past_key_values, size_bytes=size_bytes)
+            self._entries.move_to_end(key)
+            while self._resident_bytes() > self._budget_bytes:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "resident_mb": round(self._resident_bytes() / 2**20, 2),
+                "budget_mb": round(self._budget_bytes / 2**20, 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _resident_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._entries.values())
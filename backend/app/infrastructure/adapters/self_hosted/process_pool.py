@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import multiprocessing
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from time import monotonic
+from typing import Any
+
+from app.domain import errors as domain_errors
+from app.domain.errors import ModelUnavailableError
+from app.domain.request_context import CancellationToken, request_context
+from app.infrastructure.adapters.self_hosted.execution_profile import ExecutionProfile
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SUPERVISE_INTERVAL_SECONDS = 1.0
+
+
+def _publish_audio(audio: bytes) -> str:
+    # The parent attaches by name, copies the payload out and unlinks the segment.
+    segment = shared_memory.SharedMemory(create=True, size=max(1, len(audio)))
+    segment.buf[: len(audio)] = audio
+    name = segment.name
+    segment.close()
+    return name
+
+
+def _collect_audio(name: str, size: int) -> bytes:
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(segment.buf[:size])
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def _worker_main(
+    worker_id: int,
+    settings_payload: dict[str, Any],
+    num_threads: int,
+    jobs: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    cancel_job: Any,
+) -> None:
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(1)
+    except ImportError:
+        pass
+
+    from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+
+    runtime = HFLocalRuntime(
+        Settings(
+            **{
+                **settings_payload,
+                "local_inference_workers": 0,
+                "local_intra_op_threads": num_threads,
+                "local_inter_op_threads": 1,
+            }
+        )
+    )
+    loop = asyncio.new_event_loop()
+    # The loop only runs during a job, so idle models are swept here while waiting for the next one.
+    idle_interval = settings_payload.get("local_model_idle_seconds", 0) / 2 or None
+    while True:
+        try:
+            job = jobs.get(timeout=idle_interval)
+        except queue.Empty:
+            runtime.evict_idle()
+            continue
+        if job is None:
+            break
+        job_id, requested_id, text, config = job
+        # The parent writes the id of an abandoned job here; the runtime polls it between decode steps. A
+        # worker is only ever handed one job at a time, so the value always refers to the job it is running.
+        cancel_token = CancellationToken(probe=lambda current=job_id: cancel_job.value == current)
+        try:
+            with request_context(cancel_token=cancel_token):
+                audio = loop.run_until_complete(runtime.synthesize(requested_id, text, config))
+            results.put((worker_id, job_id, True, _publish_audio(audio), len(audio)))
+        except Exception as exc:  # noqa: BLE001
+            results.put((worker_id, job_id, False, type(exc).__name__, str(exc)))
+    runtime.shutdown()
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.close()
+
+
+@dataclass
+class _WorkerSlot:
+    worker_id: int
+    process: Any = None
+    jobs: Any = None
+    cancel_job: Any = None
+    in_flight: dict[int, float] = field(default_factory=dict)
+    # Jobs wait here, in the parent, until the worker is free, so a cancelled one can be dropped undispatched.
+    pending: deque = field(default_factory=deque)
+    running: int | None = None
+    restarts: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    busy_seconds: float = 0.0
+    last_latency_ms: int | None = None
+    warm_models: set[str] = field(default_factory=set)
+
+
+class LocalInferenceProcessPool:
+    # Each worker process owns its own HFLocalRuntime (and model replicas) with a pinned
+    # torch thread count; audio comes back through shared memory rather than the queue.
+    def __init__(self, settings: Settings):
+        self._settings = settings
+        self._intra_op_threads = ExecutionProfile.from_settings(settings).intra_op_threads
+        self._context = multiprocessing.get_context("spawn")
+        self._results = self._context.Queue()
+        self._slots = [_WorkerSlot(worker_id=i) for i in range(max(1, settings.local_inference_workers))]
+        self._futures: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self._job_ids = itertools.count(1)
+        self._started = False
+        self._reader: threading.Thread | None = None
+        self._supervisor: asyncio.Task | None = None
+        self._lock = threading.Lock()
+
+    async def submit(self, requested_id: str, text: str, config: dict[str, Any]) -> bytes:
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        job_id = next(self._job_ids)
+        with self._lock:
+            slot = min(self._slots, key=lambda item: (len(item.in_flight), item.worker_id))
+            slot.in_flight[job_id] = monotonic()
+            self._futures[job_id] = (loop, future)
+            slot.pending.append((job_id, requested_id, text, config))
+            self._dispatch(slot)
+        try:
+            audio = await future
+            with self._lock:
+                slot.warm_models.add(requested_id)
+            return audio
+        except asyncio.CancelledError:
+            with self._lock:
+                if job_id == slot.running:
+                    slot.cancel_job.value = job_id
+                    slot.cancelled += 1
+                elif slot.in_flight.pop(job_id, None) is not None:
+                    slot.pending = deque(job for job in slot.pending if job[0] != job_id)
+                    slot.cancelled += 1
+            raise
+        finally:
+            with self._lock:
+                self._futures.pop(job_id, None)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": [
+                    {
+                        "worker_id": slot.worker_id,
+                        "pid": slot.process.pid if slot.process is not None else None,
+                        "alive": bool(slot.process is not None and slot.process.is_alive()),
+                        "restarts": slot.restarts,
+                        "in_flight": len(slot.in_flight),
+                        "completed": slot.completed,
+                        "failed": slot.failed,
+                        "cancelled": slot.cancelled,
+                        "busy_seconds": round(slot.busy_seconds, 3),
+                        "last_latency_ms": slot.last_latency_ms,
+                    }
+                    for slot in self._slots
+                ]
+            }
+
+    def warm_models(self) -> set[str]:
+        # Models at least one live worker has already served (and so has loaded).
+        with self._lock:
+            return {model_id for slot in self._slots for model_id in slot.warm_models}
+
+    def shutdown(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+        for slot in self._slots:
+            if slot.process is not None and slot.process.is_alive():
+                slot.jobs.put(None)
+                slot.process.join(timeout=5)
+                if slot.process.is_alive():
+                    slot.process.terminate()
+        if self._reader is not None:
+            self._results.put(None)
+
+    def _ensure_started(self) -> None:
+        if not self._started:
+            for slot in self._slots:
+                self._spawn(slot)
+            self._reader = threading.Thread(target=self._read_results, name="hf-pool-results", daemon=True)
+            self._reader.start()
+            self._started = True
+        if self._supervisor is None or self._supervisor.done():
+            self._supervisor = asyncio.get_running_loop().create_task(self._supervise())
+
+    @staticmethod
+    def _dispatch(slot: _WorkerSlot) -> None:
+        # Called with the lock held.
+        if slot.running is None and slot.pending:
+            job = slot.pending.popleft()
+            slot.running = job[0]
+            slot.jobs.put(job)
+
+    def _spawn(self, slot: _WorkerSlot) -> None:
+        slot.jobs = self._context.Queue()
+        slot.cancel_job = self._context.RawValue("q", 0)
+        slot.process = self._context.Process(
+            target=_worker_main,
+            args=(
+                slot.worker_id,
+                self._settings.model_dump(),
+                self._intra_op_threads,
+                slot.jobs,
+                self._results,
+                slot.cancel_job,
+            ),
+            name=f"hf-inference-{slot.worker_id}",
+            daemon=True,
+        )
+        slot.process.start()
+        logger.info("local_inference_worker_started", worker_id=slot.worker_id, pid=slot.process.pid)
+
+    async def _supervise(self) -> None:
+        while True:
+            await asyncio.sleep(_SUPERVISE_INTERVAL_SECONDS)
+            for slot in self._slots:
+                if slot.process is None or slot.process.is_alive():
+                    continue
+                exit_code = slot.process.exitcode
+                logger.warning("local_inference_worker_died", worker_id=slot.worker_id, exit_code=exit_code)
+                with self._lock:
+                    # Only the job the worker was running is lost; pending ones go to its replacement.
+                    orphaned = [slot.running] if slot.running is not None else []
+                    for job_id in orphaned:
+                        slot.in_flight.pop(job_id, None)
+                    slot.running = None
+                    slot.failed += len(orphaned)
+                    slot.restarts += 1
+                    slot.warm_models.clear()
+                for job_id in orphaned:
+                    self._resolve(
+                        job_id,
+                        error=ModelUnavailableError(
+                            f"Local inference worker {slot.worker_id} exited with code {exit_code}"
+                        ),
+                    )
+                self._spawn(slot)
+                with self._lock:
+                    self._dispatch(slot)
+
+    def _read_results(self) -> None:
+        while True:
+            try:
+                message = self._results.get()
+            except (EOFError, OSError):
+                return
+            if message is None:
+                return
+            self._handle_result(message)
+
+    def _handle_result(self, message: tuple) -> None:
+        worker_id, job_id, ok, payload, detail = message
+        slot = self._slots[worker_id]
+        with self._lock:
+            started = slot.in_flight.pop(job_id, None)
+            if started is not None:
+                elapsed = monotonic() - started
+                slot.busy_seconds += elapsed
+                slot.last_latency_ms = int(elapsed * 1000)
+            if ok:
+                slot.completed += 1
+            else:
+                slot.failed += 1
+            if slot.running == job_id:
+                slot.running = None
+                self._dispatch(slot)
+
+        if ok:
+            try:
+                self._resolve(job_id, result=_collect_audio(payload, int(detail)))
+            except FileNotFoundError:
+                self._resolve(job_id, error=ModelUnavailableError("Local inference worker lost audio buffer"))
+        else:
+            error_cls = getattr(domain_errors, str(payload), None)
+            if not (isinstance(error_cls, type) and issubclass(error_cls, domain_errors.AdapterError)):
+                error_cls = ModelUnavailableError
+            self._resolve(job_id, error=error_cls(str(detail)))
+
+    def _resolve(self, job_id: int, result: bytes | None = None, error: Exception | None = None) -> None:
+        with self._lock:
+            entry = self._futures.get(job_id)
+        if entry is None:
+            return
+        loop, future = entry
+
+        def _apply() -> None:
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        loop.call_soon_threadsafe(_apply)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable
+
+
+def available_memory_bytes() -> int | None:
+    # MemAvailable from /proc/meminfo (Linux); None where it cannot be read.
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def estimate_runtime_bytes(runtime: Any) -> int:
+    # Sums parameter/buffer storage of every torch module held by a loaded runtime,
+    # counting shared tensors (tied embeddings, reused submodules) once.
+    candidates: list[Any] = []
+    if isinstance(runtime, dict):
+        candidates.extend(runtime.values())
+    else:
+        candidates.append(runtime)
+    for candidate in list(candidates):
+        nested = getattr(candidate, "model", None)
+        if nested is not None:
+            candidates.append(nested)
+
+    seen: set[int] = set()
+    total = 0
+    for candidate in candidates:
+        if not (hasattr(candidate, "parameters") and hasattr(candidate, "buffers")):
+            continue
+        try:
+            tensors = [*candidate.parameters(), *candidate.buffers()]
+        except Exception:  # noqa: BLE001
+            continue
+        for tensor in tensors:
+            try:
+                key = tensor.data_ptr()
+                if key in seen:
+                    continue
+                seen.add(key)
+                total += tensor.numel() * tensor.element_size()
+            except Exception:  # noqa: BLE001
+                continue
+    return total
+
+
+@dataclass
+class ResidentModel:
+    runtime: Any
+    size_bytes: int
+    pinned: bool
+    loaded_at: float
+    last_used: float
+    in_use: int = 0
+
+
+class ModelResidencyManager:
+    def __init__(
+        self,
+        budget_bytes: int = 0,
+        idle_seconds: float = 0,
+        pinned: set[str] | None = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        self._budget_bytes = max(0, budget_bytes)
+        self._idle_seconds = max(0.0, idle_seconds)
+        self._pinned = set(pinned or ())
+        self._clock = clock
+        self._entries: OrderedDict[str, ResidentModel] = OrderedDict()
+        self._known_sizes: dict[str, int] = {}
+        self.loads = 0
+        self.lru_evictions = 0
+        self.idle_evictions = 0
+
+    def acquire(self, model_repo: str) -> Any | None:
+        entry = self._entries.get(model_repo)
+        if entry is None:
+            return None
+        entry.in_use += 1
+        entry.last_used = self._clock()
+        self._entries.move_to_end(model_repo)
+        return entry.runtime
+
+    def release(self, model_repo: str) -> None:
+        entry = self._entries.get(model_repo)
+        if entry is None:
+            return
+        entry.in_use = max(0, entry.in_use - 1)
+        entry.last_used = self._clock()
+
+    def reserve(self, model_repo: str) -> list[str]:
+        # Before a (re)load, make room for the size measured the last time this repo was resident.
+        expected = self._known_sizes.get(model_repo, 0)
+        return self._evict_until(self._budget_bytes - expected, protect=model_repo)
+
+    def admit(self, model_repo: str, runtime: Any, size_bytes: int) -> list[str]:
+        now = self._clock()
+        self._entries[model_repo] = ResidentModel(
+            runtime=runtime,
+            size_bytes=size_bytes,
+            pinned=model_repo in self._pinned,
+            loaded_at=now,
+            last_used=now,
+        )
+        self._known_sizes[model_repo] = size_bytes
+        self.loads += 1
+        return self._evict_until(self._budget_bytes, protect=model_repo)
+
+    def evict_idle(self) -> list[str]:
+        if not self._idle_seconds:
+            return []
+        now = self._clock()
+        evicted: list[str] = []
+        for model_repo, entry in list(self._entries.items()):
+            if self._is_evictable(entry) and now - entry.last_used >= self._idle_seconds:
+                del self._entries[model_repo]
+                self.idle_evictions += 1
+                evicted.append(model_repo)
+        return evicted
+
+    def loaded_models(self) -> list[str]:
+        return list(self._entries)
+
+    def resident_runtimes(self) -> dict[str, Any]:
+        return {model_repo: entry.runtime for model_repo, entry in self._entries.items()}
+
+    def resident_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._entries.values())
+
+    def metrics(self) -> dict[str, Any]:
+        now = self._clock()
+        return {
+            "budget_mb": round(self._budget_bytes / 2**20, 1) if self._budget_bytes else None,
+            "resident_mb": round(self.resident_bytes() / 2**20, 1),
+            "loads": self.loads,
+            "lru_evictions": self.lru_evictions,
+            "idle_evictions": self.idle_evictions,
+            "models": {
+                model_repo: {
+                    "size_mb": round(entry.size_bytes / 2**20, 1),
+                    "pinned": entry.pinned,
+                    "in_use": entry.in_use,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                }
+                for model_repo, entry in self._entries.items()
+            },
+        }
+
+    def _evict_until(self, target_bytes: int, protect: str) -> list[str]:
+        if not self._budget_bytes:
+            return []
+        evicted: list[str] = []
+        # OrderedDict iteration runs least-recently-used first.
+        for model_repo, entry in list(self._entries.items()):
+            if self.resident_bytes() <= target_bytes:
+                break
+            if model_repo == protect or not self._is_evictable(entry):
+                continue
+            del self._entries[model_repo]
+            self.lru_evictions += 1
+            evicted.append(model_repo)
+        return evicted
+
+    @staticmethod
+    def _is_evictable(entry: ResidentModel) -> bool:
+        return not entry.pinned and entry.in_use == 0
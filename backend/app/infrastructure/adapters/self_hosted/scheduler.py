@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, AsyncIterator
+
+PRIORITY_CLASSES = ("interactive", "batch", "prefetch")
+_PRIORITY_RANK = {name: rank for rank, name in enumerate(PRIORITY_CLASSES)}
+_THROUGHPUT_ALPHA = 0.2
+
+
+@dataclass
+class SlotGrant:
+    queue_position: int
+    estimated_wait_ms: int | None
+    queue_wait_ms: int = 0
+
+
+@dataclass
+class _Waiter:
+    priority: str
+    cost: float
+    seq: int
+    enqueued_at: float
+    future: asyncio.Future = field(repr=False)
+
+
+@dataclass
+class _QueueStats:
+    dispatched: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class InferenceScheduler:
+    # Replaces per-model FIFO semaphores. Waiters are ordered by priority class, then by expected cost
+    # (shortest job first). Every `aging_seconds` of waiting promotes a request by one class and halves
+    # its effective cost again, so long or low-priority jobs cannot starve.
+    def __init__(self, slots: int, aging_seconds: float):
+        self._slots = max(1, slots)
+        self._aging_seconds = max(0.001, aging_seconds)
+        self._queues: defaultdict[str, list[_Waiter]] = defaultdict(list)
+        self._active: defaultdict[str, int] = defaultdict(int)
+        self._active_cost: defaultdict[str, float] = defaultdict(float)
+        self._seconds_per_cost: dict[str, float] = {}
+        self._service_seconds: dict[str, float] = {}
+        self._stats: defaultdict[str, defaultdict[str, _QueueStats]] = defaultdict(lambda: defaultdict(_QueueStats))
+        self._seq = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, key: str, priority: str, cost: float) -> AsyncIterator[SlotGrant]:
+        priority = priority if priority in _PRIORITY_RANK else PRIORITY_CLASSES[0]
+        cost = max(1.0, float(cost))
+        grant = await self._acquire(key, priority, cost)
+        started = monotonic()
+        try:
+            yield grant
+        finally:
+            self._observe_throughput(key, cost, monotonic() - started)
+            self._release(key, cost)
+
+    def metrics(self) -> dict[str, Any]:
+        now = monotonic()
+        metrics: dict[str, Any] = {}
+        for key in sorted({*self._queues, *self._active, *self._stats}):
+            queue = self._queues.get(key, [])
+            metrics[key] = {
+                "slots": self._slots,
+                "active": self._active.get(key, 0),
+                "queued": {name: sum(1 for waiter in queue if waiter.priority == name) for name in PRIORITY_CLASSES},
+                "oldest_wait_ms": int(max((now - waiter.enqueued_at for waiter in queue), default=0.0) * 1000),
+                "estimated_drain_ms": self._estimate_ms(key, sum(waiter.cost for waiter in queue)),
+                "by_priority": {
+                    name: {
+                        "dispatched": stats.dispatched,
+                        "mean_wait_ms": round(stats.wait_seconds * 1000 / stats.dispatched, 1)
+                        if stats.dispatched
+                        else None,
+                        "max_wait_ms": int(stats.max_wait_seconds * 1000),
+                    }
+                    for name, stats in self._stats.get(key, {}).items()
+                },
+            }
+        return metrics
+
+    def queue_state(self, key: str) -> dict[str, Any]:
+        # Load summary for one queue, as advertised to orchestrators in the worker capacity document.
+        queue = self._queues.get(key, [])
+        service_seconds = self._service_seconds.get(key)
+        return {
+            "slots": self._slots,
+            "active": self._active.get(key, 0),
+            "queued": len(queue),
+            "estimated_wait_ms": self._estimate_ms(key, sum(waiter.cost for waiter in queue), include_active=True),
+            "mean_service_ms": int(service_seconds * 1000) if service_seconds is not None else None,
+        }
+
+    async def _acquire(self, key: str, priority: str, cost: float) -> SlotGrant:
+        queue = self._queues[key]
+        if self._active[key] < self._slots and not queue:
+            self._grant(key, priority, cost, waited=0.0)
+            return SlotGrant(queue_position=0, estimated_wait_ms=0)
+
+        waiter = _Waiter(
+            priority=priority,
+            cost=cost,
+            seq=next(self._seq),
+            enqueued_at=monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        now = waiter.enqueued_at
+        ahead = [other for other in queue if self._rank(other, now) < self._rank(waiter, now)]
+        queue.append(waiter)
+        grant = SlotGrant(
+            queue_position=len(ahead) + 1,
+            estimated_wait_ms=self._estimate_ms(key, sum(other.cost for other in ahead), include_active=True),
+        )
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in queue:
+                queue.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller went away: hand the slot to the next waiter.
+                self._release(key, cost)
+            raise
+        grant.queue_wait_ms = int((monotonic() - waiter.enqueued_at) * 1000)
+        return grant
+
+    def _release(self, key: str, cost: float) -> None:
+        self._active[key] = max(0, self._active[key] - 1)
+        self._active_cost[key] = max(0.0, self._active_cost[key] - cost)
+        queue = self._queues[key]
+        while queue and self._active[key] < self._slots:
+            now = monotonic()
+            waiter = min(queue, key=lambda item: self._rank(item, now))
+            queue.remove(waiter)
+            if waiter.future.done():
+                continue
+            self._grant(key, waiter.priority, waiter.cost, waited=now - waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+    def _grant(self, key: str, priority: str, cost: float, waited: float) -> None:
+        self._active[key] += 1
+        self._active_cost[key] += cost
+        stats = self._stats[key][priority]
+        stats.dispatched += 1
+        stats.wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+    def _rank(self, waiter: _Waiter, now: float) -> tuple[int, float, int]:
+        aged = (now - waiter.enqueued_at) / self._aging_seconds
+        return _PRIORITY_RANK[waiter.priority] - int(aged), waiter.cost / (1.0 + aged), waiter.seq
+
+    def _observe_throughput(self, key: str, cost: float, seconds: float) -> None:
+        rate = seconds / cost
+        previous = self._seconds_per_cost.get(key)
+        self._seconds_per_cost[key] = rate if previous is None else previous + _THROUGHPUT_ALPHA * (rate - previous)
+        previous = self._service_seconds.get(key)
+        self._service_seconds[key] = seconds if previous is None else previous + _THROUGHPUT_ALPHA * (seconds - previous)
+
+    def _estimate_ms(self, key: str, queued_cost: float, include_active: bool = False) -> int | None:
+        seconds_per_cost = self._seconds_per_cost.get(key)
+        if seconds_per_cost is None:
+            return None
+        # Active jobs are assumed half done on average.
+        pending = queued_cost + (self._active_cost[key] / 2 if include_active else 0.0)
+        return int(pending * seconds_per_cost / self._slots * 1000)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from app.domain.errors import GenerationCancelledError
+
+
+def decode_snac_windowed(
+    snac_model: Any,
+    hierarchical_codes: list[Any],
+    window_frames: int,
+    context_frames: int,
+    is_cancelled: Callable[[], bool],
+    torch_module,
+) -> Any:
+    # Decodes long code sequences in windows of coarse frames (levels hold 1/2/4 codes per frame),
+    # with `context_frames` of overlap on each side that is decoded and then cropped so the
+    # convolutional receptive field sees the same neighbours as a single-pass decode.
+    frames = hierarchical_codes[0].shape[-1]
+    if window_frames <= 0 or frames <= window_frames:
+        return snac_model.decode(hierarchical_codes)
+
+    pieces: list[Any] = []
+    samples_per_frame: int | None = None
+    for start in range(0, frames, window_frames):
+        if is_cancelled():
+            raise GenerationCancelledError("SNAC decode cancelled")
+        stop = min(frames, start + window_frames)
+        lo = max(0, start - context_frames)
+        hi = min(frames, stop + context_frames)
+        window = [codes[:, lo * 2**level : hi * 2**level] for level, codes in enumerate(hierarchical_codes)]
+        audio = snac_model.decode(window)
+        if samples_per_frame is None:
+            samples_per_frame = audio.shape[-1] // (hi - lo)
+        left = (start - lo) * samples_per_frame
+        pieces.append(audio[..., left : left + (stop - start) * samples_per_frame])
+    return torch_module.cat(pieces, dim=-1)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Iterator
+
+
+class FirstStepTimer:
+    # Logits processor that only timestamps the first decoding step, which separates prompt
+    # prefill from the per-token decode loop inside a single generate() call.
+    def __init__(self):
+        self.first_step_at: float | None = None
+
+    def __call__(self, input_ids: Any, scores: Any) -> Any:
+        _ = input_ids
+        if self.first_step_at is None:
+            self.first_step_at = perf_counter()
+        return scores
+
+
+class StageTimings:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: defaultdict[str, defaultdict[str, dict[str, float]]] = defaultdict(
+            lambda: defaultdict(lambda: {"count": 0, "seconds": 0.0})
+        )
+
+    def record(self, model_key: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats[model_key][stage]
+            stats["count"] += 1
+            stats["seconds"] += seconds
+
+    @contextmanager
+    def measure(self, model_key: str, stage: str) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(model_key, stage, perf_counter() - started)
+
+    def record_generate(self, model_key: str, started: float, first_step_at: float | None, finished: float) -> None:
+        if first_step_at is None:
+            self.record(model_key, "decode", finished - started)
+            return
+        self.record(model_key, "prefill", first_step_at - started)
+        self.record(model_key, "decode", finished - first_step_at)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                model_key: {
+                    stage: {
+                        "count": int(stats["count"]),
+                        "seconds": round(stats["seconds"], 4),
+                        "mean_ms": round(stats["seconds"] * 1000 / stats["count"], 2) if stats["count"] else None,
+                    }
+                    for stage, stats in stages.items()
+                }
+                for model_key, stages in self._stats.items()
+            }
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.domain.request_context import CancellationToken
+from app.infrastructure.adapters.self_hosted.veena_vocab import AUDIO_CODES_PER_FRAME
+
+
+class RepeatingFrameStoppingCriteria:
+    # Stops a Veena generation once the last `max_repeats` SNAC frames (7 codes each) are identical,
+    # the signature of a decode stuck in a loop; the remaining steps would only extend the artifact.
+    def __init__(self, prompt_length: int, max_repeats: int):
+        self._prompt_length = prompt_length
+        self._max_repeats = max(2, max_repeats)
+        self.triggered = False
+
+    @property
+    def repeated_tokens(self) -> int:
+        # Tokens to trim so a single copy of the repeated frame is kept.
+        return (self._max_repeats - 1) * AUDIO_CODES_PER_FRAME if self.triggered else 0
+
+    def __call__(self, input_ids: Any, scores: Any, **kwargs) -> Any:
+        _ = scores, kwargs
+        generated = input_ids.shape[-1] - self._prompt_length
+        window = self._max_repeats * AUDIO_CODES_PER_FRAME
+        stop = input_ids.new_zeros((input_ids.shape[0],), dtype=bool)
+        # Only checked on frame boundaries, so the per-step cost is a modulo for 6 steps out of 7.
+        if generated < window or generated % AUDIO_CODES_PER_FRAME:
+            return stop
+        frames = input_ids[:, -window:].reshape(input_ids.shape[0], self._max_repeats, AUDIO_CODES_PER_FRAME)
+        stop = (frames == frames[:, :1]).all(dim=2).all(dim=1)
+        if bool(stop.any()):
+            self.triggered = True
+        return stop
+
+
+class CancellationStoppingCriteria:
+    # Ends generate() at the next decoding step once the request's cancellation token is tripped.
+    def __init__(self, token: CancellationToken):
+        self._token = token
+
+    def __call__(self, input_ids: Any, scores: Any, **kwargs) -> Any:
+        _ = scores, kwargs
+        cancelled = self._token.cancelled
+        return input_ids.new_full((input_ids.shape[0],), cancelled, dtype=bool)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+STOP_REASONS = ("eos", "repetition", "max_tokens")
+
+
+def spoken_chars(text: str) -> int:
+    # Whitespace and punctuation barely change audio length; letters and digits drive it.
+    return sum(1 for char in text if char.isalnum())
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    min_new_tokens: int
+    max_new_tokens: int
+
+
+class TokenBudgetCalibrator:
+    # Learns tokens-per-spoken-character per (model, speaker) from generations that ended on their
+    # own (EOS), as an exponentially weighted mean, and turns it into min/max_new_tokens.
+    def __init__(
+        self,
+        alpha: float,
+        headroom: float,
+        min_fraction: float,
+        min_samples: int,
+        persist_path: str | None = None,
+    ):
+        self._alpha = min(1.0, max(0.01, alpha))
+        self._headroom = max(1.0, headroom)
+        self._min_fraction = min(1.0, max(0.0, min_fraction))
+        self._min_samples = max(1, min_samples)
+        self._persist_path = Path(persist_path) if persist_path else None
+        self._lock = threading.Lock()
+        self._rates: dict[str, dict[str, float]] = {}
+        self._outcomes: defaultdict[str, dict[str, int]] = defaultdict(lambda: dict.fromkeys(STOP_REASONS, 0))
+        self._load()
+
+    @staticmethod
+    def key(model_repo: str, speaker: str | None = None) -> str:
+        return f"{model_repo}|{speaker or ''}"
+
+    def expected_tokens(self, key: str, text: str) -> float | None:
+        chars = spoken_chars(text)
+        with self._lock:
+            entry = self._rates.get(key)
+            if entry is None or entry["samples"] < self._min_samples or chars == 0:
+                return None
+            return entry["tokens_per_char"] * chars
+
+    def estimate(self, key: str, text: str, frame_tokens: int = 1) -> TokenBudget | None:
+        expected = self.expected_tokens(key, text)
+        if expected is None:
+            return None
+        max_new_tokens = _round_up(math.ceil(expected * self._headroom), frame_tokens)
+        min_new_tokens = _round_down(int(expected * self._min_fraction), frame_tokens)
+        return TokenBudget(min_new_tokens=min_new_tokens, max_new_tokens=max(frame_tokens, max_new_tokens))
+
+    def observe(self, key: str, text: str, tokens: int, reason: str) -> None:
+        chars = spoken_chars(text)
+        with self._lock:
+            self._outcomes[key][reason] = self._outcomes[key].get(reason, 0) + 1
+            # Capped or looping runs say nothing reliable about how long the utterance should be.
+            if reason != "eos" or chars == 0 or tokens <= 0:
+                return
+            rate = tokens / chars
+            entry = self._rates.get(key)
+            if entry is None:
+                self._rates[key] = {"tokens_per_char": rate, "samples": 1}
+            else:
+                entry["tokens_per_char"] += self._alpha * (rate - entry["tokens_per_char"])
+                entry["samples"] += 1
+            snapshot = json.dumps(self._rates, sort_keys=True)
+        self._save(snapshot)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            metrics: dict[str, Any] = {}
+            for key in sorted({*self._rates, *self._outcomes}):
+                entry = self._rates.get(key, {"tokens_per_char": 0.0, "samples": 0})
+                metrics[key] = {
+                    "tokens_per_char": round(entry["tokens_per_char"], 3),
+                    "samples": int(entry["samples"]),
+                    "calibrated": entry["samples"] >= self._min_samples,
+                    "stop_reasons": dict(self._outcomes.get(key) or dict.fromkeys(STOP_REASONS, 0)),
+                }
+            return metrics
+
+    def _load(self) -> None:
+        if self._persist_path is None or not self._persist_path.exists():
+            return
+        try:
+            loaded = json.loads(self._persist_path.read_text(encoding="utf-8"))
+            self._rates = {
+                str(key): {"tokens_per_char": float(value["tokens_per_char"]), "samples": int(value["samples"])}
+                for key, value in loaded.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("token_budget_load_failed", path=str(self._persist_path), error=str(exc))
+
+    def _save(self, snapshot: str) -> None:
+        if self._persist_path is None:
+            return
+        try:
+            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._persist_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(snapshot, encoding="utf-8")
+            tmp_path.replace(self._persist_path)
+        except OSError as exc:
+            logger.warning("token_budget_save_failed", path=str(self._persist_path), error=str(exc))
+
+
+def _round_up(value: int, multiple: int) -> int:
+    return -(-value // multiple) * multiple
+
+
+def _round_down(value: int, multiple: int) -> int:
+    return value // multiple * multiple
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import struct
+
+# Duration from container headers / frame counts only; nothing here decodes audio samples.
+
+_MP3_BITRATES_KBPS = {
+    # (mpeg1, layer3) and (mpeg2/2.5, layer3) bitrate tables, index 1..14.
+    True: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    False: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def audio_duration_ms(audio_bytes: bytes, audio_format: str) -> int | None:
+    parser = _PARSERS.get(audio_format)
+    if parser is None or not audio_bytes:
+        return None
+    try:
+        seconds = parser(audio_bytes)
+    except (IndexError, ValueError, struct.error, ZeroDivisionError):
+        return None
+    if seconds is None or seconds < 0:
+        return None
+    return int(round(seconds * 1000))
+
+
+def streamed_duration_ms(head: bytes, total_bytes: int, audio_format: str) -> int | None:
+    # For audio passed through without being kept: headers come from its first bytes, the size from the count.
+    if total_bytes <= len(head):
+        return audio_duration_ms(head, audio_format)
+    if audio_format != "wav":
+        return None
+    try:
+        seconds = _wav_duration(head, total_bytes)
+    except (IndexError, ValueError, struct.error, ZeroDivisionError):
+        return None
+    return None if seconds is None else int(round(seconds * 1000))
+
+
+def _wav_duration(data: bytes, total_bytes: int | None = None) -> float | None:
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    offset = 12
+    byte_rate = 0
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            (byte_rate,) = struct.unpack_from("<I", data, body + 8)
+        elif chunk_id == b"data":
+            # Streamed WAVs leave the size unset (0 / 0xFFFFFFFF); fall back to the bytes present.
+            available = (total_bytes if total_bytes is not None else len(data)) - body
+            size = available if chunk_size in (0, 0xFFFFFFFF) else min(chunk_size, available)
+            return size / byte_rate if byte_rate else None
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _flac_duration(data: bytes) -> float | None:
+    if data[:4] != b"fLaC":
+        return None
+    # STREAMINFO is always the first metadata block: 20-bit sample rate, 36-bit total samples.
+    info = data[8:42]
+    packed = int.from_bytes(info[10:18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def _ogg_duration(data: bytes) -> float | None:
+    if data[:4] != b"OggS":
+        return None
+    # The last page's granule position is the stream length; skip "OggS" bytes that occur inside packets.
+    last_page = data.rfind(b"OggS")
+    while last_page > 0 and (data[last_page + 4] != 0 or last_page + 27 > len(data)):
+        last_page = data.rfind(b"OggS", 0, last_page)
+    (granule,) = struct.unpack_from("<q", data, last_page + 6)
+    header_start = 27 + data[26]
+    first_packet = data[header_start : header_start + 30]
+    if first_packet.startswith(b"OpusHead"):
+        # Opus granules always count 48 kHz samples, including the encoder pre-skip.
+        (pre_skip,) = struct.unpack_from("<H", first_packet, 10)
+        return max(0, granule - pre_skip) / 48000
+    if first_packet[1:7] == b"vorbis":
+        (sample_rate,) = struct.unpack_from("<I", first_packet, 12)
+        return granule / sample_rate if sample_rate else None
+    return None
+
+
+def _mp3_duration(data: bytes) -> float | None:
+    offset = 0
+    if data[:3] == b"ID3":
+        size = data[6:10]
+        offset = 10 + ((size[0] << 21) | (size[1] << 14) | (size[2] << 7) | size[3])
+    while offset + 4 <= len(data) and not (data[offset] == 0xFF and data[offset + 1] & 0xE0 == 0xE0):
+        offset += 1
+    if offset + 4 > len(data):
+        return None
+
+    header = int.from_bytes(data[offset : offset + 4], "big")
+    version_bits = (header >> 19) & 0b11
+    layer_bits = (header >> 17) & 0b11
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0b11
+    channel_mode = (header >> 6) & 0b11
+    if version_bits == 1 or layer_bits != 0b01 or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+    mpeg1 = version_bits == 3
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][rate_index]
+    samples_per_frame = 1152 if mpeg1 else 576
+
+    # VBR encoders (lame included) write the frame count into a Xing/Info header in the first frame.
+    side_info = (32 if channel_mode != 3 else 17) if mpeg1 else (17 if channel_mode != 3 else 9)
+    xing = offset + 4 + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", data, xing + 4)
+        if flags & 0x1:
+            (frames,) = struct.unpack_from(">I", data, xing + 8)
+            return frames * samples_per_frame / sample_rate
+    vbri = offset + 4 + 32
+    if data[vbri : vbri + 4] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", data, vbri + 14)
+        return frames * samples_per_frame / sample_rate
+
+    bitrate = _MP3_BITRATES_KBPS[mpeg1][bitrate_index] * 1000
+    return (len(data) - offset) * 8 / bitrate
+
+
+_PARSERS = {
+    "wav": _wav_duration,
+    "flac": _flac_duration,
+    "ogg": _ogg_duration,
+    "mp3": _mp3_duration,
+}
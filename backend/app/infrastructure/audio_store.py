@@ -7,6 +7,7 @@ from fastapi import HTTPException
 from fastapi.responses import FileResponse
 
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.transcoding import media_type_for
 
 
 class AudioStore:
@@ -28,5 +29,4 @@ class AudioStore:
         path = self._base_dir / audio_id
         if not path.exists() or not path.is_file():
             raise HTTPException(status_code=404, detail="Audio not found")
-        media_type = "audio/mpeg" if audio_id.endswith(".mp3") else "audio/wav"
-        return FileResponse(path, media_type=media_type, filename=audio_id)
+        return FileResponse(path, media_type=media_type_for(path.suffix.lstrip(".")), filename=audio_id)
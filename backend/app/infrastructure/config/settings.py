@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     model_timeout_seconds: int = 45
     max_concurrent_synth: int = 6
     request_timeout_seconds: int = 35
+    # all_local | orchestrator | self_hosted_worker | hybrid (self-hosted models local with remote overflow)
     backend_role: str = "all_local"
 
     # Sarvam
@@ -26,6 +27,12 @@ class Settings(BaseSettings):
     # Google
     google_application_credentials: str | None = None
     google_tts_project_id: str | None = None
+    # The cached access token is refreshed in the background this long before it expires.
+    google_token_refresh_margin_seconds: int = 300
+    # Streaming synthesis reuses this many gRPC clients (created on first use), kept open by keepalive pings.
+    google_streaming_channels: int = 1
+    google_streaming_max_streams: int = 8
+    google_streaming_keepalive_seconds: int = 30
 
     # Azure
     azure_speech_key: str | None = None
@@ -51,20 +58,102 @@ class Settings(BaseSettings):
     local_dtype: str = "float32"
     local_model_warmup: bool = False
     local_model_timeout_seconds: int = 900
+    # Model loading: offline resolves repos from the local HF snapshot cache only.
+    # Revisions pin repos as "org/model=<commit>,org/other=<commit>".
+    local_offline: bool = False
+    local_model_revisions: str = ""
+    local_concurrent_loading: bool = True
+    # Directory for persisted post-processed (quantized) CPU models; empty disables.
+    local_processed_model_dir: str | None = None
+    # CPU execution backend for SNAC decoding / the Parler text encoder: torch | onnx.
+    local_backend_snac: str = "torch"
+    local_backend_parler: str = "torch"
+    local_onnx_cache_dir: str = "/tmp/tanglish_tts_onnx"
+    # 0 reuses the torch intra-op thread count.
+    local_onnx_threads: int = 0
+    # Learned tokens-per-character budgets (EWMA per model/speaker); empty path keeps them in memory only.
+    local_token_budget_path: str | None = None
+    local_token_budget_alpha: float = 0.2
+    local_token_budget_headroom: float = 1.5
+    local_token_budget_min_samples: int = 3
+    # Every this many seconds of queueing promotes a local request by one priority class.
+    local_scheduler_aging_seconds: float = 10.0
+    # CPU inference mode per self-hosted model: fp32 | bf16 | int8 (dynamic Linear quantization).
+    local_inference_mode_parler: str = "fp32"
+    local_inference_mode_veena: str = "fp32"
+    # 0 keeps inference in-process; >0 runs it in that many supervised worker processes.
+    local_inference_workers: int = 0
+    # Residency: 0 disables the memory budget / idle unload. Pinned models are comma-separated ids.
+    local_model_memory_budget_mb: int = 0
+    local_model_idle_seconds: float = 0
+    local_pinned_models: str = ""
+    # Execution profile: 0 intra-op threads = cpu_count // local_model_parallelism (// local_inference_workers
+    # with worker processes, where it is the per-worker torch thread count).
+    local_model_parallelism: int = 1
+    local_intra_op_threads: int = 0
+    local_inter_op_threads: int = 1
+    local_torch_compile: bool = False
+    local_static_kv_cache: bool = False
+    local_compile_cache_dir: str = "/tmp/tanglish_tts_compile_cache"
+    # Indic Parler description-conditioning cache (0 disables; dir enables on-disk persistence).
+    parler_description_cache_size: int = 64
+    parler_description_cache_dir: str | None = None
+    # Veena speaker/style prefix KV-cache budget (0 disables).
+    veena_prefix_cache_mb: int = 256
+    # Restrict Veena decoding (LM head + sampling) to SNAC audio codes and end-of-speech.
+    veena_audio_vocab_only: bool = True
+    # Stop once this many identical SNAC frames repeat back to back; 0 disables.
+    veena_repeat_frame_limit: int = 8
+    # SNAC decodes long utterances in windows of this many frames (cancellation is checked between them); 0 = one pass.
+    # Off by default: window seams have not been checked against the real SNAC decoder's receptive field.
+    veena_snac_window_frames: int = 0
+    # Refuse new requests (503 + Retry-After) once this many are queued for a model; 0 = unbounded.
+    local_max_queue_depth: int = 0
 
     # Remote self-hosted worker routing (Lightning)
     remote_self_hosted_url: str | None = None
     remote_self_hosted_timeout_seconds: int = 120
+    # Comma-separated worker pool (added to REMOTE_SELF_HOSTED_URL); requests go to the least-busy worker.
+    remote_self_hosted_urls: str = ""
+    # Active /health probe interval (0 disables); passive ejection after consecutive failures, for a cool-down.
+    remote_worker_health_interval_seconds: float = 10.0
+    remote_worker_max_failures: int = 2
+    remote_worker_eject_seconds: int = 30
+    # Extra workers to try when one fails before starting the request.
+    remote_worker_retries: int = 1
+    # Routing penalty for a worker that has not loaded the requested model (from its /capacity document).
+    remote_worker_cold_load_seconds: float = 120.0
+    # hybrid role: stay local while fewer than this many requests are queued for the model, then take
+    # whichever of local / remote is expected to finish first.
+    hybrid_local_queue_threshold: int = 1
+    # binary: framed raw audio from /tts/synthesize-raw (falls back to json for workers without it).
+    remote_self_hosted_transport: str = "binary"
+    # Frame payload compression (none | zstd); zstd needs the zstandard package on both sides.
+    remote_self_hosted_compression: str = "none"
 
     # alias overrides
     hf_alias_maya_research_veena_all_v1: str = "maya-research/Veena"
 
     audio_store_dir: str = "/tmp/tanglish_tts_audio"
+    # Canonical stored copy format (wav | mp3 | ogg | flac); empty keeps what the adapter returned.
+    audio_store_format: str = ""
+    # Default delivered format when a request does not ask for one; empty keeps the adapter format.
+    audio_output_format: str = ""
+    audio_transcode_workers: int = 2
+    audio_transcode_timeout_seconds: int = 30
+    ffmpeg_binary: str = "ffmpeg"
+    # Bounded thread pools for blocking cloud SDK calls and file I/O (local models get one per model).
+    cloud_sdk_workers: int = 16
+    file_io_workers: int = 4
     public_audio_base_url: str = "http://localhost:8000"
 
     def cors_origin_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
+    def remote_worker_url_list(self) -> list[str]:
+        urls = [self.remote_self_hosted_url or "", *self.remote_self_hosted_urls.split(",")]
+        return list(dict.fromkeys(url.strip().rstrip("/") for url in urls if url.strip()))
+
     def audio_dir_path(self) -> Path:
         return Path(self.audio_store_dir)
 
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Any, Callable, TypeVar
+
+from app.infrastructure.config.settings import Settings
+
+T = TypeVar("T")
+
+CLOUD_SDK = "cloud_sdk"
+FILE_IO = "file_io"
+TRANSCODE = "transcode"
+
+
+class BoundedExecutor:
+    # A named thread pool with a fixed worker count. Unlike run_in_executor on the default pool, calls
+    # keep the caller's contextvars (request context, cancellation token) and are measured.
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._busy_seconds = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        context = contextvars.copy_context()
+        enqueued_at = monotonic()
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+
+        def call() -> T:
+            started = monotonic()
+            waited = started - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._wait_seconds += waited
+                self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            failed = True
+            try:
+                result = context.run(fn, *args)
+                failed = False
+                return result
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._busy_seconds += monotonic() - started
+                    if failed:
+                        self._failed += 1
+                    else:
+                        self._completed += 1
+
+        future = self._executor.submit(call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call that never started is dropped from the queue; a running one finishes on its own.
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            started = self._completed + self._failed + self._active
+            return {
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "mean_wait_ms": round(self._wait_seconds * 1000 / started, 2) if started else None,
+                "max_wait_ms": round(self._max_wait_seconds * 1000, 2),
+                "busy_seconds": round(self._busy_seconds, 3),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ExecutorRegistry:
+    # One bounded executor per workload class: "local:<model repo>" for each self-hosted model,
+    # plus shared pools for cloud SDK calls, file I/O and ffmpeg transcoding.
+    def __init__(self, settings: Settings):
+        self._settings = settings
+        self._executors: dict[str, BoundedExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, max_workers: int) -> BoundedExecutor:
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = BoundedExecutor(name, max_workers)
+                self._executors[name] = executor
+            return executor
+
+    def local_model(self, model_repo: str) -> BoundedExecutor:
+        return self.get(f"local:{model_repo}", self._settings.local_model_parallelism)
+
+    @property
+    def cloud_sdk(self) -> BoundedExecutor:
+        return self.get(CLOUD_SDK, self._settings.cloud_sdk_workers)
+
+    @property
+    def file_io(self) -> BoundedExecutor:
+        return self.get(FILE_IO, self._settings.file_io_workers)
+
+    @property
+    def transcode(self) -> BoundedExecutor:
+        return self.get(TRANSCODE, self._settings.audio_transcode_workers)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            executors = dict(self._executors)
+        return {name: executor.metrics() for name, executor in sorted(executors.items())}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown()
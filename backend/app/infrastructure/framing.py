@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from app.domain.errors import DependencyMissingError
+
+# Binary transport between the orchestrator and a remote self-hosted worker. Each frame is
+# MAGIC | flags (u8) | header length (u32) | payload length (u32) | JSON header | audio payload,
+# so raw audio crosses the wire once instead of base64 inside JSON.
+FRAME_MEDIA_TYPE = "application/x-tts-frames"
+FRAME_MAGIC = b"TTSF"
+FLAG_ZSTD = 0x01
+COMPRESSIONS = ("none", "zstd")
+
+_PREFIX = struct.Struct(">4sBII")
+_MAX_HEADER_BYTES = 64 * 1024
+
+
+class FrameError(ValueError):
+    pass
+
+
+@dataclass
+class Frame:
+    header: dict[str, Any]
+    payload: bytes = b""
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise DependencyMissingError("zstandard is required for zstd frame compression") from exc
+    return zstandard
+
+
+def zstd_available() -> bool:
+    try:
+        _zstd()
+    except DependencyMissingError:
+        return False
+    return True
+
+
+def encode_frame(header: dict[str, Any], payload: bytes = b"", compression: str = "none") -> bytes:
+    flags = 0
+    if compression == "zstd" and payload:
+        payload = _zstd().ZstdCompressor(level=3).compress(payload)
+        flags |= FLAG_ZSTD
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return _PREFIX.pack(FRAME_MAGIC, flags, len(header_bytes), len(payload)) + header_bytes + payload
+
+
+def _decode_payload(flags: int, payload: bytes) -> bytes:
+    if flags & FLAG_ZSTD:
+        return _zstd().ZstdDecompressor().decompress(payload)
+    return payload
+
+
+class FrameReader:
+    # Incremental parser: feed() whatever chunk sizes the transport delivers, get complete frames back.
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[Frame]:
+        self._buffer.extend(chunk)
+        frames: list[Frame] = []
+        while len(self._buffer) >= _PREFIX.size:
+            magic, flags, header_length, payload_length = _PREFIX.unpack_from(self._buffer)
+            if magic != FRAME_MAGIC:
+                raise FrameError("Stream is not in the binary frame format")
+            if header_length > _MAX_HEADER_BYTES:
+                raise FrameError(f"Frame header too large ({header_length} bytes)")
+            end = _PREFIX.size + header_length + payload_length
+            if len(self._buffer) < end:
+                break
+            header_end = _PREFIX.size + header_length
+            try:
+                header = json.loads(bytes(self._buffer[_PREFIX.size : header_end]))
+            except ValueError as exc:
+                raise FrameError("Frame header is not valid JSON") from exc
+            payload = _decode_payload(flags, bytes(self._buffer[header_end:end]))
+            del self._buffer[:end]
+            frames.append(Frame(header=header, payload=payload))
+        return frames
+
+    def close(self) -> None:
+        if self._buffer:
+            raise FrameError(f"Stream ended inside a frame ({len(self._buffer)} bytes left over)")
+
+
+async def read_frames(chunks: AsyncIterator[bytes]) -> AsyncIterator[Frame]:
+    reader = FrameReader()
+    async for chunk in chunks:
+        for frame in reader.feed(chunk):
+            yield frame
+    reader.close()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from app.domain.entities import AdapterAudio
+from app.domain.errors import AudioTranscodeError, DependencyMissingError
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+
+AUDIO_FORMATS = ("wav", "mp3", "ogg", "flac")
+
+MEDIA_TYPES = {
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "ogg": "audio/ogg",
+    "flac": "audio/flac",
+}
+
+_ACCEPT_ALIASES = {
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav",
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/ogg": "ogg",
+    "audio/opus": "ogg",
+    "audio/flac": "flac",
+    "audio/x-flac": "flac",
+}
+
+# Ogg is always Opus here: it is the smallest of the supported codecs at speech bitrates.
+_ENCODER_ARGS = {
+    "wav": ["-c:a", "pcm_s16le", "-f", "wav"],
+    "mp3": ["-c:a", "libmp3lame", "-q:a", "4", "-f", "mp3"],
+    "ogg": ["-c:a", "libopus", "-b:a", "32k", "-application", "voip", "-f", "ogg"],
+    "flac": ["-c:a", "flac", "-compression_level", "5", "-f", "flac"],
+}
+# libopus refuses any other rate, so a requested rate is snapped to the nearest of these for ogg.
+_OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def media_type_for(audio_format: str) -> str:
+    return MEDIA_TYPES.get(audio_format, "application/octet-stream")
+
+
+def format_from_accept(accept: str | None) -> str | None:
+    # Picks the highest-q audio type we can produce; wildcards mean "no preference".
+    best: tuple[float, str] | None = None
+    for item in (accept or "").split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        audio_format = _ACCEPT_ALIASES.get(media_type.lower())
+        if audio_format is None:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and (best is None or quality > best[0]):
+            best = (quality, audio_format)
+    return best[1] if best else None
+
+
+class AudioTranscoder:
+    def __init__(self, settings: Settings, executors: ExecutorRegistry | None = None):
+        self._binary = settings.ffmpeg_binary
+        self._timeout_seconds = settings.audio_transcode_timeout_seconds
+        self._executor = (executors or ExecutorRegistry(settings)).transcode
+
+    async def transcode(
+        self,
+        audio: AdapterAudio,
+        target_format: str | None = None,
+        sample_rate: int | None = None,
+    ) -> AdapterAudio:
+        target = target_format or audio.audio_format
+        if target == audio.audio_format and not sample_rate:
+            return audio
+        if target not in _ENCODER_ARGS:
+            raise AudioTranscodeError(f"Unsupported output format '{target}'")
+        if sample_rate and target == "ogg":
+            sample_rate = min(_OPUS_SAMPLE_RATES, key=lambda rate: abs(rate - sample_rate))
+        converted = await self._executor.run(
+            self._run_ffmpeg, audio.audio_bytes, audio.audio_format, target, sample_rate
+        )
+        return AdapterAudio(audio_bytes=converted, audio_format=target, streaming_used=audio.streaming_used)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+
+    def _run_ffmpeg(self, audio_bytes: bytes, source_format: str, target_format: str, sample_rate: int | None) -> bytes:
+        binary = shutil.which(self._binary)
+        if binary is None:
+            raise DependencyMissingError(f"Audio transcoding requires ffmpeg ('{self._binary}' not found on PATH).")
+        resample = ["-ar", str(sample_rate)] if sample_rate else []
+        with tempfile.TemporaryDirectory(prefix="tts-transcode-") as tmpdir:
+            # Containers patch their headers after encoding, so the output must be seekable (not a pipe).
+            output_path = Path(tmpdir) / f"out.{target_format}"
+            command = [
+                binary,
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                source_format,
+                "-i",
+                "pipe:0",
+                *resample,
+                *_ENCODER_ARGS[target_format],
+                "-y",
+                str(output_path),
+            ]
+            try:
+                completed = subprocess.run(
+                    command,
+                    input=audio_bytes,
+                    capture_output=True,
+                    timeout=self._timeout_seconds,
+                    check=False,
+                )
+            except subprocess.TimeoutExpired as exc:
+                raise AudioTranscodeError(f"Transcoding to {target_format} timed out") from exc
+            if completed.returncode != 0 or not output_path.exists():
+                stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+                raise AudioTranscodeError(f"Transcoding to {target_format} failed: {stderr[-500:]}")
+            return output_path.read_bytes()
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from app.api.deps import close_dependencies
+from app.api.routes.capacity import router as capacity_router
 from app.api.routes.health import router as health_router
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.models import router as model_router
 from app.api.routes.tts import router as tts_router
+from app.domain.errors import CapacityExceededError
 from app.infrastructure.config.settings import settings
 from app.infrastructure.logging import configure_logging
 
 configure_logging(settings.log_level)
 
-app = FastAPI(title="Tanglish TTS Playground API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Worker processes, health/refresh tasks, gRPC channels and executor threads outlive requests.
+    await close_dependencies()
+
+
+app = FastAPI(title="Tanglish TTS Playground API", version="1.0.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origin_list(),
@@ -20,6 +36,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(CapacityExceededError)
+async def capacity_exceeded(_: Request, exc: CapacityExceededError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
+app.include_router(capacity_router)
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(model_router)
 app.include_router(tts_router)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -22,3 +24,15 @@ class AppWarning(BaseModel):
 class HealthResponse(BaseModel):
     status: str = "ok"
     warnings: list[AppWarning] = Field(default_factory=list)
+
+
+class MetricsResponse(BaseModel):
+    runtimes: dict[str, Any] = Field(default_factory=dict)
+    models: dict[str, Any] = Field(default_factory=dict)
+    executors: dict[str, Any] = Field(default_factory=dict)
+
+
+class CapacityResponse(BaseModel):
+    models: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    free_memory_mb: int | None = None
+    saturated: bool = False
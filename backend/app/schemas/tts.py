@@ -4,7 +4,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from app.domain.entities import SynthesisResult
+from app.domain.entities import AudioFormat, SynthesisPriority, SynthesisResult
 from app.schemas.common import SummaryEnvelope
 
 
@@ -13,6 +13,9 @@ class SynthesizeRequest(BaseModel):
     text: str = Field(min_length=1, max_length=5000)
     config_overrides: dict[str, Any] = Field(default_factory=dict)
     prefer_streaming: bool = True
+    output_format: AudioFormat | None = None
+    output_sample_rate: int | None = Field(default=None, ge=8000, le=48000)
+    priority: SynthesisPriority = "interactive"
 
 
 class BatchSynthesizeRequest(BaseModel):
@@ -20,6 +23,9 @@ class BatchSynthesizeRequest(BaseModel):
     text: str = Field(min_length=1, max_length=5000)
     per_model_config: dict[str, dict[str, Any]] = Field(default_factory=dict)
     prefer_streaming: bool = True
+    output_format: AudioFormat | None = None
+    output_sample_rate: int | None = Field(default=None, ge=8000, le=48000)
+    priority: SynthesisPriority = "interactive"
 
 
 class SynthesizeResponse(BaseModel):
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import json
+import resource
+import subprocess
+import sys
+import wave
+from pathlib import Path
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+DEFAULT_TEXT = "Vanakkam! Indha weekend namma Chennai beach-ku polama? Weather romba nalla irukku."
+
+MODEL_ALIASES = {
+    "parler": "ai4bharat/indic-parler-tts",
+    "veena": "maya-research/veena-all-v1",
+}
+
+
+def resolve_model_id(raw: str) -> str:
+    return MODEL_ALIASES.get(raw, raw)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 2**20 if sys.platform == "darwin" else 2**10
+    return round(peak / divisor, 1)
+
+
+def wav_duration_seconds(audio: bytes) -> float:
+    with wave.open(io.BytesIO(audio), "rb") as wav_file:
+        return wav_file.getnframes() / float(wav_file.getframerate())
+
+
+def emit(results: list[dict[str, Any]] | dict[str, Any], output: str | None) -> None:
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    if output:
+        Path(output).write_text(payload + "\n", encoding="utf-8")
+    print(payload)
+
+
+def find_regressions(
+    results: list[dict[str, Any]],
+    baseline_path: str,
+    keys: tuple[str, ...],
+    tolerance: float,
+) -> list[str]:
+    # Compares higher-is-better tokens_per_second and lower-is-better rtf against a previous run.
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    previous = {tuple(item.get(key) for key in keys): item for item in baseline}
+    regressions: list[str] = []
+    for result in results:
+        case = tuple(result.get(key) for key in keys)
+        before = previous.get(case)
+        if before is None or "error" in result:
+            continue
+        label = ", ".join(f"{key}={value}" for key, value in zip(keys, case))
+        if before.get("tokens_per_second") and result.get("tokens_per_second") is not None:
+            if result["tokens_per_second"] < before["tokens_per_second"] * (1 - tolerance):
+                regressions.append(
+                    f"{label}: tokens/sec {result['tokens_per_second']} < baseline {before['tokens_per_second']}"
+                )
+        if before.get("rtf") and result.get("rtf") is not None:
+            if result["rtf"] > before["rtf"] * (1 + tolerance):
+                regressions.append(f"{label}: rtf {result['rtf']} > baseline {before['rtf']}")
+    return regressions
+
+
+def run_isolated(module: str, args: list[str]) -> dict[str, Any]:
+    # Runs one benchmark case in a fresh interpreter (process-wide torch settings, clean peak RSS)
+    # and parses the JSON object it prints on its last stdout line.
+    completed = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=BACKEND_ROOT,
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip()[-2000:]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
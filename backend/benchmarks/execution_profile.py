@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+from time import perf_counter
+from typing import Any
+
+from benchmarks.common import DEFAULT_TEXT, emit, resolve_model_id, run_isolated
+
+from app.infrastructure.config.settings import Settings
+
+
+async def _run_case(model_id: str, threads: int, compile_decoder: bool, text: str, runs: int, concurrency: int):
+    from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+
+    runtime = HFLocalRuntime(
+        Settings(
+            local_device="cpu",
+            local_intra_op_threads=threads,
+            local_model_parallelism=concurrency,
+            local_torch_compile=compile_decoder,
+        )
+    )
+    # First call pays load + compile; it is reported separately from steady-state throughput.
+    warm_started = perf_counter()
+    await runtime.synthesize(model_id, text, {})
+    warm_seconds = perf_counter() - warm_started
+    model_key = runtime.resolve_model_repo(model_id)
+    before = dict(runtime.metrics()["generation"].get(model_key, {"tokens": 0, "seconds": 0.0}))
+
+    started = perf_counter()
+    for _ in range(runs):
+        await asyncio.gather(*(runtime.synthesize(model_id, text, {}) for _ in range(concurrency)))
+    wall_seconds = perf_counter() - started
+
+    after = runtime.metrics()["generation"][model_key]
+    tokens = after["tokens"] - before["tokens"]
+    return {
+        "warm_up_s": round(warm_seconds, 3),
+        "tokens": tokens,
+        "tokens_per_second": round(tokens / wall_seconds, 2) if wall_seconds else None,
+        "tokens_per_second_per_generation": round(tokens / (after["seconds"] - before["seconds"]), 2)
+        if after["seconds"] > before["seconds"]
+        else None,
+        "execution_profile": runtime.metrics()["execution_profile"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report tokens/sec for CPU execution profile settings.")
+    parser.add_argument("--model", default="veena", help="parler | veena | HF repo id")
+    parser.add_argument("--threads", default=f"1,2,{os.cpu_count() or 1}", help="Comma-separated intra-op threads")
+    parser.add_argument("--concurrency", default="1,2", help="Comma-separated parallel generations")
+    parser.add_argument("--compile", default="false,true", help="Comma-separated torch.compile on/off values")
+    parser.add_argument("--runs", type=int, default=2)
+    parser.add_argument("--text", default=DEFAULT_TEXT)
+    parser.add_argument("--output", default=None, help="Optional JSON output path")
+    parser.add_argument("--single-case", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    model_id = resolve_model_id(args.model)
+    if args.single_case:
+        case = json.loads(args.single_case)
+        print(json.dumps(asyncio.run(_run_case(model_id, text=args.text, runs=args.runs, **case))))
+        return
+
+    results: list[dict[str, Any]] = []
+    for compile_raw in [item.strip() for item in args.compile.split(",") if item.strip()]:
+        for threads in [int(item) for item in args.threads.split(",") if item.strip()]:
+            for concurrency in [int(item) for item in args.concurrency.split(",") if item.strip()]:
+                case = {
+                    "threads": threads,
+                    "compile_decoder": compile_raw.lower() == "true",
+                    "concurrency": concurrency,
+                }
+                result = run_isolated(
+                    "benchmarks.execution_profile",
+                    ["--model", model_id, "--runs", str(args.runs), "--text", args.text, "--single-case", json.dumps(case)],
+                )
+                results.append({"model_id": model_id, **case, **result})
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
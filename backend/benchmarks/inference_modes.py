@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from statistics import median
+from time import perf_counter
+from typing import Any
+
+from benchmarks.common import DEFAULT_TEXT, emit, peak_rss_mb, resolve_model_id, run_isolated, wav_duration_seconds
+
+from app.infrastructure.adapters.self_hosted.precision import INFERENCE_MODES
+from app.infrastructure.config.settings import Settings
+
+
+def _mode_setting(model_id: str) -> str:
+    return "local_inference_mode_veena" if "veena" in model_id.lower() else "local_inference_mode_parler"
+
+
+async def _run_single_mode(model_id: str, mode: str, text: str, runs: int) -> dict[str, Any]:
+    from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+
+    runtime = HFLocalRuntime(Settings(local_device="cpu", **{_mode_setting(model_id): mode}))
+    rss_before_load = peak_rss_mb()
+    load_started = perf_counter()
+    await runtime.synthesize(model_id, text, {"max_new_tokens": 128})
+    warm_seconds = perf_counter() - load_started
+    rss_after_load = peak_rss_mb()
+
+    latencies: list[float] = []
+    rtfs: list[float] = []
+    for _ in range(runs):
+        started = perf_counter()
+        audio = await runtime.synthesize(model_id, text, {})
+        elapsed = perf_counter() - started
+        latencies.append(elapsed)
+        duration = wav_duration_seconds(audio)
+        rtfs.append(elapsed / duration if duration else float("inf"))
+
+    return {
+        "model_id": model_id,
+        "mode": mode,
+        "effective_mode": runtime.metrics().get("inference_modes", {}).get(runtime.resolve_model_repo(model_id), mode),
+        "load_and_first_run_s": round(warm_seconds, 3),
+        "median_latency_s": round(median(latencies), 3),
+        "median_rtf": round(median(rtfs), 3),
+        "model_rss_mb": round(rss_after_load - rss_before_load, 1),
+        "peak_rss_mb": peak_rss_mb(),
+        "runs": runs,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare RTF and memory of CPU inference modes.")
+    parser.add_argument("--model", default="veena", help="parler | veena | HF repo id")
+    parser.add_argument("--modes", default=",".join(INFERENCE_MODES))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--text", default=DEFAULT_TEXT)
+    parser.add_argument("--output", default=None, help="Optional JSON output path")
+    parser.add_argument("--single-mode", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    model_id = resolve_model_id(args.model)
+    if args.single_mode:
+        print(json.dumps(asyncio.run(_run_single_mode(model_id, args.single_mode, args.text, args.runs))))
+        return
+
+    # Each mode runs in a fresh interpreter so peak RSS is attributable to that mode alone.
+    results: list[dict[str, Any]] = []
+    for mode in [item.strip() for item in args.modes.split(",") if item.strip()]:
+        result = run_isolated(
+            "benchmarks.inference_modes",
+            ["--model", model_id, "--runs", str(args.runs), "--text", args.text, "--single-mode", mode],
+        )
+        results.append({"model_id": model_id, "mode": mode, **result})
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+from time import perf_counter
+from typing import Any, Callable
+
+from benchmarks.common import emit
+
+from app.infrastructure.config.settings import Settings
+
+
+def _time_calls(fn: Callable[[], Any], runs: int) -> float:
+    fn()
+    started = perf_counter()
+    for _ in range(runs):
+        fn()
+    return round((perf_counter() - started) * 1000 / runs, 3)
+
+
+def _snac_case(torch, backend, snac_model: Any, source: str, frames: int, runs: int) -> dict[str, Any]:
+    onnx_snac = backend.snac_decoder(snac_model, source, torch)
+    if onnx_snac is None:
+        return {"component": "snac_decode", "frames": frames, "error": "onnx export failed"}
+    codes = [torch.randint(0, 4096, (1, frames * 2**level)) for level in range(3)]
+    with torch.no_grad():
+        reference = snac_model.decode(codes)
+        torch_ms = _time_calls(lambda: snac_model.decode(codes), runs)
+    candidate = onnx_snac.decode(codes)
+    onnx_ms = _time_calls(lambda: onnx_snac.decode(codes), runs)
+    return {
+        "component": "snac_decode",
+        "frames": frames,
+        "torch_ms": torch_ms,
+        "onnx_ms": onnx_ms,
+        "speedup": round(torch_ms / onnx_ms, 2) if onnx_ms else None,
+        "max_abs_diff": float((reference - candidate).abs().max()),
+    }
+
+
+def _text_encoder_case(torch, backend, model: Any, source: str, tokens: int, runs: int) -> dict[str, Any]:
+    input_ids = torch.randint(4, 200, (1, tokens))
+    attention_mask = torch.ones_like(input_ids)
+    encoder = model.text_encoder
+    with torch.no_grad():
+        reference = encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+        torch_ms = _time_calls(lambda: encoder(input_ids=input_ids, attention_mask=attention_mask), runs)
+    path = backend.prepare_text_encoder(model, source, torch)
+    if path is None:
+        return {"component": "parler_text_encoder", "tokens": tokens, "error": "onnx export failed"}
+    backend.attach_text_encoder(model, path, torch)
+    candidate = encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+    onnx_ms = _time_calls(lambda: encoder(input_ids=input_ids, attention_mask=attention_mask), runs)
+    return {
+        "component": "parler_text_encoder",
+        "tokens": tokens,
+        "torch_ms": torch_ms,
+        "onnx_ms": onnx_ms,
+        "speedup": round(torch_ms / onnx_ms, 2) if onnx_ms else None,
+        "max_abs_diff": float((reference - candidate).abs().max()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare torch and ONNX Runtime for SNAC decode / Parler text encoder.")
+    parser.add_argument("--components", default="snac,parler", help="Comma-separated: snac, parler")
+    parser.add_argument("--snac-repo", default=None, help="Benchmark a real SNAC checkpoint instead of the tiny model")
+    parser.add_argument("--frames", default="16,64,256", help="Comma-separated SNAC frame counts")
+    parser.add_argument("--tokens", default="16,64", help="Comma-separated description token lengths")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=0, help="Intra-op threads for torch and ONNX (0 = torch default)")
+    parser.add_argument("--output", default=None, help="Optional JSON output path")
+    args = parser.parse_args()
+
+    import torch
+
+    from app.infrastructure.adapters.self_hosted.onnx_backend import OnnxBackend
+    from benchmarks.tiny_models import TINY_PARLER_REPO, build_tiny_parler_runtime, build_tiny_snac
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    components = {item.strip() for item in args.components.split(",") if item.strip()}
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        backend = OnnxBackend(
+            Settings(local_onnx_cache_dir=cache_dir),
+            intra_op_threads=torch.get_num_threads(),
+            parallel_generations=1,
+        )
+        if "snac" in components:
+            if args.snac_repo:
+                from snac import SNAC
+
+                snac_model, source = SNAC.from_pretrained(args.snac_repo).eval(), args.snac_repo
+            else:
+                snac_model, codec = build_tiny_snac(torch)
+                source = f"tiny/{codec}"
+            for frames in [int(item) for item in args.frames.split(",") if item.strip()]:
+                results.append(_snac_case(torch, backend, snac_model, source, frames, args.runs))
+        if "parler" in components:
+            for tokens in [int(item) for item in args.tokens.split(",") if item.strip()]:
+                # Fresh model per case: attaching the ONNX encoder replaces the torch forward in place.
+                model = build_tiny_parler_runtime(torch)["model"]
+                results.append(_text_encoder_case(torch, backend, model, TINY_PARLER_REPO, tokens, args.runs))
+    emit(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from app.infrastructure.adapters.self_hosted.conditioning_cache import DescriptionConditioningCache
+from app.infrastructure.adapters.self_hosted.prefix_cache import PrefixKVCache
+from app.infrastructure.adapters.self_hosted.veena_vocab import AUDIO_CODE_END
+
+# Randomly initialized models with the real architectures and vocab layouts but a few layers and a
+# narrow hidden size. Nothing is downloaded; the numbers are for catching runtime regressions
+# (per-stage overhead, concurrency scaling), not for predicting production latency.
+
+TINY_VEENA_REPO = "tiny/veena-random"
+TINY_PARLER_REPO = "tiny/indic-parler-random"
+
+
+class CharTokenizer:
+    # Byte-level stand-in covering both tokenizer call styles used by the runtimes.
+    vocab_size = 260
+    pad_token_id = 0
+    eos_token_id = 1
+
+    def encode(self, text: str, add_special_tokens: bool = False) -> list[int]:
+        ids = [4 + byte for byte in text.encode("utf-8")]
+        return [*ids, self.eos_token_id] if add_special_tokens else ids
+
+    def __call__(self, text: str, return_tensors: str = "pt") -> Any:
+        import torch
+
+        _ = return_tensors
+        input_ids = torch.tensor([self.encode(text, add_special_tokens=True)])
+        return SimpleNamespace(input_ids=input_ids, attention_mask=torch.ones_like(input_ids))
+
+
+def build_tiny_snac(torch_module) -> tuple[Any, str]:
+    try:
+        from snac import SNAC
+    except ImportError:
+        return build_stub_codec_decoder(torch_module), "stub"
+    # snac_24khz layout (4096-entry codebooks, strides 4/2/1) with a much narrower decoder.
+    model = SNAC(
+        sampling_rate=24000,
+        encoder_dim=8,
+        encoder_rates=[2, 4, 8, 8],
+        decoder_dim=64,
+        decoder_rates=[8, 8, 4, 2],
+        attn_window_size=None,
+        codebook_size=4096,
+        codebook_dim=8,
+        vq_strides=[4, 2, 1],
+        noise=True,
+        depthwise=True,
+    )
+    return model.eval(), "snac"
+
+
+def build_stub_codec_decoder(torch_module) -> Any:
+    # Used only when the snac package is missing: upsamples each coarse code to 2048 samples like snac_24khz.
+    class StubCodecDecoder(torch_module.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.embed = torch_module.nn.Embedding(4096, 16)
+            self.upsample = torch_module.nn.ConvTranspose1d(16, 1, kernel_size=2048, stride=2048)
+
+        def decode(self, hierarchical_codes):
+            coarse = self.embed(hierarchical_codes[0].long()).transpose(1, 2)
+            return torch_module.tanh(self.upsample(coarse))
+
+    return StubCodecDecoder().eval()
+
+
+def build_tiny_veena_runtime(torch_module, prefix_cache_mb: int = 64, audio_vocab_only: bool = True) -> dict[str, Any]:
+    from transformers import LlamaConfig, LlamaForCausalLM
+
+    from app.infrastructure.adapters.self_hosted.veena_vocab import restrict_lm_head_to_audio_vocab
+
+    torch_module.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=AUDIO_CODE_END + 8,
+        hidden_size=64,
+        intermediate_size=128,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=4096,
+    )
+    model = LlamaForCausalLM(config).eval()
+    restricted = audio_vocab_only and restrict_lm_head_to_audio_vocab(model, torch_module)
+    snac_model, codec = build_tiny_snac(torch_module)
+    return {
+        "kind": "veena",
+        "model_repo": TINY_VEENA_REPO,
+        "model": model,
+        "tokenizer": CharTokenizer(),
+        "snac_model": snac_model,
+        "audio_vocab_only": audio_vocab_only,
+        "restricted_lm_head": restricted,
+        "prefix_cache": PrefixKVCache(budget_bytes=prefix_cache_mb * 2**20),
+        "inference_mode": "fp32",
+        "autocast_dtype": None,
+        "static_cache": False,
+        "codec": codec,
+    }
+
+
+def build_tiny_parler_runtime(torch_module, description_cache_size: int = 16) -> dict[str, Any]:
+    from parler_tts import ParlerTTSConfig, ParlerTTSDecoderConfig, ParlerTTSForConditionalGeneration
+    from parler_tts.dac_wrapper import DACConfig
+    from transformers import T5Config
+
+    tokenizer = CharTokenizer()
+    torch_module.manual_seed(0)
+    text_encoder = T5Config(
+        vocab_size=tokenizer.vocab_size,
+        d_model=32,
+        d_kv=8,
+        d_ff=64,
+        num_layers=1,
+        num_heads=4,
+        pad_token_id=tokenizer.pad_token_id,
+        eos_token_id=tokenizer.eos_token_id,
+    )
+    # DAC 44.1 kHz codec layout used by Indic Parler; the codec itself keeps its fixed architecture.
+    audio_encoder = DACConfig(
+        num_codebooks=9,
+        model_bitrate=8,
+        codebook_size=1024,
+        latent_dim=1024,
+        frame_rate=86,
+        sampling_rate=44100,
+    )
+    decoder = ParlerTTSDecoderConfig(
+        vocab_size=1088,
+        max_position_embeddings=4096,
+        num_hidden_layers=2,
+        ffn_dim=128,
+        num_attention_heads=4,
+        hidden_size=64,
+        num_codebooks=9,
+        pad_token_id=1024,
+        bos_token_id=1025,
+        eos_token_id=1024,
+    )
+    config = ParlerTTSConfig.from_sub_models_config(
+        text_encoder,
+        audio_encoder,
+        decoder,
+        vocab_size=tokenizer.vocab_size,
+    )
+    model = ParlerTTSForConditionalGeneration(config).eval()
+    generation_config = model.generation_config
+    generation_config.decoder_start_token_id = 1025
+    generation_config.pad_token_id = 1024
+    generation_config.eos_token_id = 1024
+    generation_config.max_length = 4096
+    generation_config.do_sample = True
+    return {
+        "kind": "parler",
+        "model_repo": TINY_PARLER_REPO,
+        "model": model,
+        "prompt_tokenizer": tokenizer,
+        "description_tokenizer": tokenizer,
+        "description_cache": DescriptionConditioningCache(max_entries=description_cache_size),
+        "device": "cpu",
+        "inference_mode": "fp32",
+        "autocast_dtype": None,
+        "static_cache": False,
+        "codec": "dac",
+    }
+
+
+TINY_BUILDERS = {
+    "veena": (TINY_VEENA_REPO, build_tiny_veena_runtime),
+    "parler": (TINY_PARLER_REPO, build_tiny_parler_runtime),
+}
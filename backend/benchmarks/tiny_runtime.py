@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from time import perf_counter
+from typing import Any
+
+from benchmarks.common import DEFAULT_TEXT, emit, find_regressions, peak_rss_mb, run_isolated, wav_duration_seconds
+
+from app.infrastructure.config.settings import Settings
+
+
+async def _run_case(model: str, concurrency: int, runs: int, text: str, max_new_tokens: int) -> dict[str, Any]:
+    import torch
+
+    from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+    from app.infrastructure.adapters.self_hosted.residency import estimate_runtime_bytes
+    from benchmarks.tiny_models import TINY_BUILDERS
+
+    model_repo, builder = TINY_BUILDERS[model]
+    runtime = HFLocalRuntime(Settings(local_device="cpu", local_model_parallelism=concurrency))
+    runtime._profile.apply_thread_budget(torch)
+    loaded = builder(torch)
+    runtime._residency.admit(model_repo, loaded, estimate_runtime_bytes(loaded))
+    config = {"max_new_tokens": max_new_tokens}
+
+    # One warm-up request so caches and allocator pools are populated before measuring.
+    await runtime.synthesize(model_repo, text, config)
+    warm_metrics = runtime.metrics()
+
+    started = perf_counter()
+    audio_seconds = 0.0
+    for _ in range(runs):
+        outputs = await asyncio.gather(*(runtime.synthesize(model_repo, text, config) for _ in range(concurrency)))
+        audio_seconds += sum(wav_duration_seconds(audio) for audio in outputs)
+    wall_seconds = perf_counter() - started
+
+    metrics = runtime.metrics()
+    generation = metrics["generation"][model_repo]
+    tokens = generation["tokens"] - warm_metrics["generation"][model_repo]["tokens"]
+    stages = _stage_delta(warm_metrics["stages"].get(model_repo, {}), metrics["stages"].get(model_repo, {}))
+    return {
+        "codec": loaded.get("codec"),
+        "requests": runs * concurrency,
+        "wall_s": round(wall_seconds, 3),
+        "tokens": tokens,
+        "tokens_per_second": round(tokens / wall_seconds, 2) if wall_seconds else None,
+        "audio_s": round(audio_seconds, 3),
+        "rtf": round(wall_seconds / audio_seconds, 4) if audio_seconds else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages_ms_per_request": stages,
+    }
+
+
+def _stage_delta(before: dict[str, Any], after: dict[str, Any]) -> dict[str, float]:
+    delta: dict[str, float] = {}
+    for stage, stats in after.items():
+        previous = before.get(stage, {"count": 0, "seconds": 0.0})
+        count = stats["count"] - previous["count"]
+        if count:
+            delta[stage] = round((stats["seconds"] - previous["seconds"]) * 1000 / count, 2)
+    return delta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark HFLocalRuntime with tiny random-weight Parler/Veena models (no downloads)."
+    )
+    parser.add_argument("--models", default="veena,parler", help="Comma-separated: veena, parler")
+    parser.add_argument("--concurrency", default="1,2,4", help="Comma-separated concurrent requests")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-new-tokens", type=int, default=224)
+    parser.add_argument("--text", default=DEFAULT_TEXT)
+    parser.add_argument("--output", default=None, help="Optional JSON output path")
+    parser.add_argument("--baseline", default=None, help="Previous JSON output; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative slowdown vs. baseline")
+    parser.add_argument("--single-case", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single_case:
+        case = json.loads(args.single_case)
+        result = asyncio.run(_run_case(runs=args.runs, text=args.text, max_new_tokens=args.max_new_tokens, **case))
+        print(json.dumps(result))
+        return
+
+    results: list[dict[str, Any]] = []
+    for model in [item.strip() for item in args.models.split(",") if item.strip()]:
+        for concurrency in [int(item) for item in args.concurrency.split(",") if item.strip()]:
+            case = {"model": model, "concurrency": concurrency}
+            result = run_isolated(
+                "benchmarks.tiny_runtime",
+                [
+                    "--runs",
+                    str(args.runs),
+                    "--max-new-tokens",
+                    str(args.max_new_tokens),
+                    "--text",
+                    args.text,
+                    "--single-case",
+                    json.dumps(case),
+                ],
+            )
+            results.append({**case, **result})
+    emit(results, args.output)
+    if args.baseline:
+        regressions = find_regressions(results, args.baseline, ("model", "concurrency"), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import io
+import struct
+import tempfile
+import wave
+from typing import Any
+
+import pytest
+
+from app.application.synthesis_service import SynthesisService
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, ConfigStatus, ModelCapabilities
+from app.infrastructure.audio_metadata import audio_duration_ms
+from app.infrastructure.audio_store import AudioStore
+from app.infrastructure.config.settings import Settings
+
+
+def _wav(seconds: float, sample_rate: int = 24000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"\x00\x00" * int(seconds * sample_rate))
+    return buffer.getvalue()
+
+
+def _ogg_page(granule: int, payload: bytes, header_type: int = 0) -> bytes:
+    return b"OggS" + struct.pack("<BBqIIIB", 0, header_type, granule, 1, 0, 0, 1) + bytes([len(payload)]) + payload
+
+
+def test_duration_from_wav_flac_mp3_and_ogg_headers() -> None:
+    assert audio_duration_ms(_wav(1.5), "wav") == 1500
+
+    streaminfo = bytearray(34)
+    streaminfo[10:18] = ((16000 << 44) | (1 << 41) | (15 << 36) | 40000).to_bytes(8, "big")
+    flac = b"fLaC" + bytes([0x80, 0, 0, 34]) + bytes(streaminfo)
+    assert audio_duration_ms(flac, "flac") == 2500
+
+    # MPEG-1 layer III, 128 kbps, 44.1 kHz, CBR: 16000 bytes of frames = 1 second.
+    mp3 = b"\xff\xfb\x90\x00" + bytes(15996)
+    assert audio_duration_ms(mp3, "mp3") == 1000
+
+    opus_head = b"OpusHead" + bytes([1, 1]) + struct.pack("<H", 312) + bytes(10)
+    ogg = _ogg_page(0, opus_head, header_type=2) + _ogg_page(48000 * 3 + 312, b"audio", header_type=4)
+    assert audio_duration_ms(ogg, "ogg") == 3000
+
+    assert audio_duration_ms(b"not audio", "wav") is None
+    assert audio_duration_ms(b"RIFF", "wav") is None
+
+
+class ClipAdapter(TTSAdapter):
+    model_id = "clip-model"
+    display_name = "CLIP"
+    provider = "test"
+    category = "cloud"
+    capabilities = ModelCapabilities()
+    config_schema = []
+    runtime_alias = None
+
+    def check_configuration(self) -> ConfigStatus:
+        return ConfigStatus(configured=True, warnings=[])
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (config, prefer_streaming)
+        return AdapterAudio(audio_bytes=_wav(len(text) / 10, sample_rate=8000), audio_format="wav")
+
+
+@pytest.mark.asyncio
+async def test_results_carry_duration_and_rtf_aggregated_per_model() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Settings(audio_store_dir=tmpdir)
+        service = SynthesisService(adapters={"clip-model": ClipAdapter()}, settings=cfg, audio_store=AudioStore(cfg))
+
+        short = await service.synthesize_one("clip-model", "x" * 10, {}, prefer_streaming=False)
+        long = await service.synthesize_one("clip-model", "x" * 30, {}, prefer_streaming=False)
+
+        assert short.audio_duration_ms == 1000
+        assert long.audio_duration_ms == 3000
+        assert long.audio_bytes == 44 + 3 * 8000 * 2
+        assert long.rtf is not None and long.rtf >= 0
+
+        stats = service.metrics()["clip-model"]
+        assert stats["requests"] == 2
+        assert stats["failures"] == 0
+        assert stats["audio_seconds"] == 4.0
+        assert stats["audio_bytes"] == short.audio_bytes + long.audio_bytes
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from app.application.synthesis_service import SynthesisService
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, ConfigStatus, ModelCapabilities
+from app.domain.errors import GenerationCancelledError
+from app.domain.request_context import current_request_context
+from app.infrastructure.audio_store import AudioStore
+from app.infrastructure.config.settings import Settings
+
+
+class BlockingLocalAdapter(TTSAdapter):
+    # Mimics HFLocalRuntime: blocking work in a thread that only stops when its token is tripped.
+    model_id = "blocking-local"
+    display_name = "BLOCKING"
+    provider = "test"
+    category = "cloud"
+    capabilities = ModelCapabilities()
+    config_schema = []
+    runtime_alias = None
+
+    def __init__(self):
+        self.stopped = threading.Event()
+
+    def check_configuration(self) -> ConfigStatus:
+        return ConfigStatus(configured=True, warnings=[])
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (text, config, prefer_streaming)
+        await asyncio.to_thread(self._generate)
+        return AdapterAudio(audio_bytes=b"late", audio_format="wav", streaming_used=False)
+
+    def _generate(self) -> None:
+        token = current_request_context().cancel_token
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if token.cancelled:
+                self.stopped.set()
+                return
+            time.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_timeout_trips_the_cancellation_token_seen_by_worker_threads() -> None:
+    adapter = BlockingLocalAdapter()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Settings(audio_store_dir=tmpdir, model_timeout_seconds=1)
+        service = SynthesisService(adapters={adapter.model_id: adapter}, settings=cfg, audio_store=AudioStore(cfg))
+
+        result = await service.synthesize_one(adapter.model_id, "hi", {}, prefer_streaming=False)
+
+    assert result.success is False and "Timed out" in (result.error or "")
+    assert await asyncio.to_thread(adapter.stopped.wait, 2)
+
+
+def test_windowed_snac_decode_matches_single_pass_and_stops_between_windows() -> None:
+    torch = pytest.importorskip("torch")
+
+    from app.infrastructure.adapters.self_hosted.snac_decode import decode_snac_windowed
+    from benchmarks.tiny_models import build_stub_codec_decoder
+
+    torch.manual_seed(0)
+    decoder = build_stub_codec_decoder(torch)
+    codes = [torch.randint(0, 4096, (1, 37 * 2**level)) for level in range(3)]
+    with torch.no_grad():
+        expected = decoder.decode(codes)
+        windowed = decode_snac_windowed(decoder, codes, 8, 2, lambda: False, torch)
+        assert torch.allclose(windowed, expected, atol=1e-6)
+
+        calls = []
+
+        def cancel_after_two_windows() -> bool:
+            calls.append(1)
+            return len(calls) > 2
+
+        with pytest.raises(GenerationCancelledError):
+            decode_snac_windowed(decoder, codes, 8, 2, cancel_after_two_windows, torch)
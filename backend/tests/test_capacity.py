@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.synthesis_service import SynthesisService
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, ConfigStatus, ModelCapabilities
+from app.domain.errors import CapacityExceededError
+from app.infrastructure.adapters.remote.veena_all_v1 import RemoteVeenaAllV1Adapter
+from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.adapters.self_hosted.veena_all_v1 import VeenaAllV1Adapter
+from app.infrastructure.audio_store import AudioStore
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.framing import encode_frame
+from app.main import app
+
+VEENA = "maya-research/veena-all-v1"
+
+
+@pytest.mark.asyncio
+async def test_worker_advertises_queue_state_and_refuses_work_when_saturated() -> None:
+    settings = Settings(backend_role="self_hosted_worker", local_max_queue_depth=1, local_model_parallelism=1)
+    runtime = HFLocalRuntime(settings)
+    adapter = VeenaAllV1Adapter(settings, httpx.AsyncClient(), runtime)
+    model_repo = runtime.resolve_model_repo(VEENA)
+
+    assert adapter.capacity()["saturated"] is False
+    release = asyncio.Event()
+
+    async def occupy() -> None:
+        async with runtime._scheduler.slot(model_repo, "interactive", 10):
+            await release.wait()
+
+    tasks = [asyncio.create_task(occupy()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    capacity = adapter.capacity()
+    assert capacity["active"] == 1 and capacity["queued"] == 1
+    assert capacity["warm"] is False and capacity["saturated"] is True
+    with pytest.raises(CapacityExceededError) as refused:
+        adapter.admit()
+    assert refused.value.retry_after_seconds >= 1
+
+    with patch("app.api.routes.tts.get_adapters", lambda: {VEENA: adapter}):
+        response = await asyncio.to_thread(
+            TestClient(app).post, "/tts/synthesize-raw", json={"model_id": VEENA, "text": "hi"}
+        )
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+
+class HealthyAdapter(TTSAdapter):
+    model_id = "healthy-model"
+    display_name = "HEALTHY"
+    provider = "test"
+    category = "cloud"
+    capabilities = ModelCapabilities()
+    config_schema = []
+    runtime_alias = None
+
+    def check_configuration(self) -> ConfigStatus:
+        return ConfigStatus(configured=True, warnings=[])
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (text, config, prefer_streaming)
+        return AdapterAudio(audio_bytes=b"ok", audio_format="wav", streaming_used=False)
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_a_saturated_model_as_its_own_failure(tmp_path) -> None:
+    settings = Settings(local_max_queue_depth=1, local_model_parallelism=1, audio_store_dir=str(tmp_path))
+    runtime = HFLocalRuntime(settings)
+    adapters = {VEENA: VeenaAllV1Adapter(settings, httpx.AsyncClient(), runtime), "healthy-model": HealthyAdapter()}
+    service = SynthesisService(adapters=adapters, settings=settings, audio_store=AudioStore(settings))
+    model_repo = runtime.resolve_model_repo(VEENA)
+    release = asyncio.Event()
+
+    async def occupy() -> None:
+        async with runtime._scheduler.slot(model_repo, "interactive", 10):
+            await release.wait()
+
+    tasks = [asyncio.create_task(occupy()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    with (
+        patch("app.api.routes.tts.get_adapters", lambda: adapters),
+        patch("app.api.routes.tts.get_synthesis_service", lambda: service),
+    ):
+        response = await asyncio.to_thread(
+            TestClient(app).post,
+            "/tts/synthesize-batch",
+            json={"model_ids": [VEENA, "healthy-model"], "text": "hi"},
+        )
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert response.status_code == 200
+    by_id = {result["model_id"]: result for result in response.json()["results"]}
+    assert by_id["healthy-model"]["success"] is True
+    assert by_id[VEENA]["success"] is False
+    assert "queue is full" in by_id[VEENA]["error"]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_prefers_warm_worker_and_skips_it_while_saturated() -> None:
+    def capacity(warm: bool, queued: int) -> dict:
+        entry = {"warm": warm, "active": 1, "queued": queued, "slots": 1, "mean_service_ms": 2000, "saturated": False}
+        return {"models": {VEENA: entry}}
+
+    documents = {"cold.example": capacity(False, 0), "warm.example": capacity(True, 2)}
+    synth_hosts: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/capacity":
+            return httpx.Response(200, json=documents[request.url.host])
+        synth_hosts.append(request.url.host)
+        if request.url.host == "warm.example" and len(synth_hosts) > 1:
+            return httpx.Response(503, json={"detail": "queue is full"}, headers={"Retry-After": "30"})
+        result = {"model_id": VEENA, "success": True, "audio_format": "wav"}
+        return httpx.Response(200, content=encode_frame(result, request.url.host.encode()))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    settings = Settings(
+        backend_role="orchestrator",
+        remote_self_hosted_urls="https://cold.example,https://warm.example",
+        remote_worker_health_interval_seconds=0,
+    )
+    adapter = RemoteVeenaAllV1Adapter(settings=settings, http_client=client)
+    await adapter.worker_pool.check_health()
+
+    first = await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    assert first.audio_bytes == b"warm.example"
+
+    second = await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    assert second.audio_bytes == b"cold.example"
+    assert synth_hosts == ["warm.example", "warm.example", "cold.example"]
+    cold, warm = adapter.worker_pool.workers
+    assert warm.failures == 0 and warm.saturated_until > 0
+    assert adapter.worker_pool.pick(model_ids=[VEENA]) is cold
+    await client.aclose()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.conditioning_cache import (
+    DescriptionConditioning,
+    DescriptionConditioningCache,
+    description_cache_namespace,
+)
+from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.config.settings import Settings
+
+
+def test_description_cache_evicts_least_recently_used_entry() -> None:
+    cache = DescriptionConditioningCache(max_entries=2)
+    for description in ("jaya", "arjun", "jaya", "meera"):
+        if cache.get(description) is None:
+            cache.put(description, DescriptionConditioning(input_ids=description, attention_mask=None))
+
+    assert cache.get("arjun") is None
+    assert cache.get("jaya") is not None
+    assert cache.metrics()["hits"] == 2
+
+
+def test_description_disk_entries_are_keyed_by_revision_dtype_mode_and_backend(tmp_path) -> None:
+    base = ("ai4bharat/indic-parler-tts", "abc123", "torch.float32", "fp32", "torch")
+    variants = [
+        base,
+        (base[0], "def456", *base[2:]),
+        (*base[:2], "torch.bfloat16", "bf16", base[4]),
+        (*base[:3], "int8", base[4]),
+        (*base[:4], "onnx"),
+    ]
+    paths = {
+        DescriptionConditioningCache(
+            max_entries=4, persist_dir=str(tmp_path), namespace=description_cache_namespace(*variant)
+        )._disk_path("Jaya speaks Tamil.")
+        for variant in variants
+    }
+    assert len(paths) == len(variants)
+
+
+def test_run_parler_reuses_cached_description_encoding() -> None:
+    torch = pytest.importorskip("torch")
+    runtime = HFLocalRuntime(Settings())
+
+    class DummyTokenizer:
+        def __init__(self):
+            self.calls: list[str] = []
+
+        def __call__(self, text: str, return_tensors: str = "pt"):
+            _ = return_tensors
+            self.calls.append(text)
+            return type(
+                "TokenBatch",
+                (),
+                {
+                    "input_ids": torch.ones((1, 3), dtype=torch.int64),
+                    "attention_mask": torch.ones((1, 3), dtype=torch.int64),
+                },
+            )()
+
+    class DummyParlerModel(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.p = torch.nn.Parameter(torch.zeros(1))
+            self.config = type("Cfg", (), {"sampling_rate": 24000})()
+            self.generation_config = type("GenCfg", (), {})()
+            self.encoder_calls = 0
+            self.generate_kwargs: list[dict] = []
+
+        def _prepare_text_encoder_kwargs_for_generation(self, inputs, model_kwargs, input_name, generation_config):
+            _ = (inputs, input_name, generation_config)
+            self.encoder_calls += 1
+            return {**model_kwargs, "encoder_outputs": (torch.zeros((1, 3, 4)),)}
+
+        def generate(self, **kwargs):
+            self.generate_kwargs.append(kwargs)
+            return torch.linspace(-0.2, 0.2, steps=240).unsqueeze(0)
+
+    description_tokenizer = DummyTokenizer()
+    prompt_tokenizer = DummyTokenizer()
+    model = DummyParlerModel()
+    loaded = {
+        "model": model,
+        "prompt_tokenizer": prompt_tokenizer,
+        "description_tokenizer": description_tokenizer,
+        "description_cache": DescriptionConditioningCache(max_entries=4),
+        "device": "cpu",
+    }
+    for text in ("first sentence", "second sentence"):
+        runtime._run_parler(loaded, text=text, config={"description": "Jaya speaks Tamil."})
+
+    assert description_tokenizer.calls == ["Jaya speaks Tamil."]
+    assert prompt_tokenizer.calls == ["first sentence", "second sentence"]
+    assert model.encoder_calls == 1
+    assert all("encoder_outputs" in kwargs for kwargs in model.generate_kwargs)
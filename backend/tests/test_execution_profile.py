@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.execution_profile import ExecutionProfile
+from app.infrastructure.config.settings import Settings
+
+
+def test_execution_profile_splits_cores_across_parallel_generations(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+    profile = ExecutionProfile.from_settings(Settings(local_model_parallelism=2))
+    assert profile.intra_op_threads == 4
+    assert profile.static_cache is False
+    assert profile.bucket_max_new_tokens(700) == 700
+
+    compiled = ExecutionProfile.from_settings(Settings(local_intra_op_threads=3, local_torch_compile=True))
+    assert compiled.intra_op_threads == 3
+    assert compiled.static_cache is True
+    assert compiled.bucket_max_new_tokens(700) == 768
+
+    workers = ExecutionProfile.from_settings(Settings(local_inference_workers=4, local_model_parallelism=2))
+    assert workers.intra_op_threads == 2
+
+
+def test_compile_cache_round_trips_mega_cache_without_env_vars(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.delenv("TORCHINDUCTOR_CACHE_DIR", raising=False)
+    profile = ExecutionProfile.from_settings(Settings(local_compile_cache_dir=str(tmp_path)))
+    loaded: list[bytes] = []
+    fake_torch = SimpleNamespace(
+        compiler=SimpleNamespace(
+            save_cache_artifacts=lambda: (b"artifacts", {}),
+            load_cache_artifacts=loaded.append,
+        )
+    )
+
+    profile.prepare_compile_cache(fake_torch)
+    assert loaded == []
+    profile.save_compile_cache(fake_torch)
+    profile.prepare_compile_cache(fake_torch)
+    assert loaded == [b"artifacts"]
+    assert "TORCHINDUCTOR_CACHE_DIR" not in os.environ
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.domain.request_context import current_request_context, request_context
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+
+
+@pytest.mark.asyncio
+async def test_local_model_executor_is_bounded_and_keeps_request_context() -> None:
+    registry = ExecutorRegistry(Settings(local_model_parallelism=1))
+    executor = registry.local_model("org/model")
+    assert registry.local_model("org/model") is executor
+
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def generate() -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return current_request_context().priority
+
+    with request_context("prefetch"):
+        priorities = await asyncio.gather(*(executor.run(generate) for _ in range(3)))
+
+    assert priorities == ["prefetch"] * 3
+    assert peak == 1
+    metrics = registry.metrics()["local:org/model"]
+    assert metrics["max_workers"] == 1 and metrics["completed"] == 3
+    assert metrics["queued"] == 0 and metrics["active"] == 0
+    assert metrics["max_wait_ms"] >= 50
+    registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_leaves_the_queue_without_running() -> None:
+    registry = ExecutorRegistry(Settings(file_io_workers=1))
+    release = threading.Event()
+    ran: list[str] = []
+
+    blocker = asyncio.ensure_future(registry.file_io.run(release.wait, 5))
+    queued = asyncio.ensure_future(registry.file_io.run(ran.append, "queued"))
+    await asyncio.sleep(0.05)
+    assert registry.metrics()["file_io"]["queued"] == 1
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    await blocker
+
+    assert ran == []
+    assert registry.metrics()["file_io"]["queued"] == 0
+    registry.shutdown()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.infrastructure.adapters.cloud.google_auth import GoogleCredentialManager
+from app.infrastructure.adapters.cloud.google_chirp3_hd import GoogleEnINChirp3HDAdapter
+from app.infrastructure.adapters.factory import build_adapters
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+
+pytest.importorskip("google.auth")
+
+
+class FakeCredentials:
+    def __init__(self, lifetime_seconds: float):
+        self.lifetime_seconds = lifetime_seconds
+        self.token: str | None = None
+        self.expiry: datetime | None = None
+        self.threads: list[int] = []
+
+    def refresh(self, request) -> None:
+        _ = request
+        time.sleep(0.05)
+        self.threads.append(threading.get_ident())
+        self.token = f"token-{len(self.threads)}"
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=self.lifetime_seconds)
+
+
+def _manager(credentials: FakeCredentials, margin_seconds: int) -> tuple[GoogleCredentialManager, list[int]]:
+    settings = Settings(
+        google_application_credentials="/keys/sa.json", google_token_refresh_margin_seconds=margin_seconds
+    )
+    manager = GoogleCredentialManager(settings, ExecutorRegistry(settings))
+    loads: list[int] = []
+
+    def load() -> FakeCredentials:
+        loads.append(1)
+        return credentials
+
+    manager._load = load
+    return manager, loads
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_off_loop_refresh_and_reuse_the_cached_token() -> None:
+    credentials = FakeCredentials(lifetime_seconds=3600)
+    manager, loads = _manager(credentials, margin_seconds=300)
+
+    tokens = await asyncio.gather(*(manager.token() for _ in range(5)))
+    assert tokens == ["token-1"] * 5
+    assert await manager.token() == "token-1"
+    assert loads == [1] and manager.refreshes == 1
+    assert credentials.threads[0] != threading.get_ident()
+
+    manager.invalidate()
+    assert await manager.token() == "token-2"
+    assert loads == [1]
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_token_is_refreshed_in_the_background_before_it_expires() -> None:
+    credentials = FakeCredentials(lifetime_seconds=1.2)
+    manager, _ = _manager(credentials, margin_seconds=1)
+
+    assert await manager.token() == "token-1"
+    await asyncio.sleep(0.4)
+    assert manager.refreshes >= 2
+    started = time.perf_counter()
+    assert await manager.token() == f"token-{manager.refreshes}"
+    assert time.perf_counter() - started < 0.04
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_google_adapters_built_together_share_one_credential_manager() -> None:
+    async with httpx.AsyncClient() as client:
+        adapters = build_adapters(settings=Settings(), http_client=client)
+    chirp = adapters[GoogleEnINChirp3HDAdapter.model_id]
+    neural = adapters["google:ta-IN-Neural2-D"]
+    assert chirp.credential_manager is neural.credential_manager
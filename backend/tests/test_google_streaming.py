@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.adapters.cloud.google_auth import GoogleCredentialManager
+from app.infrastructure.adapters.cloud.google_streaming import GoogleStreamingClientPool
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.executors import ExecutorRegistry
+
+
+class FakeTransport:
+    def __init__(self):
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeClient:
+    def __init__(self):
+        self.transport = FakeTransport()
+
+
+def _pool(**overrides) -> tuple[GoogleStreamingClientPool, list[FakeClient]]:
+    settings = Settings(google_application_credentials=None, **overrides)
+    executors = ExecutorRegistry(settings)
+    pool = GoogleStreamingClientPool(settings, executors, GoogleCredentialManager(settings, executors))
+    created: list[FakeClient] = []
+
+    def create_client(credentials) -> FakeClient:
+        _ = credentials
+        created.append(FakeClient())
+        return created[-1]
+
+    pool._create_client = create_client
+    return pool, created
+
+
+@pytest.mark.asyncio
+async def test_streaming_requests_reuse_one_lazily_created_client_with_bounded_streams() -> None:
+    pool, created = _pool(google_streaming_channels=1, google_streaming_max_streams=2)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    seen: list[FakeClient] = []
+
+    def stream(client: FakeClient) -> bytes:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.05)
+        with lock:
+            active -= 1
+        seen.append(client)
+        return b"audio"
+
+    assert created == []
+    results = await asyncio.gather(*(pool.run(stream) for _ in range(6)))
+    assert results == [b"audio"] * 6
+    assert len(created) == 1 and set(map(id, seen)) == {id(created[0])}
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_client_is_replaced_after_a_channel_failure_but_kept_after_a_request_error() -> None:
+    pool, created = _pool()
+
+    def closed_channel(client: FakeClient) -> bytes:
+        raise ValueError("Cannot invoke RPC on closed channel!")
+
+    def bad_request(client: FakeClient) -> bytes:
+        raise RuntimeError("voice not found")
+
+    with pytest.raises(RuntimeError):
+        await pool.run(bad_request)
+    assert len(created) == 1 and pool.discarded == 0
+
+    with pytest.raises(ValueError):
+        await pool.run(closed_channel)
+    assert created[0].transport.closed is True and pool.discarded == 1
+
+    assert await pool.run(lambda client: client) is created[1]
+    await pool.close()
+    assert created[1].transport.closed is True
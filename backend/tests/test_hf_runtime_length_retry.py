@@ -5,7 +5,9 @@ import wave
 
 import pytest
 
+from app.domain.errors import ModelUnavailableError
 from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.adapters.self_hosted.pipeline_profile import PipelineCapabilityProfile
 from app.infrastructure.config.settings import Settings
 
 
@@ -33,25 +35,39 @@ class PromptRejectingLengthRunner(LengthLimitedRunner):
             raise TypeError("got an unexpected keyword argument 'prompt'")
         return super().__call__(text, **kwargs)
 
+    def _sanitize_parameters(self, max_new_tokens=None):
+        return max_new_tokens
+
+
+def _loaded(runner) -> dict:
+    profile = PipelineCapabilityProfile.introspect("org/tts", runner, "text-to-speech")
+    return {"kind": "pipeline", "runner": runner, "profile": profile}
+
 
 def test_retry_with_max_new_tokens_on_max_length_error() -> None:
     runtime = HFLocalRuntime(Settings())
     runner = LengthLimitedRunner()
-    audio = runtime._run_pipeline({"kind": "pipeline", "runner": runner}, text="hello " * 40, config={})
+    audio = runtime._run_pipeline(_loaded(runner), text="hello " * 40, config={})
     assert audio == b"\x00\x01\x02"
     assert any("max_new_tokens" in call or "generate_kwargs" in call for call in runner.calls[1:])
 
 
-def test_prompt_typeerror_then_length_retry_still_succeeds() -> None:
+def test_profile_drops_rejected_prompt_and_passes_length_in_one_call() -> None:
     runtime = HFLocalRuntime(Settings())
     runner = PromptRejectingLengthRunner()
     audio = runtime._run_pipeline(
-        {"kind": "pipeline", "runner": runner},
+        _loaded(runner),
         text="vanakkam " * 35,
         config={"prompt": "energetic", "max_new_tokens": 384},
     )
     assert audio == b"\x00\x01\x02"
-    assert any(call.get("max_new_tokens") == 384 for call in runner.calls)
+    assert runner.calls == [{"max_new_tokens": 384}]
+
+
+def test_pipeline_without_a_profile_is_refused() -> None:
+    runtime = HFLocalRuntime(Settings())
+    with pytest.raises(ModelUnavailableError):
+        runtime._run_pipeline({"kind": "pipeline", "runner": LengthLimitedRunner()}, text="hi", config={})
 
 
 class AmbiguousBoolAudio:
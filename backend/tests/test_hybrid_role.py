@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from app.domain.errors import CapacityExceededError
+from app.infrastructure.adapters.factory import build_adapters
+from app.infrastructure.adapters.self_hosted.pipeline_profile import PipelineCapabilityProfile
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.framing import encode_frame
+
+VEENA = "maya-research/veena-all-v1"
+_WARM_IDLE = {"warm": True, "active": 0, "queued": 0, "slots": 1, "mean_service_ms": 2000, "saturated": False}
+
+
+def _hybrid(handler, **overrides) -> tuple[Any, httpx.AsyncClient]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    settings = Settings(
+        backend_role="hybrid",
+        remote_self_hosted_url="https://w.example",
+        remote_worker_health_interval_seconds=0,
+        local_model_parallelism=1,
+        **overrides,
+    )
+    adapter = build_adapters(settings=settings, http_client=client)[VEENA]
+    # The real local runtime (admission, scheduler, residency) with a fake pipeline in place of the model.
+    adapter.local.runtime._load_pipeline_sync = lambda model_repo: {  # type: ignore[method-assign]
+        "kind": "pipeline",
+        "runner": lambda text, **kwargs: b"local",
+        "profile": PipelineCapabilityProfile(
+            model_repo=model_repo, task="text-to-speech", style_kwargs=[], length_kwarg=None
+        ),
+    }
+    return adapter, client
+
+
+async def _occupy_local(adapter: Any, count: int, release: asyncio.Event) -> list[asyncio.Task]:
+    runtime = adapter.local.runtime
+    model_repo = runtime.resolve_model_repo(VEENA)
+
+    async def occupy() -> None:
+        async with runtime._scheduler.slot(model_repo, "interactive", 10):
+            await release.wait()
+
+    tasks = [asyncio.create_task(occupy()) for _ in range(count)]
+    await asyncio.sleep(0.01)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_hybrid_runs_locally_until_the_queue_builds_then_overflows_to_a_warm_worker() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/capacity":
+            return httpx.Response(200, json={"models": {VEENA: _WARM_IDLE}})
+        return httpx.Response(200, content=encode_frame({"model_id": VEENA, "success": True}, b"remote"))
+
+    adapter, client = _hybrid(handler)
+    assert adapter.provider == "hybrid" and adapter.category == "self_hosted"
+    await adapter.remote.worker_pool.check_health()
+
+    assert (await adapter.synthesize(text="hi", config={}, prefer_streaming=False)).audio_bytes == b"local"
+
+    release = asyncio.Event()
+    tasks = await _occupy_local(adapter, 2, release)
+    assert (await adapter.synthesize(text="hi", config={}, prefer_streaming=False)).audio_bytes == b"remote"
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert adapter.router.metrics()["routes"][VEENA] == {"local:below_threshold": 1, "remote:shorter_remote_wait": 1}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_falls_back_to_local_once_the_local_queue_has_drained() -> None:
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        _ = request
+        release.set()
+        await asyncio.sleep(0.01)
+        return httpx.Response(502, json={"detail": "bad gateway"})
+
+    adapter, client = _hybrid(handler, local_max_queue_depth=1, remote_worker_retries=0)
+    tasks = await _occupy_local(adapter, 2, release)
+
+    result = await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    await asyncio.gather(*tasks)
+
+    assert result.audio_bytes == b"local"
+    assert adapter.router.metrics()["routes"][VEENA] == {"remote:local_saturated": 1, "local:fallback": 1}
+    assert adapter.remote.worker_pool.workers[0].failures == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_surfaces_the_local_503_when_both_sides_are_full() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        _ = request
+        return httpx.Response(502, json={"detail": "bad gateway"})
+
+    adapter, client = _hybrid(handler, local_max_queue_depth=1, remote_worker_retries=0)
+    release = asyncio.Event()
+    tasks = await _occupy_local(adapter, 2, release)
+
+    with pytest.raises(CapacityExceededError) as exc_info:
+        await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    # The local fallback is refused by the runtime's own admission, which carries the Retry-After.
+    assert exc_info.value.retry_after_seconds >= 1
+    assert adapter.router.metrics()["routes"][VEENA] == {"remote:local_saturated": 1, "local:fallback": 1}
+    await client.aclose()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.main import app
+
+
+class FakeRuntime:
+    def __init__(self):
+        self.shutdowns = 0
+
+    def shutdown(self) -> None:
+        self.shutdowns += 1
+
+
+class FakePool:
+    def __init__(self):
+        self.closes = 0
+
+    async def close(self) -> None:
+        self.closes += 1
+
+
+class FakeAdapter:
+    def __init__(self, runtime: FakeRuntime, worker_pool: FakePool):
+        self.runtime = runtime
+        self.worker_pool = worker_pool
+
+
+def test_app_shutdown_closes_shared_resources_once_and_resets_cached_deps() -> None:
+    runtime, pool = FakeRuntime(), FakePool()
+    adapters = {"a": FakeAdapter(runtime, pool), "b": FakeAdapter(runtime, pool)}
+    with patch.object(deps, "build_adapters", lambda **_: adapters):
+        with TestClient(app):
+            assert deps.get_adapters() is adapters
+            executors = deps.get_executors()
+            assert executors.file_io is not None
+
+    assert runtime.shutdowns == 1 and pool.closes == 1
+    assert executors.metrics() == {}
+    assert deps.get_adapters.cache_info().currsize == 0
+    assert deps.get_http_client.cache_info().currsize == 0
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+
+from app.domain.errors import ModelUnavailableError
+from app.infrastructure.adapters.self_hosted.model_loading import ModelLoader
+from app.infrastructure.config.settings import Settings
+
+
+def test_model_loader_loads_components_concurrently_and_times_them() -> None:
+    loader = ModelLoader(
+        Settings(local_model_revisions="org/model=abc123, broken, org/other = v2", local_concurrent_loading=True)
+    )
+    assert loader.revision("org/model") == "abc123"
+    assert loader.revision("org/other") == "v2"
+    assert loader.pretrained_kwargs("org/model", weights=True)["revision"] == "abc123"
+    assert loader.processed_model_path("org/model", "int8") is None
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def component(value: str):
+        # Both loaders must be running at once to pass the barrier.
+        barrier.wait()
+        return value
+
+    components, timings = loader.load_components({"model": lambda: component("m"), "tokenizer": lambda: component("t")})
+    assert components == {"model": "m", "tokenizer": "t"}
+    assert set(timings) == {"model", "tokenizer"}
+
+    def failing():
+        raise ModelUnavailableError("tokenizer missing")
+
+    with pytest.raises(ModelUnavailableError):
+        loader.load_components({"model": lambda: "m", "tokenizer": failing})
+
+
+def test_offline_loader_passes_local_files_only_without_touching_env(monkeypatch) -> None:
+    monkeypatch.delenv("HF_HUB_OFFLINE", raising=False)
+    monkeypatch.delenv("TRANSFORMERS_OFFLINE", raising=False)
+    loader = ModelLoader(Settings(local_offline=True, local_model_revisions="org/model=abc123"))
+
+    kwargs = loader.pretrained_kwargs("org/model", weights=True)
+    assert kwargs["local_files_only"] is True
+    assert "revision" not in kwargs
+    assert "HF_HUB_OFFLINE" not in os.environ
+    assert "TRANSFORMERS_OFFLINE" not in os.environ
+
+
+def test_processed_model_round_trips_as_state_dict(tmp_path) -> None:
+    torch = pytest.importorskip("torch")
+    loader = ModelLoader(Settings(local_processed_model_dir=str(tmp_path)))
+    path = loader.processed_model_path("org/model", "fp32")
+    model = torch.nn.Linear(4, 2)
+    loader.save_processed(path, '{"hidden": 4}', model, torch)
+
+    restored = loader.load_processed(path, '{"hidden": 4}', lambda: torch.nn.Linear(4, 2), torch)
+    assert torch.equal(restored.weight, model.weight)
+    # A config that no longer matches the saved one is a cache miss, not a bad load.
+    assert loader.load_processed(path, '{"hidden": 8}', lambda: torch.nn.Linear(8, 2), torch) is None
+
+    # Anything but plain tensors is refused rather than unpickled.
+    torch.save({"weight": object()}, path)
+    assert loader.load_processed(path, '{"hidden": 4}', lambda: torch.nn.Linear(4, 2), torch) is None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted import hf_runtime
+from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.adapters.self_hosted.pipeline_profile import PipelineCapabilityProfile
+from app.infrastructure.adapters.self_hosted.residency import ModelResidencyManager
+from app.infrastructure.config.settings import Settings
+
+MB = 2**20
+
+
+def _profile(model_repo: str) -> PipelineCapabilityProfile:
+    return PipelineCapabilityProfile(model_repo=model_repo, task="text-to-speech", style_kwargs=[], length_kwarg=None)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_skips_pinned_and_in_use_models() -> None:
+    clock = FakeClock()
+    manager = ModelResidencyManager(budget_bytes=300 * MB, pinned={"pinned"}, clock=clock)
+    manager.admit("pinned", object(), 100 * MB)
+    manager.admit("busy", object(), 100 * MB)
+    manager.admit("cold", object(), 100 * MB)
+    assert manager.acquire("busy") is not None
+
+    evicted = manager.admit("new", object(), 100 * MB)
+
+    assert evicted == ["cold"]
+    assert set(manager.loaded_models()) == {"pinned", "busy", "new"}
+    assert manager.lru_evictions == 1
+
+
+def test_reserve_uses_previously_measured_size() -> None:
+    manager = ModelResidencyManager(budget_bytes=250 * MB)
+    manager.admit("a", object(), 200 * MB)
+    manager.admit("b", object(), 200 * MB)
+    assert manager.loaded_models() == ["b"]
+
+    assert manager.reserve("a") == ["b"]
+    assert manager.loaded_models() == []
+
+
+def test_idle_eviction_waits_for_release() -> None:
+    clock = FakeClock()
+    manager = ModelResidencyManager(idle_seconds=60, clock=clock)
+    manager.admit("veena", object(), 10 * MB)
+    manager.acquire("veena")
+    clock.now = 120
+    assert manager.evict_idle() == []
+
+    manager.release("veena")
+    clock.now = 190
+    assert manager.evict_idle() == ["veena"]
+    assert manager.idle_evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_runtime_reloads_after_eviction_and_counts_loads(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hf_runtime, "estimate_runtime_bytes", lambda loaded: 1 * MB)
+    runtime = HFLocalRuntime(Settings(local_model_memory_budget_mb=1))
+    loads: list[str] = []
+
+    def fake_load(model_repo: str):
+        loads.append(model_repo)
+        return {"kind": "pipeline", "runner": lambda text, **kwargs: b"audio", "profile": _profile(model_repo)}
+
+    runtime._load_pipeline_sync = fake_load  # type: ignore[method-assign]
+
+    assert await runtime.synthesize("model-a", "hi", {}) == b"audio"
+    assert await runtime.synthesize("model-b", "hi", {}) == b"audio"
+    assert await runtime.synthesize("model-a", "hi", {}) == b"audio"
+
+    assert loads == ["model-a", "model-b", "model-a"]
+    metrics = runtime.metrics()["residency"]
+    assert metrics["loads"] == 3
+    assert metrics["lru_evictions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_model_is_unloaded_without_further_requests() -> None:
+    runtime = HFLocalRuntime(Settings(local_model_idle_seconds=0.1))
+    runtime._load_pipeline_sync = lambda model_repo: {  # type: ignore[method-assign]
+        "kind": "pipeline",
+        "runner": lambda text, **kwargs: b"audio",
+        "profile": _profile(model_repo),
+    }
+
+    assert await runtime.synthesize("model-a", "hi", {}) == b"audio"
+    assert runtime.metrics()["loaded_models"] == ["model-a"]
+
+    await asyncio.sleep(0.3)
+    assert runtime.metrics()["loaded_models"] == []
+    assert runtime.metrics()["residency"]["idle_evictions"] == 1
+    runtime.shutdown()
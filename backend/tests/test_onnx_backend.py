@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.onnx_backend import OnnxBackend, normalize_backend
+from app.infrastructure.config.settings import Settings
+
+
+def test_backend_selection_and_artifact_keys(tmp_path) -> None:
+    assert normalize_backend("ONNX ") == "onnx"
+    assert normalize_backend("tensorrt") == "torch"
+    assert normalize_backend(None) == "torch"
+
+    backend = OnnxBackend(Settings(local_onnx_cache_dir=str(tmp_path)), intra_op_threads=2, parallel_generations=1)
+    torch_a = SimpleNamespace(__version__="2.8.0")
+    path = backend.artifact_path("snac-decoder", "hubertsiuzdak/snac_24khz:", torch_a)
+    assert path.parent == tmp_path
+    assert path == backend.artifact_path("snac-decoder", "hubertsiuzdak/snac_24khz:", torch_a)
+    assert path != backend.artifact_path("snac-decoder", "hubertsiuzdak/snac_24khz:abc123", torch_a)
+    assert path != backend.artifact_path("snac-decoder", "hubertsiuzdak/snac_24khz:", SimpleNamespace(__version__="2.9"))
+
+
+def test_onnx_snac_decode_matches_torch(tmp_path) -> None:
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("snac")
+
+    from benchmarks.tiny_models import build_tiny_snac
+
+    torch.manual_seed(0)
+    snac_model, _ = build_tiny_snac(torch)
+    backend = OnnxBackend(Settings(local_onnx_cache_dir=str(tmp_path)), intra_op_threads=1, parallel_generations=1)
+    onnx_snac = backend.snac_decoder(snac_model, "tiny/snac", torch)
+    assert onnx_snac is not None
+
+    # A different frame count than the export sample exercises the dynamic axes.
+    codes = [torch.randint(0, 4096, (1, 12 * 2**level), dtype=torch.int32) for level in range(3)]
+    with torch.no_grad():
+        expected = snac_model.decode(codes)
+    actual = onnx_snac.decode(codes)
+    assert actual.shape == expected.shape
+    assert torch.allclose(actual, expected, atol=1e-4)
+
+
+def test_onnx_parler_text_encoder_matches_torch(tmp_path) -> None:
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("parler_tts")
+
+    from benchmarks.tiny_models import TINY_PARLER_REPO, build_tiny_parler_runtime
+
+    model = build_tiny_parler_runtime(torch)["model"]
+    input_ids = torch.randint(4, 200, (2, 11))
+    attention_mask = torch.ones_like(input_ids)
+    attention_mask[1, 7:] = 0
+    with torch.no_grad():
+        expected = model.text_encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+    backend = OnnxBackend(Settings(local_onnx_cache_dir=str(tmp_path)), intra_op_threads=1, parallel_generations=1)
+    path = backend.prepare_text_encoder(model, TINY_PARLER_REPO, torch)
+    assert path is not None and path.exists()
+    backend.attach_text_encoder(model, path, torch)
+    actual = model.text_encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+    assert torch.allclose(actual, expected, atol=1e-4)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.adapters.self_hosted.pipeline_profile import PipelineCapabilityProfile
+from app.infrastructure.config.settings import Settings
+
+
+class GenerateKwargsOnlyRunner:
+    task = "text-to-audio"
+
+    class model:
+        class generation_config:
+            max_length = 20
+
+        class config:
+            max_position_embeddings = 1024
+
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    def __call__(self, text: str, **kwargs):
+        _ = text
+        self.calls.append(kwargs)
+        return b"\x00\x01\x02"
+
+    def _sanitize_parameters(self, preprocess_params=None, forward_params=None, generate_kwargs=None):
+        return preprocess_params, forward_params, generate_kwargs
+
+
+def test_capability_profile_makes_one_correctly_parameterized_call(tmp_path) -> None:
+    runner = GenerateKwargsOnlyRunner()
+    profile = PipelineCapabilityProfile.introspect("org/tts", runner, "text-to-speech")
+    assert profile.task == "text-to-audio"
+    assert profile.style_kwargs == []
+    assert profile.length_kwarg == "generate_kwargs"
+    assert profile.max_length == 20
+
+    runtime = HFLocalRuntime(Settings())
+    audio = runtime._run_pipeline(
+        {"kind": "pipeline", "runner": runner, "profile": profile},
+        text="vanakkam " * 35,
+        config={"prompt": "energetic", "max_new_tokens": 384},
+    )
+    assert audio == b"\x00\x01\x02"
+    assert runner.calls == [{"generate_kwargs": {"max_new_tokens": 384}}]
+
+    profile.save(tmp_path)
+    assert PipelineCapabilityProfile.load(tmp_path, "org/tts") == profile
+    assert PipelineCapabilityProfile.load(tmp_path, "org/other") is None
+
+
+class ForwardOnlyRunner(GenerateKwargsOnlyRunner):
+    # VITS / MMS-TTS: the HF pipeline accepts generate_kwargs in its signature but rejects any at call time.
+    class model:
+        class generation_config:
+            max_length = 20
+
+        class config:
+            max_position_embeddings = 1024
+
+        @staticmethod
+        def can_generate() -> bool:
+            return False
+
+    def __call__(self, text: str, **kwargs):
+        if kwargs.get("generate_kwargs"):
+            raise ValueError("You're using the `TextToAudioPipeline` with a forward-only model")
+        return super().__call__(text, **kwargs)
+
+
+def test_forward_only_model_is_called_without_length_kwargs() -> None:
+    runner = ForwardOnlyRunner()
+    profile = PipelineCapabilityProfile.introspect("facebook/mms-tts-tam", runner, "text-to-speech")
+    assert profile.length_kwarg is None
+
+    runtime = HFLocalRuntime(Settings())
+    audio = runtime._run_pipeline(
+        {"kind": "pipeline", "runner": runner, "profile": profile},
+        text="vanakkam",
+        config={"max_new_tokens": 384},
+    )
+    assert audio == b"\x00\x01\x02"
+    assert runner.calls == [{}]
+
+
+def test_model_keeps_its_own_default_length_when_the_request_sets_none() -> None:
+    runner = GenerateKwargsOnlyRunner()
+    runner.model = type("Model", (), {"generation_config": type("GenCfg", (), {"max_length": 2580})()})()
+    profile = PipelineCapabilityProfile.introspect("org/tts", runner, "text-to-speech")
+    assert profile.length_kwarg == "generate_kwargs"
+
+    runtime = HFLocalRuntime(Settings())
+    runtime._run_pipeline({"kind": "pipeline", "runner": runner, "profile": profile}, text="vanakkam", config={})
+    assert runner.calls == [{}]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from app.infrastructure.adapters.self_hosted.precision import normalize_inference_mode, resolve_cpu_inference_mode
+
+
+def test_inference_mode_normalization_and_bf16_fallback() -> None:
+    assert normalize_inference_mode("BFloat16") == "bf16"
+    assert normalize_inference_mode("int8") == "int8"
+    assert normalize_inference_mode("fp8") == "fp32"
+
+    class NoBF16Torch:
+        class cpu:  # noqa: N801
+            @staticmethod
+            def _is_avx512_bf16_supported() -> bool:
+                return False
+
+    assert resolve_cpu_inference_mode("bf16", NoBF16Torch, model_label="veena") == "fp32"
+    assert resolve_cpu_inference_mode("int8", NoBF16Torch, model_label="veena") == "int8"
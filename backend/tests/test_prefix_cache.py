@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.adapters.self_hosted.prefix_cache import PrefixKVCache
+from app.infrastructure.config.settings import Settings
+
+
+def test_run_veena_reuses_prefix_kv_cache_for_repeated_speaker_prompt() -> None:
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    runtime = HFLocalRuntime(Settings())
+    offsets = [128266 + i * 4096 for i in range(7)]
+
+    class DummyTokenizer:
+        pad_token_id = 0
+        eos_token_id = 1
+
+        @staticmethod
+        def encode(prompt: str, add_special_tokens: bool = False):
+            _ = add_special_tokens
+            return [200 + (sum(map(ord, word)) % 50) for word in prompt.split()]
+
+    class DummyModel(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.p = torch.nn.Parameter(torch.zeros(1))
+            self.prefills = 0
+            self.past_lengths: list[int] = []
+
+        def forward(self, input_ids, past_key_values, use_cache):
+            _ = use_cache
+            self.prefills += 1
+            for layer in range(2):
+                kv = torch.zeros((1, 1, input_ids.shape[1], 2))
+                past_key_values.update(kv, kv, layer)
+            return type("Out", (), {"past_key_values": past_key_values})()
+
+        def generate(self, input_ids, past_key_values=None, **kwargs):
+            _ = kwargs
+            self.past_lengths.append(past_key_values.get_seq_length() if past_key_values is not None else 0)
+            generated = torch.tensor([[offset + 1 for offset in offsets]])
+            return torch.cat([input_ids, generated], dim=1)
+
+    class DummySNAC(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.p = torch.nn.Parameter(torch.zeros(1))
+
+        def decode(self, hierarchical_codes):
+            _ = hierarchical_codes
+            return torch.linspace(-0.5, 0.5, steps=480).unsqueeze(0)
+
+    model = DummyModel()
+    loaded = {
+        "model": model,
+        "tokenizer": DummyTokenizer(),
+        "snac_model": DummySNAC(),
+        "prefix_cache": PrefixKVCache(budget_bytes=2**20, min_prefix_tokens=2),
+    }
+    config = {"speaker": "kavya", "prompt": "Clear Tamil pronunciation", "max_new_tokens": 64}
+    runtime._run_veena(loaded, text="Vanakkam", config=config)
+    runtime._run_veena(loaded, text="Innoru sentence", config=config)
+
+    assert model.prefills == 1
+    assert model.past_lengths[0] == model.past_lengths[1] > 0
+    cache_metrics = loaded["prefix_cache"].metrics()
+    assert cache_metrics["hits"] == 1 and cache_metrics["misses"] == 1
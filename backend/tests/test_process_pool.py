@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from types import SimpleNamespace
+
+import pytest
+
+from app.domain.errors import AdapterError
+from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+from app.infrastructure.adapters.self_hosted.process_pool import (
+    LocalInferenceProcessPool,
+    _collect_audio,
+    _publish_audio,
+)
+from app.infrastructure.config.settings import Settings
+
+
+def test_shared_memory_round_trip_releases_segment() -> None:
+    payload = b"RIFF" + bytes(range(256)) * 4
+    name = _publish_audio(payload)
+    assert _collect_audio(name, len(payload)) == payload
+    with pytest.raises(FileNotFoundError):
+        _collect_audio(name, len(payload))
+
+
+@pytest.mark.asyncio
+async def test_worker_errors_are_mapped_back_to_adapter_errors() -> None:
+    runtime = HFLocalRuntime(Settings(local_inference_workers=1))
+    assert runtime._process_pool is not None
+    try:
+        # A repo id the worker cannot load still travels the full queue round trip.
+        with pytest.raises(AdapterError):
+            await runtime.synthesize("not-a-real/tts-model", "hello", {})
+        workers = runtime.metrics()["process_pool"]["workers"]
+        assert workers[0]["failed"] == 1
+        assert workers[0]["in_flight"] == 0
+    finally:
+        runtime._process_pool.shutdown()
+
+
+class RecordingJobs:
+    def __init__(self):
+        self.items: list[tuple] = []
+
+    def put(self, job: tuple) -> None:
+        self.items.append(job)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_job_is_never_dispatched() -> None:
+    pool = LocalInferenceProcessPool(Settings(local_inference_workers=1))
+    slot = pool._slots[0]
+    # No processes: the test plays the worker through the job queue and the results handler.
+    slot.jobs, slot.cancel_job = RecordingJobs(), SimpleNamespace(value=0)
+    pool._started = True
+    try:
+        running = asyncio.ensure_future(pool.submit("model-a", "one", {}))
+        queued = asyncio.ensure_future(pool.submit("model-a", "two", {}))
+        later = asyncio.ensure_future(pool.submit("model-a", "three", {}))
+        await asyncio.sleep(0.01)
+        assert [job[2] for job in slot.jobs.items] == ["one"]
+
+        queued.cancel()
+        with suppress(asyncio.CancelledError):
+            await queued
+        running.cancel()
+        with suppress(asyncio.CancelledError):
+            await running
+        # Only the running job is signalled; the queued one was dropped in the parent.
+        assert slot.cancel_job.value == slot.jobs.items[0][0]
+
+        pool._handle_result((0, slot.jobs.items[0][0], False, "GenerationCancelledError", "cancelled"))
+        assert [job[2] for job in slot.jobs.items] == ["one", "three"]
+        pool._handle_result((0, slot.jobs.items[1][0], True, _publish_audio(b"audio"), 5))
+        assert await later == b"audio"
+        workers = pool.metrics()["workers"]
+        assert workers[0]["cancelled"] == 2
+        assert workers[0]["in_flight"] == 0
+    finally:
+        pool.shutdown()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.synthesis_service import SynthesisService
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, ConfigStatus, ModelCapabilities
+from app.infrastructure.adapters.factory import build_adapters
+from app.infrastructure.audio_store import AudioStore
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.framing import FrameReader, encode_frame
+from app.main import app
+
+PARLER = "ai4bharat/indic-parler-tts"
+VEENA = "maya-research/veena-all-v1"
+
+
+class EchoAdapter(TTSAdapter):
+    display_name = "ECHO"
+    provider = "test"
+    category = "self_hosted"
+    capabilities = ModelCapabilities()
+    config_schema = []
+    runtime_alias = None
+
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+
+    def check_configuration(self) -> ConfigStatus:
+        return ConfigStatus(configured=True, warnings=[])
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (config, prefer_streaming)
+        return AdapterAudio(audio_bytes=f"{self.model_id}:{text}".encode(), audio_format="wav")
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_forwards_remote_models_of_a_batch_as_one_call() -> None:
+    calls: list[dict[str, Any]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/tts/synthesize-batch-raw"
+        body = json.loads(request.content)
+        calls.append(body)
+        # Finish order differs from request order; results are matched back by model_id.
+        stream = b"".join(
+            encode_frame({"model_id": model_id, "success": True, "audio_format": "wav"}, model_id.encode())
+            for model_id in reversed(body["model_ids"])
+        )
+        return httpx.Response(200, content=stream)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings = Settings(
+            backend_role="orchestrator", remote_self_hosted_url="https://w.example", audio_store_dir=tmpdir
+        )
+        adapters = build_adapters(settings=settings, http_client=client)
+        service = SynthesisService(adapters=adapters, settings=settings, audio_store=AudioStore(settings))
+        results = await service.synthesize_batch(
+            [PARLER, VEENA], "hello", {VEENA: {"speaker": "kavya"}}, prefer_streaming=False, priority="batch"
+        )
+    await client.aclose()
+
+    assert len(calls) == 1
+    assert calls[0]["model_ids"] == [PARLER, VEENA]
+    assert calls[0]["per_model_config"] == {PARLER: {}, VEENA: {"speaker": "kavya"}}
+    assert calls[0]["priority"] == "batch"
+    assert [result.model_id for result in results] == [PARLER, VEENA]
+    assert all(result.success for result in results)
+    assert [result.audio_bytes for result in results] == [len(PARLER), len(VEENA)]
+
+
+def test_worker_streams_one_frame_per_model_without_storing_audio() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings = Settings(audio_store_dir=tmpdir)
+        adapters = {model_id: EchoAdapter(model_id) for model_id in (PARLER, VEENA)}
+        service = SynthesisService(adapters=adapters, settings=settings, audio_store=AudioStore(settings))
+        with patch("app.api.routes.tts.get_synthesis_service", lambda: service):
+            response = TestClient(app).post(
+                "/tts/synthesize-batch-raw", json={"model_ids": [PARLER, VEENA, "missing"], "text": "hi"}
+            )
+        stored = list(settings.audio_dir_path().iterdir())
+
+    frames = {frame.header["model_id"]: frame for frame in FrameReader().feed(response.content)}
+    assert response.status_code == 200
+    assert frames[PARLER].payload == f"{PARLER}:hi".encode()
+    assert frames[VEENA].payload == f"{VEENA}:hi".encode()
+    assert frames["missing"].header["success"] is False and frames["missing"].payload == b""
+    assert stored == []
@@ -6,9 +6,11 @@ import base64
 import httpx
 import pytest
 
+from app.domain.request_context import request_context
 from app.infrastructure.adapters.factory import build_adapters
 from app.infrastructure.adapters.remote.indic_parler import RemoteIndicParlerAdapter
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.framing import FRAME_MEDIA_TYPE, FrameError, FrameReader, encode_frame
 
 
 def test_orchestrator_role_uses_remote_self_hosted_adapters() -> None:
@@ -78,6 +80,7 @@ async def test_remote_adapter_decodes_audio_payload() -> None:
         backend_role="orchestrator",
         remote_self_hosted_url="https://worker.example",
         remote_self_hosted_timeout_seconds=30,
+        remote_self_hosted_transport="json",
     )
     adapter = RemoteIndicParlerAdapter(settings=settings, http_client=client)
     result = await adapter.synthesize(text="hello", config={}, prefer_streaming=True)
@@ -86,3 +89,57 @@ async def test_remote_adapter_decodes_audio_payload() -> None:
     assert result.audio_bytes == audio
     assert result.audio_format == "wav"
     assert result.streaming_used is False
+
+
+@pytest.mark.asyncio
+async def test_remote_adapter_reads_binary_frame_without_base64() -> None:
+    audio = bytes(range(256)) * 64
+    header = {"model_id": "ai4bharat/indic-parler-tts", "success": True, "audio_format": "wav", "queue_wait_ms": 7}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/tts/synthesize-raw"
+        assert request.headers["accept"] == FRAME_MEDIA_TYPE
+        return httpx.Response(200, content=encode_frame(header, audio), headers={"content-type": FRAME_MEDIA_TYPE})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    settings = Settings(backend_role="orchestrator", remote_self_hosted_url="https://worker.example")
+    adapter = RemoteIndicParlerAdapter(settings=settings, http_client=client)
+    with request_context() as context:
+        result = await adapter.synthesize(text="hello", config={}, prefer_streaming=False)
+    await client.aclose()
+
+    assert result.audio_bytes == audio
+    assert context.queue_wait_ms == 7
+
+
+@pytest.mark.asyncio
+async def test_remote_adapter_falls_back_to_json_when_worker_lacks_binary_endpoint() -> None:
+    paths: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/tts/synthesize-raw":
+            return httpx.Response(404, json={"detail": "Not Found"})
+        encoded = base64.b64encode(b"old-worker").decode("utf-8")
+        return httpx.Response(200, json={"result": {"success": True, "audio_base64": encoded}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    settings = Settings(backend_role="orchestrator", remote_self_hosted_url="https://worker.example")
+    adapter = RemoteIndicParlerAdapter(settings=settings, http_client=client)
+    first = await adapter.synthesize(text="hello", config={}, prefer_streaming=False)
+    second = await adapter.synthesize(text="hello", config={}, prefer_streaming=False)
+    await client.aclose()
+
+    assert first.audio_bytes == second.audio_bytes == b"old-worker"
+    assert paths == ["/tts/synthesize-raw", "/tts/synthesize", "/tts/synthesize"]
+
+
+def test_frame_reader_reassembles_frames_split_across_chunks() -> None:
+    stream = encode_frame({"n": 1}, b"abc") + encode_frame({"n": 2})
+    reader = FrameReader()
+    frames = [frame for byte in stream for frame in reader.feed(bytes([byte]))]
+    reader.close()
+
+    assert [(frame.header["n"], frame.payload) for frame in frames] == [(1, b"abc"), (2, b"")]
+    with pytest.raises(FrameError):
+        FrameReader().feed(b"not a frame stream")
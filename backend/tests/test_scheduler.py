@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.scheduler import InferenceScheduler
+
+
+async def _job(scheduler: InferenceScheduler, name: str, priority: str, cost: float, order: list[str], gate=None):
+    async with scheduler.slot("model", priority, cost) as grant:
+        order.append(name)
+        if gate is not None:
+            await gate.wait()
+        return grant
+
+
+@pytest.mark.asyncio
+async def test_priority_classes_then_shortest_job_first() -> None:
+    scheduler = InferenceScheduler(slots=1, aging_seconds=60)
+    order: list[str] = []
+    gate = asyncio.Event()
+    running = asyncio.create_task(_job(scheduler, "running", "interactive", 10, order, gate))
+    await asyncio.sleep(0)
+
+    queued = [
+        asyncio.create_task(_job(scheduler, name, priority, cost, order))
+        for name, priority, cost in [
+            ("prefetch", "prefetch", 1),
+            ("batch-long", "batch", 5000),
+            ("interactive-long", "interactive", 5000),
+            ("interactive-short", "interactive", 20),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.metrics()["model"]["queued"] == {"interactive": 2, "batch": 1, "prefetch": 1}
+
+    gate.set()
+    grants = await asyncio.gather(running, *queued)
+    assert order == ["running", "interactive-short", "interactive-long", "batch-long", "prefetch"]
+    assert grants[0].queue_position == 0
+    # Positions reflect the queue at enqueue time: the short interactive job jumped to the front.
+    assert [grant.queue_position for grant in grants[1:]] == [1, 1, 1, 1]
+    assert all(grant.queue_wait_ms >= 0 for grant in grants)
+    assert scheduler.metrics()["model"]["by_priority"]["prefetch"]["dispatched"] == 1
+
+
+@pytest.mark.asyncio
+async def test_aging_prevents_starvation_and_cancelled_waiters_free_their_place() -> None:
+    scheduler = InferenceScheduler(slots=1, aging_seconds=0.02)
+    order: list[str] = []
+    gate = asyncio.Event()
+    running = asyncio.create_task(_job(scheduler, "running", "interactive", 1, order, gate))
+    await asyncio.sleep(0)
+    starving = asyncio.create_task(_job(scheduler, "prefetch", "prefetch", 5000, order))
+    abandoned = asyncio.create_task(_job(scheduler, "abandoned", "interactive", 1, order))
+    await asyncio.sleep(0.1)
+    fresh = asyncio.create_task(_job(scheduler, "fresh", "interactive", 1, order))
+    await asyncio.sleep(0)
+
+    abandoned.cancel()
+    gate.set()
+    await asyncio.gather(running, starving, fresh)
+    assert order == ["running", "prefetch", "fresh"]
+    assert abandoned.cancelled()
+    assert scheduler.metrics()["model"]["active"] == 0
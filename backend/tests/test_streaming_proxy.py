@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import tempfile
+import wave
+from typing import Any, AsyncIterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.synthesis_service import SynthesisService
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, ConfigStatus, ModelCapabilities
+from app.infrastructure.adapters.remote.veena_all_v1 import RemoteVeenaAllV1Adapter
+from app.infrastructure.audio_store import AudioStore
+from app.infrastructure.config.settings import Settings
+from app.main import app
+
+
+class WorkerAudioStream(httpx.AsyncByteStream):
+    # Records how far the worker side has been read and whether the orchestrator hung up.
+    def __init__(self, chunks: int):
+        self.chunks = chunks
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for index in range(self.chunks):
+            self.sent += 1
+            yield bytes([index]) * 1024
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_remote_stream_is_proxied_with_backpressure_and_closed_on_cancel() -> None:
+    upstream = WorkerAudioStream(chunks=100)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/tts/synthesize-stream"
+        return httpx.Response(200, stream=upstream, headers={"content-type": "audio/wav", "x-streaming-used": "true"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    settings = Settings(backend_role="orchestrator", remote_self_hosted_url="https://w.example")
+    adapter = RemoteVeenaAllV1Adapter(settings=settings, http_client=client)
+
+    stream = await adapter.synthesize_stream(text="hello", config={}, prefer_streaming=True)
+    assert stream.audio_format == "wav" and stream.streaming_used is True
+    first = await anext(stream.chunks)
+    await asyncio.sleep(0.05)
+
+    assert first == bytes([0]) * 1024
+    assert upstream.sent < 10
+    assert adapter.worker_pool.workers[0].outstanding == 1
+
+    await stream.chunks.aclose()
+    await asyncio.sleep(0.05)
+    assert upstream.closed is True
+    assert adapter.worker_pool.workers[0].outstanding == 0
+    await client.aclose()
+
+
+class ClipAdapter(TTSAdapter):
+    model_id = "clip-model"
+    display_name = "CLIP"
+    provider = "test"
+    category = "cloud"
+    capabilities = ModelCapabilities()
+    config_schema = []
+    runtime_alias = None
+
+    def check_configuration(self) -> ConfigStatus:
+        return ConfigStatus(configured=True, warnings=[])
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (config, prefer_streaming)
+        return AdapterAudio(audio_bytes=text.encode() * 50_000, audio_format="mp3")
+
+
+def test_stream_route_chunks_buffered_adapters_and_maps_errors() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings = Settings(audio_store_dir=tmpdir)
+        adapters = {ClipAdapter.model_id: ClipAdapter()}
+        service = SynthesisService(adapters=adapters, settings=settings, audio_store=AudioStore(settings))
+        with (
+            patch("app.api.routes.tts.get_synthesis_service", lambda: service),
+            patch("app.api.routes.tts.get_adapters", lambda: adapters),
+        ):
+            client = TestClient(app)
+            response = client.post("/tts/synthesize-stream", json={"model_id": "clip-model", "text": "ab"})
+            missing = client.post("/tts/synthesize-stream", json={"model_id": "nope", "text": "ab"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.content == b"ab" * 50_000
+    assert missing.status_code == 404
+
+
+class WavClipAdapter(ClipAdapter):
+    model_id = "wav-clip"
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (text, config, prefer_streaming)
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(b"\x00\x01" * 48000)
+        return AdapterAudio(audio_bytes=buffer.getvalue(), audio_format="wav")
+
+
+@pytest.mark.asyncio
+async def test_streams_hold_a_synthesis_slot_and_are_metered_when_they_finish(tmp_path) -> None:
+    settings = Settings(audio_store_dir=str(tmp_path), max_concurrent_synth=1)
+    adapter = WavClipAdapter()
+    adapters = {adapter.model_id: adapter}
+    service = SynthesisService(adapters=adapters, settings=settings, audio_store=AudioStore(settings))
+
+    first = await service.synthesize_stream(adapter.model_id, "hi", {}, prefer_streaming=True)
+    second = asyncio.ensure_future(service.synthesize_stream(adapter.model_id, "hi", {}, prefer_streaming=True))
+    await asyncio.sleep(0.05)
+    assert not second.done()
+    assert service.metrics() == {}
+
+    received = b"".join([chunk async for chunk in first.chunks])
+    stream = await asyncio.wait_for(second, timeout=1)
+    stats = service.metrics()[adapter.model_id]
+    assert stats["requests"] == 1 and stats["failures"] == 0
+    assert stats["audio_bytes"] == len(received)
+    assert stats["audio_seconds"] == 3.0
+
+    # A stream the client abandons gives its slot back without being counted.
+    await stream.chunks.aclose()
+    third = await asyncio.wait_for(service.synthesize_stream(adapter.model_id, "hi", {}, prefer_streaming=True), 1)
+    await third.chunks.aclose()
+    assert service.metrics()[adapter.model_id]["requests"] == 1
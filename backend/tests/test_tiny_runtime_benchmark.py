@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import io
+import json
+import wave
+
+import pytest
+
+from benchmarks.common import find_regressions
+
+
+def test_find_regressions_flags_throughput_and_rtf_slowdowns(tmp_path) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            [
+                {"model": "veena", "concurrency": 1, "tokens_per_second": 100.0, "rtf": 0.5},
+                {"model": "veena", "concurrency": 2, "tokens_per_second": 150.0, "rtf": 0.4},
+            ]
+        )
+    )
+    results = [
+        {"model": "veena", "concurrency": 1, "tokens_per_second": 90.0, "rtf": 0.52},
+        {"model": "veena", "concurrency": 2, "tokens_per_second": 100.0, "rtf": 0.6},
+        {"model": "parler", "concurrency": 1, "tokens_per_second": 1.0, "rtf": 9.0},
+    ]
+    regressions = find_regressions(results, str(baseline), ("model", "concurrency"), tolerance=0.15)
+    assert len(regressions) == 2
+    assert all("concurrency=2" in item for item in regressions)
+
+
+@pytest.mark.asyncio
+async def test_tiny_veena_runtime_reports_all_stages() -> None:
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+
+    from app.infrastructure.adapters.self_hosted.hf_runtime import HFLocalRuntime
+    from app.infrastructure.config.settings import Settings
+    from benchmarks.tiny_models import TINY_VEENA_REPO, build_tiny_veena_runtime
+
+    runtime = HFLocalRuntime(Settings())
+    runtime._residency.admit(TINY_VEENA_REPO, build_tiny_veena_runtime(torch), 0)
+    audio = await runtime.synthesize(TINY_VEENA_REPO, "vanakkam chennai", {"max_new_tokens": 70})
+
+    with wave.open(io.BytesIO(audio), "rb") as wav_file:
+        assert wav_file.getnframes() > 0
+    stages = runtime.metrics()["stages"][TINY_VEENA_REPO]
+    assert {"tokenize", "prefill", "decode", "snac_decode", "wav_encode"} <= set(stages)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.token_budget import TokenBudgetCalibrator
+
+
+def _calibrator(persist_path: str | None = None) -> TokenBudgetCalibrator:
+    return TokenBudgetCalibrator(alpha=0.5, headroom=1.5, min_fraction=0.5, min_samples=2, persist_path=persist_path)
+
+
+def test_budget_is_learned_only_from_natural_stops(tmp_path) -> None:
+    persist_path = str(tmp_path / "budgets.json")
+    calibrator = _calibrator(persist_path)
+    key = TokenBudgetCalibrator.key("maya-research/veena", "kavya")
+    text = "vanakkam chennai"  # 15 spoken characters
+
+    calibrator.observe(key, text, 150, "eos")
+    assert calibrator.estimate(key, text, frame_tokens=7) is None
+    calibrator.observe(key, text, 2048, "max_tokens")
+    calibrator.observe(key, text, 900, "repetition")
+    calibrator.observe(key, text, 150, "eos")
+
+    budget = calibrator.estimate(key, text, frame_tokens=7)
+    # 10 tokens/char * 15 chars = 150 expected; 1.5x headroom and half as the floor, in whole frames.
+    assert budget is not None
+    assert (budget.min_new_tokens, budget.max_new_tokens) == (70, 231)
+    assert calibrator.estimate(TokenBudgetCalibrator.key("maya-research/veena", "agastya"), text) is None
+
+    metrics = calibrator.metrics()[key]
+    assert metrics["samples"] == 2 and metrics["calibrated"]
+    assert metrics["stop_reasons"] == {"eos": 2, "repetition": 1, "max_tokens": 1}
+
+    reloaded = _calibrator(persist_path)
+    assert reloaded.estimate(key, text, frame_tokens=7) == budget
+
+
+def test_repeating_frames_stop_generation() -> None:
+    torch = pytest.importorskip("torch")
+
+    from app.infrastructure.adapters.self_hosted.stopping import RepeatingFrameStoppingCriteria
+
+    prompt = [1, 2, 3]
+    varied = list(range(100, 128))  # 4 distinct frames
+    frame = [200, 201, 202, 203, 204, 205, 206]
+    criteria = RepeatingFrameStoppingCriteria(prompt_length=len(prompt), max_repeats=3)
+
+    assert not criteria(torch.tensor([prompt + varied + frame * 2]), None).any()
+    assert not criteria(torch.tensor([prompt + varied + frame * 2 + frame[:4]]), None).any()
+    assert criteria(torch.tensor([prompt + varied + frame * 3]), None).all()
+    assert criteria.triggered and criteria.repeated_tokens == 14
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import shutil
+import tempfile
+import wave
+from typing import Any
+
+import pytest
+
+from app.application.synthesis_service import SynthesisService
+from app.domain.contracts import TTSAdapter
+from app.domain.entities import AdapterAudio, ConfigStatus, ModelCapabilities
+from app.domain.errors import DependencyMissingError
+from app.infrastructure.audio_store import AudioStore
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.transcoding import AudioTranscoder, format_from_accept
+
+
+def _wav_bytes(frames: int = 1600, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"\x00\x01" * frames)
+    return buffer.getvalue()
+
+
+class WavAdapter(TTSAdapter):
+    model_id = "wav-model"
+    display_name = "WAV"
+    provider = "test"
+    category = "cloud"
+    capabilities = ModelCapabilities()
+    config_schema = []
+    runtime_alias = None
+
+    def check_configuration(self) -> ConfigStatus:
+        return ConfigStatus(configured=True, warnings=[])
+
+    async def synthesize(self, text: str, config: dict[str, Any], prefer_streaming: bool) -> AdapterAudio:
+        _ = (text, config, prefer_streaming)
+        return AdapterAudio(audio_bytes=_wav_bytes(), audio_format="wav", streaming_used=False)
+
+
+def test_format_from_accept_prefers_highest_quality_audio_type() -> None:
+    assert format_from_accept("audio/ogg;q=0.9, audio/flac") == "flac"
+    assert format_from_accept("application/json, audio/mpeg;q=0.5") == "mp3"
+    assert format_from_accept("audio/flac;q=0, audio/x-wav;q=0.1") == "wav"
+    assert format_from_accept("*/*") is None
+    assert format_from_accept(None) is None
+
+
+@pytest.mark.asyncio
+async def test_requested_format_without_ffmpeg_fails_only_that_result() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Settings(audio_store_dir=tmpdir, ffmpeg_binary="definitely-not-ffmpeg", audio_store_format="flac")
+        service = SynthesisService(adapters={"wav-model": WavAdapter()}, settings=cfg, audio_store=AudioStore(cfg))
+
+        native = await service.synthesize_one("wav-model", "hi", {}, prefer_streaming=False)
+        assert native.success is True
+        assert native.audio_format == "wav"
+        # The storage policy falls back to the delivered WAV when ffmpeg is missing.
+        assert (native.audio_url or "").endswith(".wav")
+
+        converted = await service.synthesize_one("wav-model", "hi", {}, prefer_streaming=False, output_format="ogg")
+        assert converted.success is False
+        assert "ffmpeg" in (converted.error or "")
+
+        with pytest.raises(DependencyMissingError):
+            await AudioTranscoder(cfg).transcode(AdapterAudio(audio_bytes=_wav_bytes()), target_format="mp3")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+async def test_transcode_wav_to_flac_and_resample() -> None:
+    transcoder = AudioTranscoder(Settings())
+    source = AdapterAudio(audio_bytes=_wav_bytes(frames=16000), audio_format="wav")
+
+    flac = await transcoder.transcode(source, target_format="flac")
+    assert flac.audio_format == "flac"
+    assert flac.audio_bytes.startswith(b"fLaC")
+
+    resampled = await transcoder.transcode(flac, target_format="wav", sample_rate=8000)
+    with wave.open(io.BytesIO(resampled.audio_bytes), "rb") as wav_file:
+        assert wav_file.getframerate() == 8000
+        assert wav_file.getnframes() == 8000
+
+
+@pytest.mark.asyncio
+async def test_ogg_sample_rate_is_snapped_to_one_opus_supports() -> None:
+    transcoder = AudioTranscoder(Settings())
+    calls: list[tuple[str, int | None]] = []
+
+    def run_ffmpeg(audio_bytes: bytes, source_format: str, target_format: str, sample_rate: int | None) -> bytes:
+        _ = (audio_bytes, source_format)
+        calls.append((target_format, sample_rate))
+        return b"encoded"
+
+    transcoder._run_ffmpeg = run_ffmpeg  # type: ignore[method-assign]
+    source = AdapterAudio(audio_bytes=_wav_bytes(), audio_format="wav")
+    for sample_rate in (22050, 44100, 11025):
+        await transcoder.transcode(source, target_format="ogg", sample_rate=sample_rate)
+    await transcoder.transcode(source, target_format="mp3", sample_rate=22050)
+
+    assert calls == [("ogg", 24000), ("ogg", 48000), ("ogg", 12000), ("mp3", 22050)]
+
+
+@pytest.mark.asyncio
+async def test_default_output_format_falls_back_to_native_audio_and_url_reports_stored_format(tmp_path) -> None:
+    cfg = Settings(audio_store_dir=str(tmp_path), ffmpeg_binary="definitely-not-ffmpeg", audio_output_format="mp3")
+    service = SynthesisService(adapters={"wav-model": WavAdapter()}, settings=cfg, audio_store=AudioStore(cfg))
+
+    # Only the server default asked for mp3, so a missing ffmpeg does not throw the clip away.
+    result = await service.synthesize_one("wav-model", "hi", {}, prefer_streaming=False)
+    assert result.success is True
+    assert result.audio_format == "wav" and result.audio_url_format == "wav"
+
+    transcoder = AudioTranscoder(Settings())
+    transcoder._run_ffmpeg = lambda audio_bytes, source, target, sample_rate: b"fLaC"  # type: ignore[method-assign]
+    cfg = Settings(audio_store_dir=str(tmp_path), audio_store_format="flac")
+    service = SynthesisService(
+        adapters={"wav-model": WavAdapter()}, settings=cfg, audio_store=AudioStore(cfg), transcoder=transcoder
+    )
+    stored = await service.synthesize_one("wav-model", "hi", {}, prefer_streaming=False)
+    assert stored.audio_format == "wav"
+    assert stored.audio_url_format == "flac"
+    assert (stored.audio_url or "").endswith(".flac")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.adapters.self_hosted.veena_vocab import (
+    AUDIO_VOCAB_STOP,
+    END_OF_SPEECH,
+    START_OF_SPEECH,
+    AudioTokenLogitsProcessor,
+    restrict_lm_head_to_audio_vocab,
+)
+
+
+def test_audio_vocab_head_matches_full_head_on_audio_codes() -> None:
+    torch = pytest.importorskip("torch")
+
+    class _TinyLM(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.lm_head = torch.nn.Linear(8, AUDIO_VOCAB_STOP + 3, bias=False)
+
+        def get_output_embeddings(self):
+            return self.lm_head
+
+        def set_output_embeddings(self, head):
+            self.lm_head = head
+
+    model = _TinyLM()
+    hidden = torch.randn(2, 8)
+    full_logits = model.lm_head(hidden)
+    assert restrict_lm_head_to_audio_vocab(model, torch)
+    restricted_logits = model.lm_head(hidden)
+
+    processor = AudioTokenLogitsProcessor()
+    expected = processor(None, full_logits)
+    actual = processor(None, restricted_logits)
+    assert torch.allclose(expected, actual)
+    assert torch.isfinite(actual[:, END_OF_SPEECH]).all()
+    assert torch.isinf(actual[:, START_OF_SPEECH]).all()
+    assert torch.isinf(actual[:, END_OF_SPEECH + 1]).all()
+
+    # With the head restricted, masking the in-range control ids alone gives the same distribution.
+    in_place = AudioTokenLogitsProcessor(head_restricted=True)(None, model.lm_head(hidden))
+    assert torch.equal(in_place, expected)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+import httpx
+import pytest
+
+from app.domain.errors import ModelUnavailableError, RemoteWorkerUnavailableError
+from app.infrastructure.adapters.remote.indic_parler import RemoteIndicParlerAdapter
+from app.infrastructure.adapters.remote.worker_pool import RemoteWorkerPool
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.framing import encode_frame
+
+_RESULT = {"model_id": "ai4bharat/indic-parler-tts", "success": True, "audio_format": "wav"}
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(
+        backend_role="orchestrator",
+        remote_self_hosted_url="https://w1.example",
+        remote_self_hosted_urls="https://w2.example/, https://w1.example",
+        remote_worker_health_interval_seconds=0,
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_go_to_the_worker_with_fewest_outstanding() -> None:
+    release = asyncio.Event()
+    hosts: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if len(hosts) == 1:
+            await release.wait()
+        return httpx.Response(200, content=encode_frame(_RESULT, request.url.host.encode()))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter = RemoteIndicParlerAdapter(settings=_settings(), http_client=client)
+    assert [worker.url for worker in adapter.worker_pool.workers] == ["https://w1.example", "https://w2.example"]
+
+    slow = asyncio.ensure_future(adapter.synthesize(text="one", config={}, prefer_streaming=False))
+    await asyncio.sleep(0.01)
+    fast = await adapter.synthesize(text="two", config={}, prefer_streaming=False)
+    release.set()
+    assert (await slow).audio_bytes == b"w1.example"
+    assert fast.audio_bytes == b"w2.example"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_worker_is_retried_elsewhere_ejected_and_readmitted_by_health_check() -> None:
+    down = {"w1.example"}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host in down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/capacity":
+            return httpx.Response(404, json={"detail": "Not Found"})
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        return httpx.Response(200, content=encode_frame(_RESULT, b"audio"))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pool = RemoteWorkerPool(_settings(remote_worker_max_failures=1), client)
+    adapter = RemoteIndicParlerAdapter(settings=_settings(), http_client=client, worker_pool=pool)
+
+    result = await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    assert result.audio_bytes == b"audio"
+    w1, w2 = pool.workers
+    assert w1.failures == 1 and w2.requests == 1
+    assert pool.pick() is w2
+
+    await pool.check_health()
+    assert w1.healthy is False
+    down.clear()
+    await pool.check_health()
+    assert w1.healthy is True and w1.ejected_until == 0.0
+    assert pool.metrics()["workers"][0]["available"] is True
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_gateway_timeout_is_not_retried_on_another_worker() -> None:
+    hosts: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(504, json={"detail": "gateway timeout"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter = RemoteIndicParlerAdapter(settings=_settings(), http_client=client)
+
+    with pytest.raises(ModelUnavailableError) as exc_info:
+        await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    assert not isinstance(exc_info.value, RemoteWorkerUnavailableError)
+    assert len(hosts) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_repeated_server_errors_eject_the_worker_without_retrying() -> None:
+    hosts: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(500, json={"detail": "boom"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    settings = Settings(
+        backend_role="orchestrator",
+        remote_self_hosted_url="https://w1.example",
+        remote_worker_health_interval_seconds=0,
+        remote_worker_max_failures=2,
+    )
+    adapter = RemoteIndicParlerAdapter(settings=settings, http_client=client)
+    (worker,) = adapter.worker_pool.workers
+
+    for _ in range(2):
+        with pytest.raises(ModelUnavailableError):
+            await adapter.synthesize(text="hi", config={}, prefer_streaming=False)
+    assert hosts == ["w1.example", "w1.example"]
+    assert worker.failures == 2 and not worker.available(monotonic())
+    await client.aclose()
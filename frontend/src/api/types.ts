@@ -47,6 +47,13 @@ export interface SynthesisResult {
   success: boolean
   audio_base64?: string | null
   audio_url?: string | null
+  audio_format?: 'wav' | 'mp3' | 'ogg' | 'flac' | null
+  audio_url_format?: 'wav' | 'mp3' | 'ogg' | 'flac' | null
+  audio_duration_ms?: number | null
+  audio_bytes?: number | null
+  rtf?: number | null
+  queue_position?: number | null
+  queue_wait_ms?: number | null
   latency_ms: number
   streaming_used: boolean
   error?: string | null
@@ -2,6 +2,13 @@ import type { ModelCatalogItem } from '../api/types'
 import type { ModelRunState } from '../state/usePlaygroundStore'
 import { getModelParts } from '../utils/modelDisplay'
 
+const AUDIO_MEDIA_TYPES = {
+  wav: 'audio/wav',
+  mp3: 'audio/mpeg',
+  ogg: 'audio/ogg',
+  flac: 'audio/flac',
+} as const
+
 interface StatusCardProps {
   model: ModelCatalogItem
   state: ModelRunState
@@ -15,7 +22,8 @@ function toAudioSrc(state: ModelRunState): string | undefined {
     return state.result.audio_url
   }
   if (state.result.audio_base64) {
-    return `data:audio/wav;base64,${state.result.audio_base64}`
+    const mediaType = AUDIO_MEDIA_TYPES[state.result.audio_format ?? 'wav']
+    return `data:${mediaType};base64,${state.result.audio_base64}`
   }
   return undefined
 }
@@ -35,6 +43,9 @@ export function StatusCard({ model, state }: StatusCardProps) {
       </header>
       <p className="card-meta">
         Latency: {state.result?.latency_ms ?? 0}ms · Streaming: {state.result?.streaming_used ? 'yes' : 'no'}
+        {state.result?.audio_duration_ms ? ` · Audio: ${(state.result.audio_duration_ms / 1000).toFixed(1)}s` : ''}
+        {state.result?.rtf != null ? ` · RTF: ${state.result.rtf.toFixed(2)}` : ''}
+        {state.result?.queue_wait_ms ? ` · Queued: ${state.result.queue_wait_ms}ms` : ''}
       </p>
       {audioSrc ? <audio controls src={audioSrc} /> : null}
       {state.result?.error ? <p className="error-text">{state.result.error}</p> : null}